@@ -2,4 +2,8 @@ set -o errexit
 
 pip install -r requirements.txt
 python manage.py collectstatic --noinput
+# Prebuilt OpenAPI schema, served by api/schema/ (see OPENAPI_SCHEMA_DIR)
+mkdir -p staticfiles/schema
+python manage.py spectacular --file staticfiles/schema/openapi.yaml
+python manage.py spectacular --format openapi-json --file staticfiles/schema/openapi.json
 python manage.py migrate
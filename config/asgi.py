@@ -3,6 +3,14 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Under ASGI the read-heavy endpoints are served by the async views in
+core/async_views.py (ASYNC_VIEWS=1). Static files are answered here, before
+Django, because WhiteNoise's middleware is sync-only and would put every
+request through a thread (STATIC_FILES_IN_ASGI=1 leaves it out of
+MIDDLEWARE). Run with e.g.:
+
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
@@ -12,5 +20,27 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ.setdefault('ASYNC_VIEWS', '1')
+os.environ.setdefault('STATIC_FILES_IN_ASGI', '1')
+
+django_application = get_asgi_application()
+
+from asgiref.wsgi import WsgiToAsgi  # noqa: E402
+from django.conf import settings  # noqa: E402
+from whitenoise import WhiteNoise  # noqa: E402
+
+
+def not_found(environ, start_response):
+    start_response("404 Not Found", [("Content-Type", "text/plain")])
+    return [b"Not Found"]
+
+
+# Only static requests pay for the WSGI adapter's thread; API requests stay on the event loop.
+static_application = WsgiToAsgi(WhiteNoise(not_found, root=settings.STATIC_ROOT, prefix=settings.STATIC_URL))
+STATIC_PREFIX = "/" + settings.STATIC_URL.strip("/") + "/"
+
 
-application = get_asgi_application()
+async def application(scope, receive, send):
+    if scope["type"] == "http" and scope["path"].startswith(STATIC_PREFIX):
+        return await static_application(scope, receive, send)
+    return await django_application(scope, receive, send)
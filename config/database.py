@@ -0,0 +1,85 @@
+"""DATABASES setting built from the environment (SQLite, DATABASE_URL or DB_* variables)."""
+
+import os
+
+import dj_database_url
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name, "")
+    return int(value) if value.strip() else default
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default) == "1"
+
+
+def sqlite_pragmas() -> list[str]:
+    return [
+        "PRAGMA journal_mode=WAL",
+        f"PRAGMA synchronous={os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')}",
+        f"PRAGMA mmap_size={_env_int('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)}",
+        f"PRAGMA cache_size={_env_int('SQLITE_CACHE_SIZE', -20000)}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+
+def sqlite_config(base_dir) -> dict:
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": base_dir / "db.sqlite3",
+        "OPTIONS": {
+            # Seconds a writer waits on a locked database before failing.
+            "timeout": _env_int("SQLITE_BUSY_TIMEOUT", 20),
+            # Take the write lock up front so concurrent writers queue on the
+            # busy timeout instead of failing on lock upgrade.
+            "transaction_mode": "IMMEDIATE",
+            "init_command": "; ".join(sqlite_pragmas()),
+        },
+    }
+
+
+def pool_options() -> dict:
+    return {
+        "min_size": _env_int("DB_POOL_MIN_SIZE", 2),
+        "max_size": _env_int("DB_POOL_MAX_SIZE", 10),
+        "timeout": _env_int("DB_POOL_TIMEOUT", 10),
+    }
+
+
+def tune_postgres(config: dict, pool: bool | None = None) -> dict:
+    """Apply pooling (or persistent connections) to a PostgreSQL config."""
+    if pool is None:
+        pool = _env_flag("DB_POOL", "1")
+
+    config = {**config, "OPTIONS": dict(config.get("OPTIONS") or {})}
+    if pool:
+        config["CONN_MAX_AGE"] = 0
+        config["OPTIONS"]["pool"] = pool_options()
+    else:
+        config["CONN_MAX_AGE"] = _env_int("DB_CONN_MAX_AGE", 600)
+        config["OPTIONS"].pop("pool", None)
+    config["CONN_HEALTH_CHECKS"] = True
+    return config
+
+
+def postgres_config() -> dict:
+    url = os.getenv("DATABASE_URL")
+    if url:
+        config = dj_database_url.parse(url, ssl_require=_env_flag("DB_SSL_REQUIRE", "1"))
+    else:
+        config = {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv("DB_NAME", "volunteers_db"),
+            "USER": os.getenv("DB_USER", "postgres"),
+            "PASSWORD": os.getenv("DB_PASSWORD", "postgres"),
+            "HOST": os.getenv("DB_HOST", "localhost"),
+            "PORT": os.getenv("DB_PORT", "5432"),
+        }
+    return tune_postgres(config)
+
+
+def database_config(base_dir) -> dict:
+    if _env_flag("USE_SQLITE", "0"):
+        return {"default": sqlite_config(base_dir)}
+    return {"default": postgres_config()}
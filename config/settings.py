@@ -13,9 +13,11 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 import os
-import dj_database_url
+import tempfile
 from dotenv import load_dotenv
 
+from config.database import database_config
+
 load_dotenv()
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -58,7 +60,9 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.security.SecurityMiddleware',
-    "whitenoise.middleware.WhiteNoiseMiddleware", 
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.middleware.ProfilingMiddleware",
+    "core.middleware.CompressionMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -67,6 +71,12 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# WhiteNoise is sync-only: under ASGI Django would adapt the whole middleware chain, and so
+# every request, through a thread. config/asgi.py serves static files in front of Django instead.
+STATIC_FILES_IN_ASGI = os.getenv("STATIC_FILES_IN_ASGI", "0") == "1"
+if STATIC_FILES_IN_ASGI:
+    MIDDLEWARE.remove("whitenoise.middleware.WhiteNoiseMiddleware")
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -86,33 +96,41 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
-USE_SQLITE = os.getenv("USE_SQLITE", "0") == "1"
+# Serve the read-heavy endpoints through core/async_views.py (set by config/asgi.py)
+ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", "0") == "1"
+# Async reads in progress per worker; further requests wait their turn (first come, first served)
+# instead of all sharing the database thread and finishing late together.
+ASYNC_MAX_CONCURRENT_READS = int(os.getenv("ASYNC_MAX_CONCURRENT_READS", "32"))
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-if DATABASE_URL:
-    DATABASES = {"default": dj_database_url.config(default=DATABASE_URL, conn_max_age=600, ssl_require=True)}
+# Database
+# https://docs.djangoproject.com/en/6.0/ref/settings/#databases
+# See config/database.py for the environment variables that tune pooling and SQLite.
 
-if USE_SQLITE:
-    DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.sqlite3",
-            "NAME": BASE_DIR / "db.sqlite3",
-        }
-    }
+DATABASES = database_config(BASE_DIR)
+
+
+# Cache
+# A shared backend (REDIS_URL) is needed for cache invalidation to reach every worker;
+# the per-process fallback relies on the timeouts below to bound staleness.
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": REDIS_URL}}
 else:
-    DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.postgresql",
-            "NAME": os.getenv("DB_NAME", "volunteers_db"),
-            "USER": os.getenv("DB_USER", "postgres"),
-            "PASSWORD": os.getenv("DB_PASSWORD", "postgres"),
-            "HOST": os.getenv("DB_HOST", "localhost"),
-            "PORT": os.getenv("DB_PORT", "5432"),
-        }
-    }
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
-# Database
-# https://docs.djangoproject.com/en/6.0/ref/settings/#databases
+ORG_DASHBOARD_CACHE_SECONDS = int(os.getenv("ORG_DASHBOARD_CACHE_SECONDS", "300"))
+
+# Change feeds (core/sync.py): how long changes settle before being served, and tombstone retention
+SYNC_SETTLE_SECONDS = int(os.getenv("SYNC_SETTLE_SECONDS", "2"))
+SYNC_TOMBSTONE_DAYS = int(os.getenv("SYNC_TOMBSTONE_DAYS", "90"))
+
+# Opt-in staff request profiling (core/profiling.py): ring buffer location and size
+PROFILING_DIR = Path(os.getenv("PROFILING_DIR", Path(tempfile.gettempdir()) / "volunteers-profiles"))
+PROFILING_BUFFER_SIZE = int(os.getenv("PROFILING_BUFFER_SIZE", "50"))
+PROFILING_TOP = int(os.getenv("PROFILING_TOP", "40"))
+
+# Full rebuild interval of the in-process autocomplete indexes (core/autocomplete.py)
+AUTOCOMPLETE_REFRESH_SECONDS = int(os.getenv("AUTOCOMPLETE_REFRESH_SECONDS", "300"))
 
 
 # Password validation
@@ -172,8 +190,52 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Reverse proxies in front of the app; throttles key anonymous clients on the
+    # X-Forwarded-For entry they added, or on REMOTE_ADDR when 0 (client-set headers are ignored).
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "0")),
 }
 
+# orjson-backed renderer/parser (core/renderers.py); output matches the stdlib renderer.
+if os.getenv("FAST_JSON", "0") == "1":
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+        "core.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    )
+
+# Longest opportunity, in days: each day is a row in every calendar counter it touches (core/calendar_index.py).
+OPPORTUNITY_MAX_DAYS = int(os.getenv("OPPORTUNITY_MAX_DAYS", "366"))
+
+# Response compression (core.middleware.CompressionMiddleware)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+# Batch endpoint (core/batch.py)
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "4"))
+
+# Token-bucket throttles (core/throttling.py): "N/period" per user (or IP when anonymous);
+# THROTTLE_BACKEND=cache shares buckets across workers through CACHES["default"].
+THROTTLE_BACKEND = os.getenv("THROTTLE_BACKEND", "memory")
+THROTTLE_RATES = {
+    "search_radius": os.getenv("THROTTLE_SEARCH_RADIUS", "60/min"),
+    "register": os.getenv("THROTTLE_REGISTER", "20/hour"),
+    "auth_token": os.getenv("THROTTLE_AUTH_TOKEN", "30/min"),
+}
+
+# Bulk import (core/bulk_import.py): rows per validate/insert chunk, password hashing
+# processes, and the most rows one import/ request may send (the command has no limit).
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "500"))
+IMPORT_HASH_WORKERS = int(os.getenv("IMPORT_HASH_WORKERS", str(os.cpu_count() or 1)))
+# Each volunteer row costs a password hash (~0.5s of CPU) and possibly a geocode (~1s, sequential),
+# so the HTTP path stays small; larger files go through `manage.py bulk_import`.
+IMPORT_MAX_ROWS = int(os.getenv("IMPORT_MAX_ROWS", "20"))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
@@ -197,3 +259,8 @@ SPECTACULAR_SETTINGS = {
         }
     },
 }
+
+# Schema files written by build.sh (openapi.yaml / openapi.json); api/schema/ serves
+# them instead of introspecting the serializers, when present.
+OPENAPI_SCHEMA_DIR = Path(os.getenv("OPENAPI_SCHEMA_DIR", STATIC_ROOT / "schema"))
+OPENAPI_SCHEMA_CACHE_SECONDS = int(os.getenv("OPENAPI_SCHEMA_CACHE_SECONDS", "3600"))
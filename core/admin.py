@@ -1,14 +1,153 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
 from .models import (
     User, VolunteerProfile, OrganizationProfile,
     Opportunity, Application, Notification, HourLog, Feedback
 )
 
-admin.site.register(User)
-admin.site.register(VolunteerProfile)
-admin.site.register(OrganizationProfile)
-admin.site.register(Opportunity)
-admin.site.register(Application)
-admin.site.register(Notification)
-admin.site.register(HourLog)
-admin.site.register(Feedback)
\ No newline at end of file
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for very large tables: an unfiltered changelist on PostgreSQL
+    uses the planner's row estimate (pg_class.reltuples) instead of COUNT(*).
+    Filtered or searched lists, small tables and other databases count exactly.
+    """
+    threshold = 100_000
+
+    @cached_property
+    def count(self):
+        estimate = self.estimate()
+        if estimate is not None and estimate >= self.threshold:
+            return estimate
+        return super().count
+
+    def estimate(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet) or queryset.query.where:
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+        # reltuples is -1 (or 0) until the table has been vacuumed/analyzed
+        return row[0] if row and row[0] > 0 else None
+
+
+class ChangedFieldsAdmin(admin.ModelAdmin):
+    """
+    Edits save only the fields changed in the form (plus `always_save`), so
+    counters kept up to date by conditional UPDATEs are not written back with
+    the values loaded when the form was opened.
+    """
+    always_save = ()
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            return super().save_model(request, obj, form, change)
+        obj.save(update_fields=[*form.changed_data, *self.always_save])
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist settings for tables too big for COUNT(*) and per-row lookups.
+    Subclasses stick to indexed search lookups and to filters that need no
+    SELECT DISTINCT over the table (choices, booleans, date ranges).
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+
+@admin.register(User)
+class UserAdmin(BaseUserAdmin):
+    list_display = ("username", "email", "role", "is_staff", "is_active")
+    list_filter = ("role", "is_staff", "is_active")
+    fieldsets = BaseUserAdmin.fieldsets + (("Role", {"fields": ("role",)}),)
+
+
+@admin.register(VolunteerProfile)
+class VolunteerProfileAdmin(admin.ModelAdmin):
+    list_display = ("id", "username", "location_text")
+    list_select_related = ("user",)
+    search_fields = ("user__username__exact", "user__email__exact")
+    raw_id_fields = ("user",)
+
+    @admin.display(ordering="user__username")
+    def username(self, obj):
+        return obj.user.username
+
+
+@admin.register(OrganizationProfile)
+class OrganizationProfileAdmin(ChangedFieldsAdmin):
+    list_display = ("id", "name", "location_text", "rating_count", "rating_average")
+    search_fields = ("name", "user__username__exact")
+    raw_id_fields = ("user",)
+    readonly_fields = ("rating_count", "rating_sum", "rating_average") + tuple(f"rating_{i}" for i in range(1, 6))
+
+
+@admin.register(Opportunity)
+class OpportunityAdmin(ChangedFieldsAdmin):
+    list_display = ("id", "title", "organization", "start_date", "end_date", "capacity", "accepted_count")
+    list_select_related = ("organization",)
+    list_filter = ("start_date", "archived_at")
+    search_fields = ("=id", "title")
+    autocomplete_fields = ("organization",)
+    readonly_fields = ("accepted_count", "archived_at")
+    always_save = ("updated_at",)
+
+
+@admin.register(Application)
+class ApplicationAdmin(LargeTableAdmin):
+    list_display = ("id", "volunteer_username", "opportunity_title", "status", "applied_at")
+    list_select_related = ("volunteer__user", "opportunity")
+    list_filter = ("status", "applied_at")
+    search_fields = ("=id", "volunteer__user__username__exact", "=opportunity__id")
+    raw_id_fields = ("volunteer",)
+    autocomplete_fields = ("opportunity",)
+
+    @admin.display(description="volunteer", ordering="volunteer__user__username")
+    def volunteer_username(self, obj):
+        return obj.volunteer.user.username
+
+    @admin.display(description="opportunity", ordering="opportunity__title")
+    def opportunity_title(self, obj):
+        return obj.opportunity.title
+
+
+@admin.register(Notification)
+class NotificationAdmin(LargeTableAdmin):
+    list_display = ("id", "user", "type", "title", "is_read", "created_at")
+    list_select_related = ("user",)
+    list_filter = ("is_read", "created_at")
+    search_fields = ("=id", "user__username__exact")
+    raw_id_fields = ("user",)
+
+
+@admin.register(HourLog)
+class HourLogAdmin(LargeTableAdmin):
+    list_display = ("id", "application_id", "volunteer_username", "work_date", "hours")
+    list_select_related = ("application__volunteer__user",)
+    search_fields = ("=id", "=application__id", "application__volunteer__user__username__exact")
+    list_filter = ("work_date",)
+    raw_id_fields = ("application",)
+
+    @admin.display(description="volunteer", ordering="application__volunteer__user__username")
+    def volunteer_username(self, obj):
+        return obj.application.volunteer.user.username
+
+
+@admin.register(Feedback)
+class FeedbackAdmin(LargeTableAdmin):
+    list_display = ("id", "organization", "rating", "created_at")
+    list_select_related = ("organization",)
+    list_filter = ("created_at",)
+    search_fields = ("=id", "=application__id")
+    raw_id_fields = ("application",)
+    autocomplete_fields = ("organization",)
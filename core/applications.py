@@ -0,0 +1,122 @@
+"""Race-free application submission and status changes."""
+
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from . import dashboard
+from .models import Application, Notification, Opportunity
+
+INSERT_COLUMNS = ("opportunity_id", "volunteer_id", "status", "applied_at", "updated_at")
+
+
+def insert_ignore_conflict(values: dict) -> int | None:
+    """Insert an Application row; returns its id, or None if the volunteer already applied."""
+    meta = Application._meta
+    qn = connection.ops.quote_name
+    params = [meta.get_field(column.removesuffix("_id")).get_db_prep_save(values[column], connection) for column in INSERT_COLUMNS]
+    sql = (
+        f"INSERT INTO {qn(meta.db_table)} ({', '.join(qn(c) for c in INSERT_COLUMNS)}) "
+        f"VALUES ({', '.join(['%s'] * len(INSERT_COLUMNS))}) "
+        f"ON CONFLICT ({qn('opportunity_id')}, {qn('volunteer_id')}) DO NOTHING "
+        f"RETURNING {qn(meta.pk.column)}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def reserve_slot(opportunity_id) -> bool:
+    """Take one slot; False if the opportunity is full."""
+    return Opportunity.objects.filter(
+        Q(capacity__isnull=True) | Q(accepted_count__lt=F("capacity")), pk=opportunity_id
+    ).update(accepted_count=F("accepted_count") + 1, updated_at=timezone.now()) == 1
+
+
+def release_slot(opportunity_id) -> None:
+    Opportunity.objects.filter(pk=opportunity_id, accepted_count__gt=0).update(
+        accepted_count=F("accepted_count") - 1, updated_at=timezone.now()
+    )
+
+
+def is_full(opportunity) -> bool:
+    return opportunity.capacity is not None and opportunity.accepted_count >= opportunity.capacity
+
+
+def set_status(application, status: str) -> str:
+    """
+    Move `application` to `status`, taking or releasing its slot. Accepting
+    when no slot remains waitlists it instead. Returns the status stored.
+    """
+    with transaction.atomic():
+        # Row lock: concurrent updates of the same application must not both take a slot.
+        current = Application.objects.select_for_update().filter(pk=application.pk).values_list("status", flat=True).get()
+        if status == Application.Status.ACCEPTED and current != status:
+            if not reserve_slot(application.opportunity_id):
+                status = Application.Status.WAITLISTED
+        elif current == Application.Status.ACCEPTED and status != current:
+            release_slot(application.opportunity_id)
+        application.status = status
+        application.save(update_fields=["status", "updated_at"])
+    return status
+
+
+def rebuild_accepted_counts(batch_size: int = 1000) -> int:
+    """Recompute every opportunity's accepted_count from its applications. Returns the number updated."""
+    accepted = dict(
+        Application.objects.filter(status=Application.Status.ACCEPTED)
+        .values("opportunity").annotate(n=Count("id")).values_list("opportunity", "n")
+    )
+    updated = 0
+    with transaction.atomic():
+        batch = []
+        for opp in Opportunity.objects.only("pk").iterator(chunk_size=batch_size):
+            opp.accepted_count = accepted.get(opp.pk, 0)
+            batch.append(opp)
+            if len(batch) >= batch_size:
+                Opportunity.objects.bulk_update(batch, ["accepted_count"])
+                updated += len(batch)
+                batch = []
+        if batch:
+            Opportunity.objects.bulk_update(batch, ["accepted_count"])
+            updated += len(batch)
+    return updated
+
+
+def apply(volunteer, opportunity) -> tuple[Application, bool]:
+    """
+    Apply `volunteer` to `opportunity` (loaded with its organization); returns
+    (application, created). Safe to call concurrently for the same pair.
+    Applications to a full opportunity start out waitlisted.
+    """
+    now = timezone.now()
+    values = {
+        "opportunity_id": opportunity.pk, "volunteer_id": volunteer.pk,
+        "status": Application.Status.WAITLISTED if is_full(opportunity) else Application.Status.PENDING,
+        "applied_at": now, "updated_at": now,
+    }
+    with transaction.atomic():
+        pk = insert_ignore_conflict(values)
+        if pk is not None:
+            Notification.objects.create(
+                user_id=opportunity.organization.user_id,
+                type="APPLICATION_CREATED",
+                title="New volunteer application",
+                message=f"{volunteer.user.username} applied to '{opportunity.title}'.",
+            )
+
+    if pk is None:
+        app = Application.objects.get(opportunity=opportunity, volunteer=volunteer)
+        app.opportunity = opportunity
+        return app, False
+
+    # A raw insert sends no post_save; do what core.signals would.
+    transaction.on_commit(partial(dashboard.invalidate, opportunity.organization_id))
+    app = Application(
+        pk=pk, opportunity=opportunity, volunteer=volunteer,
+        status=values["status"], applied_at=now, updated_at=now,
+    )
+    return app, True
@@ -0,0 +1,33 @@
+"""Retiring opportunities that ended long ago."""
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Opportunity, Tombstone
+
+
+def expired(days: int):
+    """Unarchived opportunities that ended more than `days` days ago."""
+    cutoff = timezone.localdate() - timedelta(days=days)
+    return Opportunity.objects.filter(archived_at__isnull=True, end_date__lt=cutoff)
+
+
+def archive_batch(days: int, batch_size: int) -> int:
+    """Archive up to `batch_size` expired opportunities in one short transaction; returns how many."""
+    with transaction.atomic():
+        # Concurrent runs take disjoint batches: rows another run has locked are skipped.
+        ids = list(
+            expired(days).select_for_update(skip_locked=True).order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+        now = timezone.now()
+        # Re-check the condition where rows are not locked (SQLite): a concurrent run may have archived some already.
+        Opportunity.objects.filter(pk__in=ids, archived_at__isnull=True).update(archived_at=now, updated_at=now)
+        archived = list(Opportunity.objects.filter(pk__in=ids, archived_at=now).values_list("pk", flat=True))
+        Tombstone.objects.bulk_create(
+            [Tombstone(model="opportunity", object_id=pk, deleted_at=now) for pk in archived]
+        )
+    return len(archived)
@@ -0,0 +1,161 @@
+"""Async versions of the read-heavy endpoints, served when ASYNC_VIEWS=1."""
+
+import asyncio
+import weakref
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .models import User
+from .views import (
+    OpportunityCreateListView, OpportunityRetrieveUpdateDeleteView, OpportunitySearchView,
+    MyApplicationsView, MyNotificationsView, MyHoursView,
+)
+
+_jwt = JWTAuthentication()
+_read_slots = weakref.WeakKeyDictionary()  # event loop -> Semaphore
+
+
+def read_slot() -> asyncio.Semaphore:
+    """Admission limit for async reads on the running event loop (ASYNC_MAX_CONCURRENT_READS)."""
+    loop = asyncio.get_running_loop()
+    slots = _read_slots.get(loop)
+    if slots is None:
+        slots = _read_slots[loop] = asyncio.Semaphore(settings.ASYNC_MAX_CONCURRENT_READS)
+    return slots
+
+
+async def authenticate(request):
+    """Async equivalent of JWTAuthentication.authenticate; returns (user, token) or None."""
+    header = _jwt.get_header(request)
+    raw_token = _jwt.get_raw_token(header) if header is not None else None
+    if raw_token is None:
+        return None
+    token = _jwt.get_validated_token(raw_token)
+    try:
+        user = await User.objects.select_related("volunteer_profile", "org_profile").aget(
+            **{jwt_settings.USER_ID_FIELD: token[jwt_settings.USER_ID_CLAIM]}
+        )
+    except (KeyError, User.DoesNotExist):
+        raise exceptions.AuthenticationFailed("User not found", code="user_not_found")
+    if not user.is_active:
+        raise exceptions.AuthenticationFailed("User is inactive", code="user_inactive")
+    return user, token
+
+
+def render(data, renderer=None, status_code=status.HTTP_200_OK, headers=None) -> HttpResponse:
+    renderer = renderer or api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    response = HttpResponse(renderer.render(data), status=status_code, content_type=renderer.media_type)
+    for key, value in (headers or {}).items():
+        response[key] = value
+    return response
+
+
+class AsyncReadView(View):
+    """
+    GETs that negotiate a JSON renderer are served asynchronously; any other
+    renderer (the browsable API) and every write go to `sync_view` unchanged.
+    """
+    sync_view = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Same as DRF: token-authenticated API, no CSRF cookie involved.
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def get(self, request, *args, **kwargs):
+        drf_request = Request(request, authenticators=())
+        try:
+            view = self.make_view(drf_request, kwargs)
+            if drf_request.accepted_renderer.format != "json":
+                return await self.delegate(request, *args, **kwargs)
+            async with read_slot():
+                await self.authorize(view, request)
+                data = await self.read(view, kwargs)
+            return render(data, drf_request.accepted_renderer)
+        except exceptions.APIException as exc:
+            body = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+            headers = {}
+            if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                headers["WWW-Authenticate"] = _jwt.authenticate_header(request)
+            if getattr(exc, "wait", None):
+                headers["Retry-After"] = "%d" % exc.wait
+            return render(body, getattr(drf_request, "accepted_renderer", None), exc.status_code, headers)
+
+    async def delegate(self, request, *args, **kwargs):
+        return await sync_to_async(self.sync_view.as_view())(request, *args, **kwargs)
+
+    post = put = patch = delete = delegate
+
+    def make_view(self, drf_request, kwargs):
+        """An instance of `sync_view` with content negotiation and versioning done, as DRF's initial() does them."""
+        view = self.sync_view(request=drf_request, args=(), kwargs=kwargs, format_kwarg=None)
+        view.headers = {}
+        drf_request.accepted_renderer, drf_request.accepted_media_type = view.perform_content_negotiation(drf_request)
+        drf_request.version, drf_request.versioning_scheme = view.determine_version(drf_request, **kwargs)
+        return view
+
+    async def authorize(self, view, request):
+        """Authenticate the JWT with the async ORM, then run the view's permission and throttle checks."""
+        forced_user = getattr(request, "_force_auth_user", None)  # as honoured by rest_framework.request.Request
+        credentials = (forced_user, getattr(request, "_force_auth_token", None)) if forced_user else await authenticate(request)
+        if credentials is None:
+            raise exceptions.NotAuthenticated()
+        view.request.user, view.request.auth = credentials
+        view.check_permissions(view.request)
+        view.check_throttles(view.request)
+
+    async def read(self, view, kwargs):
+        """The response data."""
+        raise NotImplementedError
+
+
+class AsyncListView(AsyncReadView):
+    async def read(self, view, kwargs):
+        # Building the queryset may itself query (radius search, availability ranges).
+        queryset = await sync_to_async(lambda: view.filter_queryset(view.get_queryset()))()
+        return await view.fast_serializer.aserialize(queryset, view.get_requested_fields())
+
+
+class AsyncDetailView(AsyncReadView):
+    async def read(self, view, kwargs):
+        queryset = view.filter_queryset(view.get_queryset())
+        try:
+            obj = await queryset.aget(pk=kwargs["pk"])
+        except ObjectDoesNotExist:
+            raise exceptions.NotFound(f"No {queryset.model._meta.object_name} matches the given query.")
+        view.check_object_permissions(view.request, obj)
+        return view.get_serializer(obj).data
+
+
+class AsyncOpportunityListView(AsyncListView):
+    sync_view = OpportunityCreateListView
+
+
+class AsyncOpportunityDetailView(AsyncDetailView):
+    sync_view = OpportunityRetrieveUpdateDeleteView
+
+
+class AsyncOpportunitySearchView(AsyncListView):
+    sync_view = OpportunitySearchView
+
+
+class AsyncMyApplicationsView(AsyncListView):
+    sync_view = MyApplicationsView
+
+
+class AsyncMyNotificationsView(AsyncListView):
+    sync_view = MyNotificationsView
+
+
+class AsyncMyHoursView(AsyncListView):
+    sync_view = MyHoursView
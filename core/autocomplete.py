@@ -0,0 +1,169 @@
+"""In-memory prefix indexes behind autocomplete/skills/ and autocomplete/locations/."""
+
+import heapq
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+
+from django.conf import settings
+
+MAX_LENGTH = 100
+MAX_RESULTS = 50
+MAX_CACHED_PREFIXES = 10_000
+_WORD_START = re.compile(r"(?:^|(?<=[\s,/(-]))\w", re.UNICODE)
+
+
+def normalize(value) -> str:
+    return " ".join(str(value).lower().split())[:MAX_LENGTH]
+
+
+def _top(entries, counts, prefix: str) -> list:
+    """The MAX_RESULTS most used keys with a suffix starting with `prefix`."""
+    lo = bisect_left(entries, (prefix,))
+    hi = bisect_left(entries, (prefix + "\uffff",), lo)
+    keys = {key for _, key in entries[lo:hi]}
+    return heapq.nsmallest(MAX_RESULTS, keys, key=lambda k: (-counts[k], k))
+
+
+class PrefixIndex:
+    def __init__(self):
+        self._entries = []      # sorted (suffix, key)
+        self._counts = {}       # key -> number of records using the value
+        self._display = {}      # key -> value as first seen
+        self._ranked = {}       # prefix -> top MAX_RESULTS keys
+        self._lock = threading.Lock()
+        self.built_at = None
+
+    @staticmethod
+    def _suffixes(key):
+        return {key[m.start():] for m in _WORD_START.finditer(key)} or {key}
+
+    def load(self, counts: Counter, display: dict) -> None:
+        """Replace the contents; everything is built before the lock is taken, so readers only wait for the swap."""
+        entries = sorted((suffix, key) for key in counts for suffix in self._suffixes(key))
+        counts = dict(counts)
+        ranked = {letter: _top(entries, counts, letter) for letter in {suffix[0] for suffix, _ in entries}}
+        with self._lock:
+            self._entries, self._counts, self._display, self._ranked = entries, counts, display, ranked
+            self.built_at = time.monotonic()
+
+    def add(self, value, delta: int = 1) -> None:
+        key = normalize(value)
+        if not key or not delta:
+            return
+        with self._lock:
+            count = self._counts.get(key, 0) + delta
+            if count > 0:
+                if key not in self._counts:
+                    self._display[key] = str(value).strip()
+                    for suffix in self._suffixes(key):
+                        insort(self._entries, (suffix, key))
+                self._counts[key] = count
+            elif key in self._counts:
+                del self._counts[key], self._display[key]
+                for suffix in self._suffixes(key):
+                    i = bisect_left(self._entries, (suffix, key))
+                    if i < len(self._entries) and self._entries[i] == (suffix, key):
+                        del self._entries[i]
+            else:
+                return
+            for suffix in self._suffixes(key):
+                for end in range(1, len(suffix) + 1):
+                    self._ranked.pop(suffix[:end], None)
+                self._rank(suffix[0])  # keep the widest prefixes warm; the writer pays for them
+
+    def _rank(self, prefix: str) -> list:
+        ranked = self._ranked.get(prefix)
+        if ranked is None:
+            ranked = _top(self._entries, self._counts, prefix)
+            if len(self._ranked) >= MAX_CACHED_PREFIXES:
+                self._ranked = {}
+            self._ranked[prefix] = ranked
+        return ranked
+
+    def search(self, prefix: str, limit: int = 10) -> list[dict]:
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        with self._lock:
+            return [{"value": self._display[k], "count": self._counts[k]} for k in self._rank(prefix)[:limit]]
+
+
+skills = PrefixIndex()
+locations = PrefixIndex()
+_build_lock = threading.Lock()
+
+
+def _collect(pairs) -> tuple[Counter, dict]:
+    counts, display = Counter(), {}
+    for value in pairs:
+        key = normalize(value)
+        if key:
+            counts[key] += 1
+            display.setdefault(key, str(value).strip())
+    return counts, display
+
+
+def rebuild() -> None:
+    from .models import Opportunity, OrganizationProfile, VolunteerProfile
+
+    skill_values, location_values = [], []
+    for required_skills, location_text in Opportunity.objects.values_list("required_skills", "location_text").iterator():
+        skill_values += required_skills or []
+        location_values.append(location_text)
+    for profile_skills, location_text in VolunteerProfile.objects.values_list("skills", "location_text").iterator():
+        skill_values += profile_skills or []
+        location_values.append(location_text)
+    location_values += OrganizationProfile.objects.values_list("location_text", flat=True).iterator()
+
+    skills.load(*_collect(v for v in skill_values if isinstance(v, str)))
+    locations.load(*_collect(location_values))
+
+
+def _rebuild_in_background() -> None:
+    from django.db import connections
+
+    try:
+        rebuild()
+    finally:
+        connections.close_all()  # the thread's own connections
+        _build_lock.release()
+
+
+def ensure_fresh() -> None:
+    """
+    Build the indexes on first use, waiting only if there is nothing to serve
+    yet. Once they are older than AUTOCOMPLETE_REFRESH_SECONDS, one request
+    starts a rebuild in a background thread and every request, that one
+    included, keeps using the current indexes.
+    """
+    built_at = skills.built_at
+    if built_at is None:
+        with _build_lock:
+            if skills.built_at is None:
+                rebuild()
+        return
+    if time.monotonic() - built_at < settings.AUTOCOMPLETE_REFRESH_SECONDS:
+        return
+    if _build_lock.acquire(blocking=False):  # otherwise a rebuild is already running
+        if skills.built_at != built_at:
+            _build_lock.release()
+            return
+        threading.Thread(target=_rebuild_in_background, name="autocomplete-rebuild", daemon=True).start()
+
+
+def apply_change(old_skills, old_location, new_skills, new_location) -> None:
+    """Move one record's contribution from its old values to its new ones (no-op until the indexes are built)."""
+    if skills.built_at is None:
+        return
+    old = Counter(v for v in old_skills or [] if isinstance(v, str))
+    new = Counter(v for v in new_skills or [] if isinstance(v, str))
+    for value, n in (new - old).items():
+        skills.add(value, n)
+    for value, n in (old - new).items():
+        skills.add(value, -n)
+    if old_location != new_location:
+        locations.add(old_location or "", -1)
+        locations.add(new_location or "", +1)
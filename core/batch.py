@@ -0,0 +1,111 @@
+"""In-process execution of batched API calls (see BatchView)."""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/"
+# Request headers worth forwarding to sub-requests (content negotiation, locale).
+FORWARDED_META = ("HTTP_ACCEPT", "HTTP_ACCEPT_LANGUAGE", "HTTP_USER_AGENT", "REMOTE_ADDR", "SERVER_NAME", "SERVER_PORT")
+
+
+def build_subrequest(request, method: str, path: str, body=None) -> HttpRequest:
+    parts = urlsplit(path)
+    sub = HttpRequest()
+    sub.method = method
+    sub.path = sub.path_info = parts.path
+    sub.META = {key: request.META[key] for key in FORWARDED_META if key in request.META}
+    sub.META["REQUEST_METHOD"] = method
+    sub.META["PATH_INFO"] = parts.path
+    sub.META["QUERY_STRING"] = parts.query
+    sub.GET = QueryDict(parts.query)
+
+    payload = b"" if body is None else json.dumps(body).encode()
+    sub.META["CONTENT_TYPE"] = "application/json"
+    sub.META["CONTENT_LENGTH"] = str(len(payload))
+    sub._stream = BytesIO(payload)
+    sub._read_started = False
+
+    # Reuse the batch caller's authentication (see rest_framework.request.Request).
+    sub._force_auth_user = request.user
+    sub._force_auth_token = request.auth
+    return sub
+
+
+def execute_one(request, item: dict) -> dict:
+    method, path = item["method"], item["path"]
+    route, _, query = path.partition("?")
+    if route.startswith(API_PREFIX):
+        route = route[len(API_PREFIX):]
+    route = "/" + route.lstrip("/")
+    try:
+        match = resolve(route, urlconf="core.urls")
+    except Resolver404:
+        return {"status": status.HTTP_404_NOT_FOUND, "body": {"detail": "Not found."}}
+    if match.url_name == "batch":
+        return {"status": status.HTTP_400_BAD_REQUEST, "body": {"detail": "Batches cannot be nested."}}
+
+    sub = build_subrequest(request, method, f"{API_PREFIX}{route[1:]}?{query}", item.get("body"))
+    # Async routes (ASYNC_VIEWS) authenticate on their own; dispatch to their sync DRF view.
+    view = match.func
+    sync_view = getattr(getattr(view, "view_class", None), "sync_view", None)
+    if sync_view is not None:
+        view = sync_view.as_view()
+    try:
+        response = view(sub, *match.args, **match.kwargs)
+    except Exception:
+        logger.exception("Batched %s %s failed", method, path)
+        return {"status": status.HTTP_500_INTERNAL_SERVER_ERROR, "body": {"detail": "Internal server error."}}
+
+    if hasattr(response, "data"):
+        body = response.data
+    else:
+        content = getattr(response, "content", b"")
+        body = json.loads(content) if content and response.get("Content-Type", "").startswith("application/json") else None
+    return {"status": response.status_code, "body": body}
+
+
+def _execute_in_thread(request, item: dict) -> dict:
+    try:
+        return execute_one(request, item)
+    finally:
+        # Worker threads own their DB connections; don't leak them.
+        connections.close_all()
+
+
+def execute_batch(request, items: list, parallel: bool = False) -> list:
+    results = [None] * len(items)
+    max_workers = settings.BATCH_MAX_WORKERS
+
+    def flush(group):
+        if len(group) == 1 or not parallel:
+            for index in group:
+                results[index] = execute_one(request, items[index])
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(group))) as pool:
+            for index, result in zip(group, pool.map(lambda i: _execute_in_thread(request, items[i]), group)):
+                results[index] = result
+
+    group = []
+    for index, item in enumerate(items):
+        if item["method"] in SAFE_METHODS:
+            group.append(index)
+            continue
+        if group:
+            flush(group)
+            group = []
+        results[index] = execute_one(request, item)
+    if group:
+        flush(group)
+    return results
@@ -0,0 +1,246 @@
+"""Bulk import of volunteers and opportunities from CSV or JSON lines."""
+
+import codecs
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from . import autocomplete, calendar_index, dashboard
+from .models import (
+    AvailabilityRange, AvailabilitySlot, Opportunity, OpportunityCalendarDay, User, VolunteerProfile,
+)
+from .passwords import hash_passwords
+from .serializers import OpportunitySerializer, RegisterVolunteerSerializer
+from .services import geocode_location, parse_availability
+
+FORMATS = ("csv", "jsonl")
+# CSV cells holding lists (";"-separated) or JSON objects.
+LIST_COLUMNS = ("skills", "required_skills")
+JSON_COLUMNS = ("availability",)
+
+
+class InvalidRow(ValueError):
+    """A line that cannot be read as a record at all."""
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    rows: int = 0
+    errors: list = field(default_factory=list)  # [{"line": n, "errors": {...}}]
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return round(self.rows / self.seconds, 1) if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {"created": self.created, "rows": self.rows, "errors": self.errors, "rows_per_second": self.rows_per_second}
+
+
+# Parsing
+
+def _csv_record(row: dict) -> dict:
+    record = {}
+    for key, value in row.items():
+        if key is None:
+            raise InvalidRow("More cells than header columns.")
+        value = (value or "").strip()
+        if not value:
+            continue
+        if key in LIST_COLUMNS:
+            value = [part.strip() for part in value.split(";") if part.strip()]
+        elif key in JSON_COLUMNS:
+            try:
+                value = json.loads(value)
+            except ValueError:
+                raise InvalidRow(f"{key}: not valid JSON.")
+        record[key] = value
+    return record
+
+
+def read_rows(lines, fmt: str):
+    """
+    Yield (line number, record or InvalidRow) from an iterable of text lines.
+    CSV needs a header row; JSON lines may contain blank lines.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            try:
+                yield reader.line_num, _csv_record(row)
+            except InvalidRow as exc:
+                yield reader.line_num, exc
+    elif fmt == "jsonl":
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield number, InvalidRow("Not valid JSON.")
+                continue
+            yield number, record if isinstance(record, dict) else InvalidRow("Expected a JSON object.")
+    else:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {', '.join(FORMATS)}.")
+
+
+def decode_lines(chunks, encoding: str = "utf-8"):
+    """Text lines from an iterable of byte lines (a file or an HttpRequest), decoded incrementally."""
+    return codecs.iterdecode(chunks, encoding)
+
+
+# Shared steps
+
+class Geocoder:
+    """geocode_location with a per-import memo, so each distinct location is looked up once."""
+
+    def __init__(self):
+        self.known = {}
+
+    def resolve(self, texts) -> None:
+        for text in dict.fromkeys(texts):
+            if text and text not in self.known:
+                self.known[text] = geocode_location(text)
+
+    def coordinates(self, text) -> dict:
+        latitude, longitude = self.known.get(text, (None, None)) if text else (None, None)
+        return {"latitude": latitude, "longitude": longitude}
+
+
+def _validate(serializer_class, numbered, result):
+    """Validated data of the rows that pass, as [(line, data)]; failures go to result.errors."""
+    valid = []
+    for line, record in numbered:
+        if isinstance(record, InvalidRow):
+            result.errors.append({"line": line, "errors": {"non_field_errors": [str(record)]}})
+            continue
+        serializer = serializer_class(data=record)
+        if serializer.is_valid():
+            valid.append((line, serializer.validated_data))
+        else:
+            result.errors.append({"line": line, "errors": serializer.errors})
+    return valid
+
+
+def _run(rows, import_chunk, chunk_size: int | None, max_rows: int | None) -> ImportResult:
+    result = ImportResult()
+    chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+    started = time.perf_counter()
+    # One row past the limit is read so an oversized input is reported rather than cut silently.
+    rows = iter(rows) if max_rows is None else islice(rows, max_rows + 1)
+    while chunk := list(islice(rows, chunk_size)):
+        if max_rows is not None and result.rows + len(chunk) > max_rows:
+            chunk = chunk[:max_rows - result.rows]
+            result.errors.append({"line": None, "errors": {"non_field_errors": [f"Stopped after {max_rows} rows."]}})
+        result.rows += len(chunk)
+        import_chunk(chunk, result)
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _insert(valid, result, write) -> None:
+    """Run `write` (which bulk-creates the rows of `valid`) in one transaction; a conflict fails the chunk."""
+    if not valid:
+        return
+    try:
+        with transaction.atomic():
+            write()
+    except IntegrityError as exc:
+        # A concurrent writer took a username/email between the check and the insert.
+        result.errors += [{"line": line, "errors": {"non_field_errors": [f"Chunk rejected: {exc}"]}} for line, _ in valid]
+        return
+    result.created += len(valid)
+
+
+# Volunteers
+
+def _import_volunteers(geocoder, chunk, result) -> None:
+    valid = _validate(RegisterVolunteerSerializer, chunk, result)
+
+    # Uniqueness: within the chunk and against existing users, one query per column.
+    usernames = User.objects.filter(username__in=[d["username"] for _, d in valid]).values_list("username", flat=True)
+    emails = User.objects.filter(email__in=[d["email"] for _, d in valid]).values_list("email", flat=True)
+    taken = {"username": set(usernames), "email": set(emails)}
+    unique = []
+    for line, data in valid:
+        clashes = {column: ["Already taken."] for column in taken if data[column] in taken[column]}
+        if clashes:
+            result.errors.append({"line": line, "errors": clashes})
+            continue
+        for column in taken:
+            taken[column].add(data[column])
+        unique.append((line, data))
+
+    geocoder.resolve(data.get("location_text", "") for _, data in unique)
+    hashes = hash_passwords([data["password"] for _, data in unique])
+
+    def write():
+        users = User.objects.bulk_create([
+            User(username=data["username"], email=data["email"], password=password, role=User.Role.VOLUNTEER)
+            for (_, data), password in zip(unique, hashes)
+        ])
+        profiles = VolunteerProfile.objects.bulk_create([
+            VolunteerProfile(
+                user=user,
+                location_text=data.get("location_text", ""),
+                **geocoder.coordinates(data.get("location_text", "")),
+                skills=data.get("skills", []),
+                availability=data.get("availability", {}),
+            )
+            for user, (_, data) in zip(users, unique)
+        ])
+        ranges, slots = [], []
+        for profile in profiles:
+            parsed = parse_availability(profile.availability)
+            ranges += [AvailabilityRange(volunteer=profile, start_date=s, end_date=e) for s, e in parsed.ranges]
+            slots += [AvailabilitySlot(volunteer=profile, weekday=wd, start_time=s, end_time=e) for wd, s, e in parsed.slots]
+        AvailabilityRange.objects.bulk_create(ranges)
+        AvailabilitySlot.objects.bulk_create(slots)
+        for profile in profiles:
+            transaction.on_commit(partial(autocomplete.apply_change, None, None, profile.skills, profile.location_text))
+
+    _insert(unique, result, write)
+
+
+def import_volunteers(rows, chunk_size: int | None = None, max_rows: int | None = None) -> ImportResult:
+    """Create a user and volunteer profile per row (RegisterVolunteerSerializer fields)."""
+    return _run(rows, partial(_import_volunteers, Geocoder()), chunk_size, max_rows)
+
+
+# Opportunities
+
+def _import_opportunities(organization, geocoder, chunk, result) -> None:
+    valid = _validate(OpportunitySerializer, chunk, result)
+    geocoder.resolve(data.get("location_text", "") for _, data in valid)
+
+    def write():
+        opportunities = Opportunity.objects.bulk_create([
+            Opportunity(
+                **data,
+                organization=organization,
+                **geocoder.coordinates(data.get("location_text", "")),
+            )
+            for _, data in valid
+        ])
+        for opp in opportunities:
+            calendar_index.apply_delta(
+                OpportunityCalendarDay,
+                calendar_index.calendar_keys(opp.start_date, opp.end_date, opp.required_skills, opp.location_text),
+                +1,
+            )
+            transaction.on_commit(partial(autocomplete.apply_change, None, None, opp.required_skills, opp.location_text))
+        transaction.on_commit(partial(dashboard.invalidate, organization.id))
+
+    _insert(valid, result, write)
+
+
+def import_opportunities(organization, rows, chunk_size: int | None = None, max_rows: int | None = None) -> ImportResult:
+    """Create an opportunity of `organization` per row (OpportunitySerializer fields)."""
+    return _run(rows, partial(_import_opportunities, organization, Geocoder()), chunk_size, max_rows)
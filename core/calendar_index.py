@@ -0,0 +1,71 @@
+"""Per-day opportunity counts backing the calendar endpoint."""
+
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import F
+
+ALL = ""
+
+
+KEY_LENGTH = 100
+
+
+def normalize_skill(skill) -> str:
+    return str(skill).strip().lower()[:KEY_LENGTH]
+
+
+def region_for(location_text: str) -> str:
+    """Region key of a free-text location: its last comma-separated part ("Maracas Beach, Trinidad" -> "trinidad")."""
+    return location_text.rsplit(",", 1)[-1].strip().lower()[:KEY_LENGTH] if location_text else ""
+
+
+def calendar_keys(start_date, end_date, required_skills, location_text):
+    """(days, skill keys, region keys) an opportunity contributes to."""
+    # Unsaved-from-API instances may still carry ISO strings.
+    if isinstance(start_date, str):
+        start_date = date.fromisoformat(start_date)
+    if isinstance(end_date, str):
+        end_date = date.fromisoformat(end_date)
+    if not start_date or not end_date or end_date < start_date:
+        return [], [], []
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    skills = {normalize_skill(s) for s in (required_skills or []) if normalize_skill(s)}
+    region = region_for(location_text)
+    return days, sorted(skills | {ALL}), sorted({region, ALL})
+
+
+def apply_delta(model, keys, delta: int):
+    """Add `delta` to every (day, skill, region) counter in the cartesian product `keys`."""
+    days, skills, regions = keys
+    if not days:
+        return
+    with transaction.atomic():
+        if delta > 0:
+            model.objects.bulk_create(
+                [model(day=d, skill=s, region=r, count=0) for d in days for s in skills for r in regions],
+                ignore_conflicts=True,
+            )
+        model.objects.filter(
+            day__gte=days[0], day__lte=days[-1], skill__in=skills, region__in=regions
+        ).update(count=F("count") + delta)
+
+
+def rebuild(opportunity_model, calendar_model, batch_size: int = 2000) -> int:
+    """Recompute every counter from scratch. Returns the number of rows written."""
+    counts = {}
+    rows = opportunity_model.objects.values_list("start_date", "end_date", "required_skills", "location_text")
+    for start, end, skills, location in rows.iterator(chunk_size=batch_size):
+        days, skill_keys, region_keys = calendar_keys(start, end, skills, location)
+        for d in days:
+            for s in skill_keys:
+                for r in region_keys:
+                    counts[(d, s, r)] = counts.get((d, s, r), 0) + 1
+
+    with transaction.atomic():
+        calendar_model.objects.all().delete()
+        calendar_model.objects.bulk_create(
+            [calendar_model(day=d, skill=s, region=r, count=c) for (d, s, r), c in counts.items()],
+            batch_size=batch_size,
+        )
+    return len(counts)
@@ -0,0 +1,85 @@
+"""Organization dashboard aggregates (me/org-dashboard/)."""
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q, Sum
+
+from .models import Application, Feedback, HourLog, Notification, Opportunity
+
+CACHE_KEY = "org-dashboard:{org_id}"
+STATUSES = [value for value, _ in Application.Status.choices]
+
+
+def _hours(value) -> str:
+    return f"{(value or Decimal('0')).quantize(Decimal('0.01')):f}"
+
+
+def compute(org) -> dict:
+    opportunities = (
+        Opportunity.objects.filter(organization=org)
+        .order_by("-created_at")
+        .values("id", "title")
+        .annotate(
+            total=Count("applications"),
+            **{s.lower(): Count("applications", filter=Q(applications__status=s)) for s in STATUSES},
+        )
+    )
+    hours = dict(
+        HourLog.objects.filter(application__opportunity__organization=org)
+        .values("application__opportunity")
+        .annotate(total=Sum("hours"))
+        .values_list("application__opportunity", "total")
+    )
+    ratings = {
+        row["application__opportunity"]: row
+        for row in Feedback.objects.filter(organization=org)
+        .values("application__opportunity")
+        .annotate(average=Avg("rating"), count=Count("id"))
+    }
+
+    per_opportunity = []
+    totals = {s: 0 for s in STATUSES} | {"total": 0}
+    for opp in opportunities:
+        applications = {s: opp[s.lower()] for s in STATUSES} | {"total": opp["total"]}
+        for key, value in applications.items():
+            totals[key] += value
+        rating = ratings.get(opp["id"], {})
+        per_opportunity.append({
+            "id": opp["id"],
+            "title": opp["title"],
+            "applications": applications,
+            "hours_logged": _hours(hours.get(opp["id"])),
+            "average_rating": rating.get("average"),
+            "feedback_count": rating.get("count", 0),
+        })
+
+    feedback_count = sum(r["count"] for r in ratings.values())
+    rating_sum = sum(r["average"] * r["count"] for r in ratings.values())
+    return {
+        "organization": org.id,
+        "totals": {
+            "opportunities": len(per_opportunity),
+            "applications": totals,
+            "hours_logged": _hours(sum(hours.values(), Decimal("0"))),
+            "average_rating": rating_sum / feedback_count if feedback_count else None,
+            "feedback_count": feedback_count,
+        },
+        "opportunities": per_opportunity,
+    }
+
+
+def org_dashboard(org) -> dict:
+    key = CACHE_KEY.format(org_id=org.id)
+    data = cache.get(key)
+    if data is None:
+        data = compute(org)
+        cache.set(key, data, settings.ORG_DASHBOARD_CACHE_SECONDS)
+    unread = Notification.objects.filter(user_id=org.user_id, is_read=False).count()
+    return {**data, "unread_notifications": unread}
+
+
+def invalidate(org_id) -> None:
+    if org_id is not None:
+        cache.delete(CACHE_KEY.format(org_id=org_id))
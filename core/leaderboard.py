@@ -0,0 +1,122 @@
+"""Volunteer leaderboards by hours logged."""
+
+from collections import Counter
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F, Sum
+
+GLOBAL = "global"
+
+
+def org_scope(org_id) -> str:
+    return f"org:{org_id}"
+
+
+def month_scope(day) -> str:
+    return f"month:{day:%Y-%m}"
+
+
+def scopes_for(org_id, work_date) -> list[str]:
+    return [GLOBAL, org_scope(org_id), month_scope(work_date)]
+
+
+def _move(bucket_model, moves: Counter) -> None:
+    """Apply {(scope, hours): change in volunteers}, in key order so concurrent writers lock buckets alike."""
+    moves = {key: n for key, n in sorted(moves.items()) if n}
+    bucket_model.objects.bulk_create(
+        [bucket_model(scope=scope, hours=hours, volunteers=0) for (scope, hours), n in moves.items() if n > 0],
+        ignore_conflicts=True,
+    )
+    for (scope, hours), n in moves.items():
+        bucket_model.objects.filter(scope=scope, hours=hours).update(volunteers=F("volunteers") + n)
+
+
+def apply_delta(model, bucket_model, volunteer_id, scopes, hours) -> None:
+    hours = Decimal(str(hours))
+    if not hours:
+        return
+    with transaction.atomic():
+        # Only increments create rows: a decrement may run while a cascade is
+        # deleting the volunteer's entries and must not resurrect them.
+        if hours > 0:
+            model.objects.bulk_create(
+                [model(scope=scope, volunteer_id=volunteer_id, hours=0) for scope in scopes],
+                ignore_conflicts=True,
+            )
+        entries = list(
+            model.objects.select_for_update()
+            .filter(scope__in=scopes, volunteer_id=volunteer_id)
+            .values_list("pk", "scope", "hours")
+        )
+        model.objects.filter(pk__in=[pk for pk, _, _ in entries]).update(hours=F("hours") + hours)
+        moves = Counter()
+        for _, scope, old in entries:
+            if old > 0:
+                moves[scope, old] -= 1
+            if old + hours > 0:
+                moves[scope, old + hours] += 1
+        _move(bucket_model, moves)
+
+
+def remove_volunteer(model, bucket_model, volunteer_id) -> None:
+    """Delete a volunteer's entries and take them out of the buckets (before a cascade would)."""
+    with transaction.atomic():
+        entries = model.objects.select_for_update().filter(volunteer_id=volunteer_id)
+        moves = Counter()
+        for scope, hours in entries.filter(hours__gt=0).values_list("scope", "hours"):
+            moves[scope, hours] -= 1
+        _move(bucket_model, moves)
+        entries.delete()
+
+
+def _ranked(model, scope):
+    return model.objects.filter(scope=scope, hours__gt=0)
+
+
+def top(model, scope: str, limit: int = 10) -> list[dict]:
+    rows = (
+        _ranked(model, scope)
+        .order_by("-hours", "volunteer_id")
+        .values("volunteer_id", "volunteer__user__username", "hours")[:limit]
+    )
+    return [
+        {"rank": i, "volunteer": row["volunteer_id"], "username": row["volunteer__user__username"], "hours": f"{row['hours']:f}"}
+        for i, row in enumerate(rows, start=1)
+    ]
+
+
+def rank(model, bucket_model, scope: str, volunteer_id) -> dict | None:
+    entry = _ranked(model, scope).filter(volunteer_id=volunteer_id).values_list("hours", flat=True).first()
+    if entry is None:
+        return None
+    # One bucket row per distinct total above, then only the exact ties ordered before the volunteer.
+    above = bucket_model.objects.filter(scope=scope, hours__gt=entry).aggregate(n=Sum("volunteers"))["n"] or 0
+    ties = _ranked(model, scope).filter(hours=entry, volunteer_id__lt=volunteer_id).count()
+    return {"rank": above + ties + 1, "hours": f"{entry:f}"}
+
+
+def rebuild(hour_log_model, entry_model, bucket_model=None, batch_size: int = 2000) -> int:
+    """Recompute every scope (and its buckets, given bucket_model) from the hour logs. Returns the number of entries written."""
+    totals = {}
+    rows = hour_log_model.objects.values_list(
+        "application__volunteer_id", "application__opportunity__organization_id", "work_date", "hours"
+    )
+    for volunteer_id, org_id, work_date, hours in rows.iterator(chunk_size=batch_size):
+        for scope in scopes_for(org_id, work_date):
+            totals[(scope, volunteer_id)] = totals.get((scope, volunteer_id), Decimal("0")) + hours
+
+    with transaction.atomic():
+        entry_model.objects.all().delete()
+        entry_model.objects.bulk_create(
+            [entry_model(scope=scope, volunteer_id=vid, hours=hours) for (scope, vid), hours in totals.items()],
+            batch_size=batch_size,
+        )
+        if bucket_model is not None:
+            buckets = Counter((scope, hours) for (scope, _), hours in totals.items() if hours > 0)
+            bucket_model.objects.all().delete()
+            bucket_model.objects.bulk_create(
+                [bucket_model(scope=scope, hours=hours, volunteers=n) for (scope, hours), n in buckets.items()],
+                batch_size=batch_size,
+            )
+    return len(totals)
@@ -0,0 +1,35 @@
+"""Helpers shared by the bench_* management commands."""
+
+import time
+from datetime import date, timedelta
+
+from core.models import User, OrganizationProfile, Opportunity
+
+
+def seed_opportunities(rows: int, username: str = "bench_org") -> OrganizationProfile:
+    user = User.objects.create_user(username=username, email=f"{username}@example.com", password=None, role=User.Role.ORG)
+    org = OrganizationProfile.objects.create(user=user, name="Bench Org")
+    start = date.today()
+    Opportunity.objects.bulk_create(
+        [
+            Opportunity(
+                organization=org, title=f"Opportunity {i}", description="x" * 200,
+                required_skills=["FirstAid", "Cleanup"], location_text="Port of Spain",
+                latitude=10.66, longitude=-61.51,
+                start_date=start + timedelta(days=i % 90), end_date=start + timedelta(days=i % 90 + 1),
+            )
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+    return org
+
+
+def best_of(repeat: int, fn):
+    """Run `fn` `repeat` times; return (fastest wall time, last result)."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
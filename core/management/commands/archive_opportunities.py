@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core import archival
+
+
+class Command(BaseCommand):
+    help = (
+        "Archive opportunities that ended more than --days days ago, in batches, so they leave the "
+        "hot-path indexes and default listings. Applications and history stay in place."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30, help="Grace period after end_date.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true", help="Only count what would be archived.")
+
+    def handle(self, *args, **opts):
+        if opts["dry_run"]:
+            self.stdout.write(f"{archival.expired(opts['days']).count()} opportunities would be archived.")
+            return
+
+        total, started = 0, time.perf_counter()
+        while True:
+            archived = archival.archive_batch(opts["days"], opts["batch_size"])
+            if not archived:
+                break
+            total += archived
+            self.stdout.write(f"archived {total}...")
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} opportunities in {elapsed:.1f}s."))
@@ -0,0 +1,90 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import User, VolunteerProfile, Opportunity, Application, Notification
+from core.views import ApplyToOpportunityView
+from ._bench import seed_opportunities
+
+PREFIX = "bench_apply"
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the apply endpoint: many volunteers (each applying several times) hit one "
+        "opportunity concurrently. Checks that exactly one application and one org notification "
+        "exist per volunteer and reports latency. Seed data is committed and removed afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--volunteers", type=int, default=300)
+        parser.add_argument("--repeat", type=int, default=2, help="Applies per volunteer (duplicates must be no-ops).")
+        parser.add_argument("--threads", type=int, default=32)
+
+    def handle(self, *args, **opts):
+        if User.objects.filter(username__startswith=PREFIX).exists():
+            raise CommandError(f"Users named {PREFIX}* already exist; remove them first.")
+        # Committed, not rolled back: the worker threads use their own connections.
+        org = seed_opportunities(1, username=f"{PREFIX}_org")
+        try:
+            self.run(org, opts)
+        finally:
+            User.objects.filter(username__startswith=PREFIX).delete()
+
+    def run(self, org, opts):
+        opp = Opportunity.objects.get(organization=org)
+        users = User.objects.bulk_create([
+            User(username=f"{PREFIX}_{i}", email=f"{PREFIX}_{i}@example.com", role=User.Role.VOLUNTEER)
+            for i in range(opts["volunteers"])
+        ])
+        users = list(User.objects.filter(username__in=[u.username for u in users]))
+        VolunteerProfile.objects.bulk_create([VolunteerProfile(user=u) for u in users])
+        users = list(User.objects.select_related("volunteer_profile").filter(pk__in=[u.pk for u in users]))
+
+        view = ApplyToOpportunityView.as_view()
+        factory = APIRequestFactory()
+        path = f"/api/opportunities/{opp.id}/apply/"
+
+        def apply(user):
+            request = factory.post(path)
+            force_authenticate(request, user=user)
+            t0 = time.perf_counter()
+            try:
+                response = view(request, opportunity_id=opp.id)
+                return response.status_code, time.perf_counter() - t0
+            except Exception as exc:  # IntegrityError, "database is locked", ...
+                return type(exc).__name__, time.perf_counter() - t0
+            finally:
+                connections.close_all()
+
+        # Interleave duplicates so the same volunteer races itself.
+        jobs = [user for _ in range(opts["repeat"]) for user in users]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=opts["threads"]) as pool:
+            results = list(pool.map(apply, jobs))
+        elapsed = time.perf_counter() - started
+
+        outcomes = {}
+        for outcome, _ in results:
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        latencies = sorted(latency for _, latency in results)
+        applications = Application.objects.filter(opportunity=opp).count()
+        notifications = Notification.objects.filter(user_id=org.user_id, type="APPLICATION_CREATED").count()
+
+        self.stdout.write(f"{len(jobs)} applies in {elapsed:.2f}s ({len(jobs) / elapsed:,.0f}/s, {opts['threads']} threads)")
+        self.stdout.write(f"outcomes: {outcomes}")
+        self.stdout.write(
+            f"latency p50={statistics.median(latencies) * 1000:.1f}ms "
+            f"p95={latencies[int(len(latencies) * 0.95)] * 1000:.1f}ms max={latencies[-1] * 1000:.1f}ms"
+        )
+        ok = applications == notifications == len(users) and outcomes.get(201) == len(users)
+        self.stdout.write(
+            f"applications={applications} notifications={notifications} expected={len(users)}: "
+            + ("OK" if ok else "MISMATCH")
+        )
+        if not ok:
+            raise CommandError("Apply results are inconsistent.")
@@ -0,0 +1,123 @@
+import asyncio
+import os
+import shlex
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import User
+
+SERVERS = {
+    "wsgi": "gunicorn config.wsgi:application --workers {workers} --bind 127.0.0.1:{port}",
+    "asgi": "gunicorn config.asgi:application --workers {workers} --bind 127.0.0.1:{port} -k uvicorn.workers.UvicornWorker",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure throughput and latency of one endpoint at several concurrency levels, "
+        "against the WSGI (sync views) and ASGI (async views) deployments or an already running --url."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", required=True, help="Username whose access token is used for the requests.")
+        parser.add_argument("--path", default="/api/opportunities/search/")
+        parser.add_argument("--levels", type=int, nargs="+", default=[10, 100, 1000])
+        parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level.")
+        parser.add_argument("--servers", nargs="+", choices=sorted(SERVERS), default=["wsgi", "asgi"])
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--url", help="Benchmark this running server instead of starting --servers.")
+
+    def handle(self, *args, **opts):
+        try:
+            user = User.objects.get(username=opts["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user {opts['user']!r}.")
+        token = str(RefreshToken.for_user(user).access_token)
+
+        if opts["url"]:
+            self.run_levels(opts["url"].rstrip("/") + opts["path"], token, opts)
+            return
+
+        for name in opts["servers"]:
+            command = SERVERS[name].format(workers=opts["workers"], port=opts["port"])
+            self.stdout.write(f"== {name}: {command}")
+            env = {**os.environ, "ASYNC_VIEWS": "1" if name == "asgi" else "0"}
+            server = subprocess.Popen(shlex.split(command), cwd=settings.BASE_DIR, env=env,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                self.wait_for_port(opts["port"])
+                self.run_levels(f"http://127.0.0.1:{opts['port']}{opts['path']}", token, opts)
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+
+    def wait_for_port(self, port: int, timeout: float = 30.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with socket.socket() as sock:
+                if sock.connect_ex(("127.0.0.1", port)) == 0:
+                    return
+            time.sleep(0.2)
+        raise CommandError(f"Server did not start listening on port {port}.")
+
+    def run_levels(self, url: str, token: str, opts):
+        self.stdout.write(f"{'clients':>8} {'requests':>9} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for level in opts["levels"]:
+            latencies, errors, elapsed = asyncio.run(load(url, token, level, opts["duration"]))
+            latencies.sort()
+            pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else float("nan")
+            self.stdout.write(
+                f"{level:>8} {len(latencies):>9} {len(latencies) / elapsed:>9.1f} "
+                f"{statistics.median(latencies) * 1000 if latencies else float('nan'):>8.1f} {pct(0.95):>8.1f} {pct(0.99):>8.1f} {errors:>7}"
+            )
+        sys.stdout.flush()
+
+
+async def fetch(host: str, port: int, request: bytes) -> int:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(request)
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()  # Connection: close, so the body ends at EOF
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def load(url: str, token: str, clients: int, duration: float):
+    parts = urlsplit(url)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    request = (
+        f"GET {target} HTTP/1.1\r\nHost: {parts.netloc}\r\nAuthorization: Bearer {token}\r\n"
+        f"Accept: application/json\r\nConnection: close\r\n\r\n"
+    ).encode()
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+
+    async def client():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            t0 = time.perf_counter()
+            try:
+                status_code = await asyncio.wait_for(fetch(parts.hostname, parts.port or 80, request), timeout=30)
+            except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+                errors += 1
+                continue
+            if status_code == 200:
+                latencies.append(time.perf_counter() - t0)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return latencies, errors, time.perf_counter() - started
@@ -0,0 +1,85 @@
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.utils import ConnectionHandler
+
+from config.database import sqlite_config, tune_postgres
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark connection setup cost and request throughput for the configured "
+        "database, with and without pooling (PostgreSQL) or tuned pragmas (SQLite)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--connects", type=int, default=200, help="Connections opened for the setup-cost test.")
+        parser.add_argument("--threads", type=int, default=8, help="Concurrent workers for the throughput test.")
+        parser.add_argument("--requests", type=int, default=500, help="Simulated requests per worker.")
+
+    def handle(self, *args, **opts):
+        variants = self.build_variants(settings.DATABASES["default"])
+        # ConnectionHandler insists on a "default" alias; it is never used here.
+        handler = ConnectionHandler({"default": settings.DATABASES["default"], **variants})
+
+        for alias in variants:
+            self.prepare(handler, alias)
+            setup = self.measure_setup(handler, alias, opts["connects"])
+            rps = self.measure_throughput(handler, alias, opts["threads"], opts["requests"])
+            self.stdout.write(
+                f"{alias:>8}: connect p50={setup['p50'] * 1000:.3f}ms p95={setup['p95'] * 1000:.3f}ms  "
+                f"throughput={rps:,.0f} req/s ({opts['threads']} threads)"
+            )
+            handler[alias].close()
+            if hasattr(handler[alias], "close_pool"):
+                handler[alias].close_pool()
+
+    def build_variants(self, default: dict) -> dict:
+        if default["ENGINE"].endswith("sqlite3"):
+            # Work on a scratch file so the benchmark never touches real data.
+            base_dir = Path(tempfile.mkdtemp())
+            tuned = sqlite_config(base_dir)
+            plain = {"ENGINE": tuned["ENGINE"], "NAME": base_dir / "plain.sqlite3"}
+            return {"plain": plain, "tuned": tuned}
+
+        direct = tune_postgres(default, pool=False)
+        direct["CONN_MAX_AGE"] = 0
+        return {"direct": direct, "pooled": tune_postgres(default, pool=True)}
+
+    def prepare(self, handler, alias: str):
+        with handler[alias].cursor() as cursor:
+            cursor.execute("CREATE TABLE IF NOT EXISTS bench_db_kv (k INTEGER, v VARCHAR(32))")
+        handler[alias].close()
+
+    def measure_setup(self, handler, alias: str, n: int) -> dict:
+        conn = handler[alias]
+        timings = []
+        for _ in range(n):
+            t0 = time.perf_counter()
+            conn.ensure_connection()
+            timings.append(time.perf_counter() - t0)
+            conn.close()
+        timings.sort()
+        return {"p50": statistics.median(timings), "p95": timings[int(len(timings) * 0.95) - 1]}
+
+    def measure_throughput(self, handler, alias: str, threads: int, per_worker: int) -> float:
+        def worker(worker_id: int):
+            # Each thread gets its own connection from the handler; closing it
+            # at the end of every "request" mirrors Django's request lifecycle.
+            conn = handler[alias]
+            for i in range(per_worker):
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT COUNT(*) FROM bench_db_kv WHERE k = %s", [i])
+                    if i % 10 == 0:
+                        cursor.execute("INSERT INTO bench_db_kv (k, v) VALUES (%s, %s)", [i, f"w{worker_id}"])
+                conn.close()
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(worker, range(threads)))
+        return threads * per_worker / (time.perf_counter() - t0)
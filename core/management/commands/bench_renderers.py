@@ -0,0 +1,50 @@
+import gzip
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from core.middleware import brotli
+from core.models import Opportunity
+from core.renderers import FastJSONRenderer, orjson
+from core.serializers import OpportunitySerializer
+
+from ._bench import best_of, seed_opportunities
+
+
+class Command(BaseCommand):
+    help = "Compare JSON encode time (stdlib vs orjson) and bytes on the wire (raw/gzip/brotli) for an opportunity list."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **opts):
+        with transaction.atomic():
+            seed_opportunities(opts["rows"])
+            qs = Opportunity.objects.select_related("organization").order_by("-created_at")
+            data = OpportunitySerializer(qs, many=True).data
+            transaction.set_rollback(True)
+
+        std_t, std_body = best_of(opts["repeat"], lambda: JSONRenderer().render(data))
+        fast_t, fast_body = best_of(opts["repeat"], lambda: FastJSONRenderer().render(data))
+
+        self.stdout.write(f"rows={opts['rows']}")
+        self.stdout.write(f"  encode stdlib json:  {std_t * 1000:8.1f}ms")
+        self.stdout.write(
+            f"  encode FastJSON:     {fast_t * 1000:8.1f}ms ({std_t / fast_t:.1f}x)"
+            f"{'' if orjson else '  [orjson not installed: stdlib fallback]'}"
+        )
+        self.stdout.write(f"  identical output:    {std_body == fast_body}")
+
+        level = settings.COMPRESSION_GZIP_LEVEL
+        gz_t, gz_body = best_of(opts["repeat"], lambda: gzip.compress(fast_body, compresslevel=level, mtime=0))
+        self.stdout.write(f"  raw:                 {len(fast_body):>10,} bytes")
+        self.stdout.write(f"  gzip (level {level}):      {len(gz_body):>10,} bytes  {gz_t * 1000:8.1f}ms")
+        if brotli is None:
+            self.stdout.write("  brotli:              not installed")
+        else:
+            quality = settings.COMPRESSION_BROTLI_QUALITY
+            br_t, br_body = best_of(opts["repeat"], lambda: brotli.compress(fast_body, quality=quality))
+            self.stdout.write(f"  brotli (quality {quality}):  {len(br_body):>10,} bytes  {br_t * 1000:8.1f}ms")
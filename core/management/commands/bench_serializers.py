@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Opportunity
+from core.serializers import OpportunitySerializer, ValuesSerializer
+
+from ._bench import best_of, seed_opportunities
+
+
+class Command(BaseCommand):
+    help = "Compare OpportunitySerializer against the ValuesSerializer fast path on N rows (rolled back afterwards)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **opts):
+        with transaction.atomic():
+            seed_opportunities(opts["rows"])
+            qs = Opportunity.objects.select_related("organization").order_by("-created_at")
+            renderer = JSONRenderer()
+            fast = ValuesSerializer(OpportunitySerializer)
+
+            slow_t, _ = best_of(opts["repeat"], lambda: OpportunitySerializer(qs, many=True).data)
+            fast_t, _ = best_of(opts["repeat"], lambda: fast.serialize(qs))
+            slow_rt, slow_body = best_of(opts["repeat"], lambda: renderer.render(OpportunitySerializer(qs, many=True).data))
+            fast_rt, fast_body = best_of(opts["repeat"], lambda: renderer.render(fast.serialize(qs)))
+
+            self.stdout.write(f"rows={opts['rows']}            serialize   serialize+render")
+            self.stdout.write(f"  OpportunitySerializer: {slow_t * 1000:8.1f}ms  {slow_rt * 1000:8.1f}ms")
+            self.stdout.write(
+                f"  ValuesSerializer:      {fast_t * 1000:8.1f}ms  {fast_rt * 1000:8.1f}ms"
+                f"  ({slow_t / fast_t:.1f}x / {slow_rt / fast_rt:.1f}x)"
+            )
+            self.stdout.write(f"  identical output: {slow_body == fast_body}")
+            transaction.set_rollback(True)
@@ -0,0 +1,63 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter, like a newly forked worker that imports the WSGI app.
+PROBE = r"""
+import json, os, sys, time
+from io import BytesIO
+t0 = time.perf_counter()
+import django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+t1 = time.perf_counter()
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+application = WSGIHandler()
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": sys.argv[1], "QUERY_STRING": "", "SERVER_NAME": "localhost",
+    "SERVER_PORT": "80", "HTTP_HOST": settings.ALLOWED_HOSTS[0], "wsgi.url_scheme": "http",
+    "wsgi.input": BytesIO(), "wsgi.errors": sys.stderr,
+}
+status = []
+body = b"".join(application(environ, lambda s, h, *a: status.append(s)))
+t2 = time.perf_counter()
+print(json.dumps({"setup": t1 - t0, "first_request": t2 - t1, "status": status[0],
+                  "modules": len(sys.modules), "geopy": "geopy" in sys.modules}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-worker startup: django.setup() and the first request, each in a fresh "
+        "Python process (as a newly booted worker sees them)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="Fresh processes to start.")
+        parser.add_argument("--path", default="/api/schema/", help="Path of the first request.")
+
+    def handle(self, *args, **opts):
+        results = []
+        for _ in range(opts["runs"]):
+            proc = subprocess.run(
+                [sys.executable, "-c", PROBE, opts["path"]],
+                cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                raise CommandError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "probe failed")
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+        for key in ("setup", "first_request"):
+            values = [r[key] * 1000 for r in results]
+            self.stdout.write(f"{key:>14}: p50={statistics.median(values):.1f}ms min={min(values):.1f}ms max={max(values):.1f}ms")
+        last = results[-1]
+        self.stdout.write(
+            f"first request to {opts['path']}: {last['status']}; "
+            f"{last['modules']} modules loaded; geopy imported: {last['geopy']}"
+        )
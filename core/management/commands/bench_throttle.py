@@ -0,0 +1,67 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import SimpleRateThrottle
+
+from core import throttling
+
+
+class DRFThrottle(SimpleRateThrottle):
+    """DRF's cache-backed sliding window (what AnonRateThrottle/ScopedRateThrottle do)."""
+    scope = "bench"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class BucketThrottle(throttling.TokenBucketThrottle):
+    scope = "bench"
+
+
+class Command(BaseCommand):
+    help = (
+        "Per-check cost of the token-bucket throttle (in-memory and cache backends) against DRF's "
+        "cache-based SimpleRateThrottle: --limit allowed checks, then --limit rejected ones, per client."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=1000, help="Bucket size (requests allowed per day).")
+        parser.add_argument("--clients", type=int, default=20)
+
+    def measure(self, throttle_class, limit: int, clients: int, tag: str):
+        factory = APIRequestFactory()
+        allowed = rejected = 0.0
+        for client in range(clients):
+            request = Request(factory.get("/api/opportunities/search/", REMOTE_ADDR=f"10.{tag}.{client // 256}.{client % 256}"))
+            request.user  # authenticate up front (anonymous), as DRF does before throttling
+            for phase in ("allowed", "rejected"):
+                t0 = time.perf_counter()
+                results = [throttle_class().allow_request(request, None) for _ in range(limit)]
+                elapsed = time.perf_counter() - t0
+                assert all(results) if phase == "allowed" else not any(results), f"unexpected {phase} results"
+                if phase == "allowed":
+                    allowed += elapsed
+                else:
+                    rejected += elapsed
+        checks = limit * clients
+        return allowed / checks * 1e6, rejected / checks * 1e6
+
+    def handle(self, *args, **opts):
+        rate = f"{opts['limit']}/day"  # slow refill, so the second phase is all rejections
+        DRFThrottle.rate = rate
+        cache_backend = settings.CACHES["default"]["BACKEND"].rsplit(".", 1)[-1]
+        self.stdout.write(f"rate={rate} clients={opts['clients']} cache={cache_backend}")
+        runs = [
+            ("token bucket, memory", BucketThrottle, "memory"),
+            ("token bucket, cache", BucketThrottle, "cache"),
+            ("DRF SimpleRateThrottle", DRFThrottle, "memory"),
+        ]
+        for tag, (label, throttle_class, backend) in enumerate(runs, start=1):
+            with override_settings(THROTTLE_BACKEND=backend, THROTTLE_RATES={"bench": rate}):
+                allowed, rejected = self.measure(throttle_class, opts["limit"], opts["clients"], str(tag))
+            self.stdout.write(f"  {label:<24} allowed {allowed:8.2f}us/check   rejected {rejected:8.2f}us/check")
+        throttling.memory_buckets.clear()
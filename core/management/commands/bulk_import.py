@@ -0,0 +1,53 @@
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import bulk_import
+from core.models import OrganizationProfile
+
+SUFFIXES = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+
+class Command(BaseCommand):
+    help = (
+        "Import volunteers or an organization's opportunities from a CSV or JSON lines file "
+        "(same fields as the registration / opportunity endpoints), reporting per-row errors and rows/sec."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=["volunteers", "opportunities"])
+        parser.add_argument("path", help='File to read, or "-" for stdin.')
+        parser.add_argument("--format", choices=bulk_import.FORMATS, help="Default: from the file suffix.")
+        parser.add_argument("--org", help="Username of the organization that owns imported opportunities.")
+        parser.add_argument("--chunk-size", type=int, help="Rows per chunk (default IMPORT_CHUNK_SIZE).")
+
+    def handle(self, *args, **opts):
+        fmt = opts["format"] or SUFFIXES.get(Path(opts["path"]).suffix.lower())
+        if fmt is None:
+            raise CommandError("Cannot tell the format from the file name; pass --format.")
+
+        organization = None
+        if opts["kind"] == "opportunities":
+            if not opts["org"]:
+                raise CommandError("--org is required when importing opportunities.")
+            organization = OrganizationProfile.objects.filter(user__username=opts["org"]).first()
+            if organization is None:
+                raise CommandError(f"No organization with username {opts['org']!r}.")
+
+        stream = nullcontext(sys.stdin) if opts["path"] == "-" else open(opts["path"], newline="", encoding="utf-8")
+        with stream as lines:
+            rows = bulk_import.read_rows(lines, fmt)
+            if organization is None:
+                result = bulk_import.import_volunteers(rows, chunk_size=opts["chunk_size"])
+            else:
+                result = bulk_import.import_opportunities(organization, rows, chunk_size=opts["chunk_size"])
+
+        for error in result.errors:
+            self.stderr.write(f"line {error['line']}: {error['errors']}")
+        style = self.style.SUCCESS if not result.errors else self.style.WARNING
+        self.stdout.write(style(
+            f"Imported {result.created} of {result.rows} rows in {result.seconds:.1f}s "
+            f"({result.rows_per_second} rows/s); {len(result.errors)} errors."
+        ))
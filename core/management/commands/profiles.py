@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core import profiling
+
+
+class Command(BaseCommand):
+    help = "List the profiled requests in the ring buffer, or show one (hot functions and time per component)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("profile_id", nargs="?")
+
+    def handle(self, *args, **opts):
+        if not opts["profile_id"]:
+            for record in profiling.list_records():
+                self.stdout.write(
+                    f"{record['id']}  {record['started_at']}  {record['duration_ms']:>9.1f}ms  "
+                    f"{record['status']}  {record['method']} {record['path']}  ({record['user']})"
+                )
+            return
+
+        record = profiling.load(opts["profile_id"])
+        if record is None:
+            raise CommandError(f"No profile {opts['profile_id']!r}.")
+        self.stdout.write(f"{record['method']} {record['path']} -> {record['status']} in {record['duration_ms']:.1f}ms")
+        self.stdout.write("self time by component: " + ", ".join(f"{k}={v:.1f}ms" for k, v in record["components_ms"].items()))
+        self.stdout.write(f"{'cumtime ms':>11} {'tottime ms':>11} {'calls':>7}  function  <- callers")
+        for row in record["hot"]:
+            self.stdout.write(
+                f"{row['cumtime_ms']:>11.1f} {row['tottime_ms']:>11.1f} {row['calls']:>7}  {row['function']}"
+                + (f"  <- {', '.join(row['callers'])}" if row["callers"] else "")
+            )
+        self.stdout.write(f"raw stats: {profiling.directory() / (record['id'] + '.prof')}")
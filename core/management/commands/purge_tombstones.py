@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core import sync
+from core.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = "Delete change-feed tombstones older than SYNC_TOMBSTONE_DAYS (clients with older cursors resync)."
+
+    def handle(self, *args, **opts):
+        removed = sync.purge(Tombstone)
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} tombstones older than {settings.SYNC_TOMBSTONE_DAYS} days."))
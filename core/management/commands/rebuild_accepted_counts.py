@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core import applications
+
+
+class Command(BaseCommand):
+    help = "Recompute every opportunity's accepted_count (used for capacity slots) from its accepted applications."
+
+    def handle(self, *args, **opts):
+        updated = applications.rebuild_accepted_counts()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt accepted counts for {updated} opportunities."))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from core import calendar_index
+from core.models import Opportunity, OpportunityCalendarDay
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-day opportunity calendar counters from the Opportunity table."
+
+    def handle(self, *args, **opts):
+        rows = calendar_index.rebuild(Opportunity, OpportunityCalendarDay)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} calendar counters."))
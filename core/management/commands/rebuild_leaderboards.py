@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from core import leaderboard
+from core.models import HourLog, LeaderboardBucket, LeaderboardEntry
+
+
+class Command(BaseCommand):
+    help = "Recompute every leaderboard (global, per organization, per month) from the hour logs."
+
+    def handle(self, *args, **opts):
+        rows = leaderboard.rebuild(HourLog, LeaderboardEntry, LeaderboardBucket)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} leaderboard entries."))
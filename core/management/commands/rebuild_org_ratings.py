@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from core import ratings
+from core.models import Feedback, OrganizationProfile
+
+
+class Command(BaseCommand):
+    help = "Recompute every organization's denormalized rating count, average and distribution from Feedback."
+
+    def handle(self, *args, **opts):
+        updated = ratings.rebuild(OrganizationProfile, Feedback)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt ratings for {updated} organizations."))
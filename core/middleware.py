@@ -0,0 +1,164 @@
+import cProfile
+import gzip
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from . import profiling
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+def accepted_encodings(header: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q}, dropping q=0 entries."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                continue
+        if q > 0:
+            accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(header: str) -> str | None:
+    accepted = accepted_encodings(header)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_q = None, 0.0
+    for coding in candidates:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        # Ties go to the first (smaller output) candidate.
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with brotli or gzip, whichever the client prefers.
+
+    Bodies smaller than COMPRESSION_MIN_SIZE bytes are sent as is: below that
+    the framing overhead outweighs the savings. Streaming responses, responses
+    that are already encoded and non-text content types are left alone.
+    """
+
+    COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/vnd.oai.openapi")
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        self.min_size = getattr(settings, "COMPRESSION_MIN_SIZE", 1024)
+        self.gzip_level = getattr(settings, "COMPRESSION_GZIP_LEVEL", 6)
+        self.brotli_quality = getattr(settings, "COMPRESSION_BROTLI_QUALITY", 4)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if not response.get("Content-Type", "").startswith(self.COMPRESSIBLE_TYPES):
+            return response
+
+        # Whatever the outcome, the representation now depends on the header.
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if len(response.content) < self.min_size:
+            return response
+
+        coding = negotiate_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if coding is None:
+            return response
+
+        compressed = self.compress(response.content, coding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = coding
+        # The compressed body is not byte-identical to the original one.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
+
+    def compress(self, data: bytes, coding: str) -> bytes:
+        if coding == "br":
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level, mtime=0)
+
+
+class ProfilingMiddleware:
+    """
+    Run a single request under cProfile when a staff user asks for it with
+    `X-Profile: 1` or `?_profile=1` (see core/profiling.py); the response
+    carries the stored record's id in X-Profile-Id. Other requests only pay
+    for the flag check.
+
+    Under ASGI only the coroutine side of the request is profiled, and a
+    request that arrives while another one is being profiled runs unprofiled.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        user = profiling.staff_user(request) if profiling.requested(request) else None
+        if user is None:
+            return self.get_response(request)
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        response = profiler.runcall(self.get_response, request)
+        return self.record(profiler, request, response, user, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        user = await sync_to_async(profiling.staff_user)(request) if profiling.requested(request) else None
+        if user is None:
+            return await self.get_response(request)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # another request on this thread is being profiled
+            return await self.get_response(request)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            profiler.disable()
+        return await sync_to_async(self.record)(profiler, request, response, user, time.perf_counter() - start)
+
+    def record(self, profiler, request, response, user, duration):
+        response["X-Profile-Id"] = profiling.save(profiler, request, response, user, duration)
+        return response
@@ -0,0 +1,132 @@
+# Generated by Django 6.0 on 2026-10-18 23:27
+
+from datetime import date, time
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+# A copy of core.services.parse_availability as of this migration, so later
+# changes to the live parser do not change what this backfill writes.
+WEEKDAYS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+
+
+def _parse_date(value):
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _parse_slot(value):
+    try:
+        start, end = str(value).split("-")
+        start_t, end_t = time.fromisoformat(start.strip()), time.fromisoformat(end.strip())
+    except ValueError:
+        return None
+    return (start_t, end_t) if start_t < end_t else None
+
+
+def parse_availability(data):
+    """(merged date ranges, weekly slots) of a VolunteerProfile.availability value."""
+    if not isinstance(data, dict):
+        return [], []
+
+    ranges = []
+    for item in data.get("ranges") or []:
+        if isinstance(item, dict):
+            start, end = _parse_date(item.get("start")), _parse_date(item.get("end", item.get("start")))
+        elif isinstance(item, (list, tuple)) and len(item) == 2:
+            start, end = _parse_date(item[0]), _parse_date(item[1])
+        else:
+            continue
+        if start and end and start <= end:
+            ranges.append((start, end))
+    for item in data.get("dates") or []:
+        day = _parse_date(item)
+        if day:
+            ranges.append((day, day))
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and (start - merged[-1][1]).days <= 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    weekdays = data.get("weekdays") or {}
+    if isinstance(weekdays, list):
+        weekdays = {day: [] for day in weekdays}
+    slots = []
+    if isinstance(weekdays, dict):
+        for name, times in weekdays.items():
+            weekday = WEEKDAYS.get(str(name).strip().lower()[:3])
+            if weekday is None:
+                continue
+            parsed = [_parse_slot(t) for t in times] if isinstance(times, list) and times else [(time.min, time.max)]
+            slots.extend((weekday, start, end) for start, end in filter(None, parsed))
+
+    return merged, sorted(set(slots))
+
+
+def backfill_availability(apps, schema_editor):
+    VolunteerProfile = apps.get_model("core", "VolunteerProfile")
+    AvailabilityRange = apps.get_model("core", "AvailabilityRange")
+    AvailabilitySlot = apps.get_model("core", "AvailabilitySlot")
+    for profile in VolunteerProfile.objects.exclude(availability={}).iterator():
+        ranges, slots = parse_availability(profile.availability)
+        AvailabilityRange.objects.bulk_create(
+            [AvailabilityRange(volunteer=profile, start_date=start, end_date=end) for start, end in ranges]
+        )
+        AvailabilitySlot.objects.bulk_create(
+            [AvailabilitySlot(volunteer=profile, weekday=wd, start_time=start, end_time=end) for wd, start, end in slots]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AvailabilityRange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AvailabilitySlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField(validators=[django.core.validators.MaxValueValidator(6)])),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='opportunity',
+            index=models.Index(fields=['end_date', 'start_date'], name='opportunity_dates_idx'),
+        ),
+        migrations.AddField(
+            model_name='availabilityrange',
+            name='volunteer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability_ranges', to='core.volunteerprofile'),
+        ),
+        migrations.AddField(
+            model_name='availabilityslot',
+            name='volunteer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability_slots', to='core.volunteerprofile'),
+        ),
+        migrations.AddIndex(
+            model_name='availabilityrange',
+            index=models.Index(fields=['volunteer', 'start_date', 'end_date'], name='availability_range_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='availabilityslot',
+            index=models.Index(fields=['weekday', 'start_time'], name='availability_slot_idx'),
+        ),
+        migrations.RunPython(backfill_availability, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 23:29
+
+from django.db import migrations, models
+
+
+def build_calendar(apps, schema_editor):
+    from core.calendar_index import rebuild
+
+    rebuild(apps.get_model("core", "Opportunity"), apps.get_model("core", "OpportunityCalendarDay"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_availability_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OpportunityCalendarDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('skill', models.CharField(blank=True, default='', max_length=100)),
+                ('region', models.CharField(blank=True, default='', max_length=100)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('skill', 'region', 'day'), name='unique_calendar_day')],
+            },
+        ),
+        migrations.RunPython(build_calendar, migrations.RunPython.noop),
+    ]
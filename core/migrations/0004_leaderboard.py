@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-18 23:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_leaderboards(apps, schema_editor):
+    from core.leaderboard import rebuild
+
+    rebuild(apps.get_model("core", "HourLog"), apps.get_model("core", "LeaderboardEntry"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_opportunity_calendar'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=32)),
+                ('hours', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('volunteer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to='core.volunteerprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['scope', '-hours', 'volunteer'], name='leaderboard_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scope', 'volunteer'), name='unique_leaderboard_entry')],
+            },
+        ),
+        migrations.RunPython(build_leaderboards, migrations.RunPython.noop),
+    ]
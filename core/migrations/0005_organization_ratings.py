@@ -0,0 +1,60 @@
+# Generated by Django 6.0 on 2026-10-18 23:33
+
+from django.db import migrations, models
+
+
+def build_ratings(apps, schema_editor):
+    from core.ratings import rebuild
+
+    rebuild(apps.get_model("core", "OrganizationProfile"), apps.get_model("core", "Feedback"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_leaderboard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organizationprofile',
+            name='rating_1',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='organizationprofile',
+            name='rating_2',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='organizationprofile',
+            name='rating_3',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='organizationprofile',
+            name='rating_4',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='organizationprofile',
+            name='rating_5',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='organizationprofile',
+            name='rating_average',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='organizationprofile',
+            name='rating_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='organizationprofile',
+            name='rating_sum',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(build_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-18 23:40
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_accepted_counts(apps, schema_editor):
+    Opportunity = apps.get_model("core", "Opportunity")
+    Application = apps.get_model("core", "Application")
+    accepted = (
+        Application.objects.filter(opportunity=OuterRef("pk"), status="ACCEPTED")
+        .values("opportunity").annotate(n=Count("id")).values("n")
+    )
+    Opportunity.objects.update(accepted_count=Coalesce(Subquery(accepted, output_field=IntegerField()), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_organization_ratings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunity',
+            name='accepted_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='capacity',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('ACCEPTED', 'Accepted'), ('REJECTED', 'Rejected'), ('WAITLISTED', 'Waitlisted')], default='PENDING', max_length=20),
+        ),
+        migrations.RunPython(backfill_accepted_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-18 23:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_change_feed'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='opportunity',
+            name='opportunity_dates_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='opportunity',
+            name='opportunity_updated_idx',
+        ),
+        migrations.AddField(
+            model_name='opportunity',
+            name='archived_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='opportunity',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True)), fields=['end_date', 'start_date'], name='opportunity_dates_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='opportunity',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True)), fields=['-created_at'], name='opportunity_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='opportunity',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True)), fields=['updated_at', 'id'], name='opportunity_updated_idx'),
+        ),
+    ]
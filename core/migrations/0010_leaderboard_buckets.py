@@ -0,0 +1,38 @@
+# Generated by Django 6.0 on 2026-10-19 00:30
+
+from collections import Counter
+
+from django.db import migrations, models
+
+
+def build_buckets(apps, schema_editor):
+    LeaderboardEntry = apps.get_model("core", "LeaderboardEntry")
+    LeaderboardBucket = apps.get_model("core", "LeaderboardBucket")
+    counts = Counter(LeaderboardEntry.objects.filter(hours__gt=0).values_list("scope", "hours").iterator())
+    LeaderboardBucket.objects.bulk_create(
+        [LeaderboardBucket(scope=scope, hours=hours, volunteers=n) for (scope, hours), n in counts.items()],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_opportunity_archival'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=32)),
+                ('hours', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('volunteers', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('scope', 'hours'), name='unique_leaderboard_bucket')],
+            },
+        ),
+        migrations.RunPython(build_buckets, migrations.RunPython.noop),
+    ]
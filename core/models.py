@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
@@ -28,6 +28,52 @@ class VolunteerProfile(models.Model):
     def __str__(self) -> str:
         return f"VolunteerProfile<{self.user_id}>"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "availability" in update_fields:
+            self.sync_availability()
+
+    def sync_availability(self):
+        """Rebuild the indexed AvailabilityRange/AvailabilitySlot rows from `availability`."""
+        from .services import parse_availability
+
+        parsed = parse_availability(self.availability)
+        with transaction.atomic():
+            self.availability_ranges.all().delete()
+            self.availability_slots.all().delete()
+            AvailabilityRange.objects.bulk_create(
+                [AvailabilityRange(volunteer=self, start_date=start, end_date=end) for start, end in parsed.ranges]
+            )
+            AvailabilitySlot.objects.bulk_create(
+                [AvailabilitySlot(volunteer=self, weekday=wd, start_time=start, end_time=end) for wd, start, end in parsed.slots]
+            )
+
+
+class AvailabilityRange(models.Model):
+    """Date range a volunteer is available, derived from VolunteerProfile.availability."""
+    volunteer = models.ForeignKey(VolunteerProfile, on_delete=models.CASCADE, related_name="availability_ranges")
+    start_date = models.DateField()
+    end_date = models.DateField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["volunteer", "start_date", "end_date"], name="availability_range_idx"),
+        ]
+
+
+class AvailabilitySlot(models.Model):
+    """Recurring weekly slot (0=Monday), derived from VolunteerProfile.availability."""
+    volunteer = models.ForeignKey(VolunteerProfile, on_delete=models.CASCADE, related_name="availability_slots")
+    weekday = models.PositiveSmallIntegerField(validators=[MaxValueValidator(6)])
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["weekday", "start_time"], name="availability_slot_idx"),
+        ]
+
 
 class OrganizationProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="org_profile")
@@ -39,10 +85,26 @@ class OrganizationProfile(models.Model):
     latitude = models.FloatField(null=True, blank=True)
     longitude = models.FloatField(null=True, blank=True)
 
+    # Feedback aggregates, maintained by core.signals (see core/ratings.py)
+    rating_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_average = models.FloatField(null=True, blank=True)
+    rating_1 = models.IntegerField(default=0)
+    rating_2 = models.IntegerField(default=0)
+    rating_3 = models.IntegerField(default=0)
+    rating_4 = models.IntegerField(default=0)
+    rating_5 = models.IntegerField(default=0)
+
     def __str__(self) -> str:
         return self.name
 
 
+class OpportunityQuerySet(models.QuerySet):
+    def current(self):
+        """Opportunities that have not ended and are not archived (matches the partial hot-path indexes)."""
+        return self.filter(archived_at__isnull=True, end_date__gte=timezone.localdate())
+
+
 class Opportunity(models.Model):
     organization = models.ForeignKey(OrganizationProfile, on_delete=models.CASCADE, related_name="opportunities")
     title = models.CharField(max_length=200)
@@ -56,16 +118,53 @@ class Opportunity(models.Model):
     start_date = models.DateField()
     end_date = models.DateField()
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Set by archive_opportunities once the opportunity is long over; archived rows
+    # drop out of the partial indexes below.
+    archived_at = models.DateTimeField(null=True, blank=True)
+
+    # Optional cap on accepted volunteers; accepted_count is maintained by core.applications
+    capacity = models.PositiveIntegerField(null=True, blank=True)
+    accepted_count = models.PositiveIntegerField(default=0)
+
+    objects = OpportunityQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Date-overlap lookups: end_date >= X AND start_date <= Y
+            models.Index(fields=["end_date", "start_date"], name="opportunity_dates_idx",
+                         condition=models.Q(archived_at__isnull=True)),
+            # Default list order of current opportunities
+            models.Index(fields=["-created_at"], name="opportunity_active_created_idx",
+                         condition=models.Q(archived_at__isnull=True)),
+            # Change feed keyset: (updated_at, id) > cursor
+            models.Index(fields=["updated_at", "id"], name="opportunity_updated_idx",
+                         condition=models.Q(archived_at__isnull=True)),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} @ {self.organization.name}"
 
 
+class OpportunityCalendarDay(models.Model):
+    """Number of opportunities running on `day`, per skill/region ("" = all). Maintained by core.signals."""
+    day = models.DateField()
+    skill = models.CharField(max_length=100, blank=True, default="")
+    region = models.CharField(max_length=100, blank=True, default="")
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["skill", "region", "day"], name="unique_calendar_day")
+        ]
+
+
 class Application(models.Model):
     class Status(models.TextChoices):
         PENDING = "PENDING", "Pending"
         ACCEPTED = "ACCEPTED", "Accepted"
         REJECTED = "REJECTED", "Rejected"
+        WAITLISTED = "WAITLISTED", "Waitlisted"
 
     opportunity = models.ForeignKey(Opportunity, on_delete=models.CASCADE, related_name="applications")
     volunteer = models.ForeignKey(VolunteerProfile, on_delete=models.CASCADE, related_name="applications")
@@ -77,6 +176,11 @@ class Application(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["opportunity", "volunteer"], name="unique_application_per_volunteer")
         ]
+        indexes = [
+            models.Index(fields=["status", "applied_at"], name="application_status_idx"),
+            models.Index(fields=["applied_at"], name="application_applied_idx"),
+            models.Index(fields=["volunteer", "updated_at", "id"], name="application_sync_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Application<{self.id}> {self.volunteer.user.username} -> {self.opportunity.title} ({self.status})"
@@ -89,6 +193,52 @@ class HourLog(models.Model):
     note = models.CharField(max_length=255, blank=True, default="")
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["work_date"], name="hour_log_work_date_idx"),
+        ]
+
+
+class LeaderboardEntry(models.Model):
+    """A volunteer's total logged hours within a leaderboard scope. Maintained by core.signals."""
+    scope = models.CharField(max_length=32)  # "global", "org:<id>" or "month:YYYY-MM"
+    volunteer = models.ForeignKey(VolunteerProfile, on_delete=models.CASCADE, related_name="leaderboard_entries")
+    hours = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "volunteer"], name="unique_leaderboard_entry")
+        ]
+        indexes = [
+            models.Index(fields=["scope", "-hours", "volunteer"], name="leaderboard_rank_idx"),
+        ]
+
+
+class LeaderboardBucket(models.Model):
+    """How many volunteers of a scope have exactly `hours` logged. Maintained with LeaderboardEntry."""
+    scope = models.CharField(max_length=32)
+    hours = models.DecimalField(max_digits=10, decimal_places=2)
+    volunteers = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "hours"], name="unique_leaderboard_bucket")
+        ]
+
+
+class Tombstone(models.Model):
+    """A deleted row, kept so change feeds can report the deletion (see core/sync.py)."""
+    model = models.CharField(max_length=32)
+    object_id = models.BigIntegerField()
+    owner_id = models.BigIntegerField(null=True, blank=True)  # scopes per-user feeds (e.g. the application's volunteer)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["model", "deleted_at", "object_id"], name="tombstone_feed_idx"),
+            models.Index(fields=["model", "owner_id", "deleted_at", "object_id"], name="tombstone_owner_idx"),
+        ]
+
 
 class Feedback(models.Model):
     application = models.OneToOneField(Application, on_delete=models.CASCADE, related_name="feedback")
@@ -106,5 +256,12 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            # Per-user inbox (me/notifications/) and the admin's date filter
+            models.Index(fields=["user", "-created_at"], name="notification_user_idx"),
+            models.Index(fields=["created_at"], name="notification_created_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"Notification<{self.user_id}> {self.title}"
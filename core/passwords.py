@@ -0,0 +1,41 @@
+"""Password hashing spread over worker processes, for bulk imports. Imports no models: workers load it before Django is set up."""
+
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+# Below this many passwords, starting work in the pool costs more than it saves.
+MIN_POOL_PASSWORDS = 8
+
+
+def _setup_worker(settings_module: str) -> None:
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+
+
+@cache
+def _pool() -> ProcessPoolExecutor:
+    pool = ProcessPoolExecutor(
+        max_workers=settings.IMPORT_HASH_WORKERS,
+        # not fork: a forked child could inherit a lock held by another thread of the web process
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=_setup_worker,
+        initargs=(settings.SETTINGS_MODULE,),
+    )
+    atexit.register(pool.shutdown, cancel_futures=True)
+    return pool
+
+
+def hash_passwords(passwords: list) -> list:
+    """make_password for each password, spread over IMPORT_HASH_WORKERS processes when worthwhile."""
+    if settings.IMPORT_HASH_WORKERS <= 1 or len(passwords) < MIN_POOL_PASSWORDS:
+        return [make_password(p) for p in passwords]
+    chunksize = max(1, len(passwords) // (settings.IMPORT_HASH_WORKERS * 4))
+    return list(_pool().map(make_password, passwords, chunksize=chunksize))
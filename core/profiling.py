@@ -0,0 +1,139 @@
+"""Opt-in profiling of single requests (see core.middleware.ProfilingMiddleware)."""
+
+import json
+import os
+import pstats
+import re
+import sys
+import time
+from pathlib import Path
+
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+HEADER = "HTTP_X_PROFILE"
+QUERY_FLAG = "_profile"
+ID_RE = re.compile(r"^\d+-\d+$")
+
+# (component, path fragments); first match wins.
+COMPONENTS = (
+    ("geocoding", ("/core/services.py", "/geopy/")),
+    ("serializer", ("/core/serializers.py", "/rest_framework/serializers.py", "/rest_framework/fields.py", "/rest_framework/relations.py")),
+    ("rendering", ("/core/renderers.py", "/rest_framework/renderers.py", "/json/", "orjson")),
+    ("orm", ("/django/db/", "/psycopg", "sqlite3")),
+)
+
+_jwt = JWTAuthentication()
+
+
+def requested(request) -> bool:
+    return request.META.get(HEADER) == "1" or request.GET.get(QUERY_FLAG) == "1"
+
+
+def staff_user(request):
+    """The JWT-authenticated user of `request` if they are staff, else None."""
+    try:
+        credentials = _jwt.authenticate(request)
+    except Exception:
+        return None
+    user = credentials[0] if credentials else None
+    return user if user is not None and user.is_staff else None
+
+
+def _short(filename: str) -> str:
+    for marker in ("site-packages/", str(settings.BASE_DIR) + os.sep):
+        if marker in filename:
+            return filename.split(marker, 1)[1]
+    return filename.removeprefix(sys.prefix + os.sep)
+
+
+def _label(func) -> str:
+    filename, line, name = func
+    return f"{_short(filename)}:{line}({name})" if line else name
+
+
+def _component(filename: str) -> str:
+    for component, fragments in COMPONENTS:
+        if any(fragment in filename for fragment in fragments):
+            return component
+    return "other"
+
+
+def summarize(stats: pstats.Stats, top: int) -> dict:
+    components = {}
+    for (filename, _, name), (_, _, tottime, _, _) in stats.stats.items():
+        component = _component(filename if filename != "~" else name)
+        components[component] = components.get(component, 0.0) + tottime
+    hot = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+    return {
+        "components_ms": {name: round(seconds * 1000, 3) for name, seconds in sorted(components.items(), key=lambda c: -c[1])},
+        "hot": [
+            {
+                "function": _label(func),
+                "calls": calls,
+                "tottime_ms": round(tottime * 1000, 3),
+                "cumtime_ms": round(cumtime * 1000, 3),
+                "callers": [_label(caller) for caller, _ in sorted(callers.items(), key=lambda c: -c[1][3])[:3]],
+            }
+            for func, (_, calls, tottime, cumtime, callers) in hot
+        ],
+    }
+
+
+def directory() -> Path:
+    path = Path(settings.PROFILING_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def save(profiler, request, response, user, duration: float) -> str:
+    """Store one profiled request; returns its id."""
+    profile_id = f"{time.time_ns()}-{os.getpid()}"
+    path = directory()
+    stats = pstats.Stats(profiler)
+    record = {
+        "id": profile_id,
+        "method": request.method,
+        "path": request.get_full_path(),
+        "status": response.status_code,
+        "user": user.get_username(),
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - duration)),
+        "duration_ms": round(duration * 1000, 3),
+        **summarize(stats, settings.PROFILING_TOP),
+    }
+    stats.dump_stats(path / f"{profile_id}.prof")
+    tmp = path / f"{profile_id}.json.tmp"
+    tmp.write_text(json.dumps(record))
+    os.replace(tmp, path / f"{profile_id}.json")
+    evict(path)
+    return profile_id
+
+
+def evict(path: Path) -> None:
+    # Ids start with a fixed-width nanosecond timestamp, so name order is age order.
+    records = sorted(path.glob("*.json"))
+    for old in records[:-settings.PROFILING_BUFFER_SIZE]:
+        old.unlink(missing_ok=True)
+        old.with_suffix(".prof").unlink(missing_ok=True)
+
+
+def list_records() -> list[dict]:
+    """Stored records without their call details, newest first."""
+    records = []
+    for path in sorted(directory().glob("*.json"), reverse=True):
+        try:
+            record = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue  # evicted or being written concurrently
+        record.pop("hot", None)
+        records.append(record)
+    return records
+
+
+def load(profile_id: str):
+    if not ID_RE.match(profile_id):
+        return None
+    try:
+        return json.loads((directory() / f"{profile_id}.json").read_text())
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,53 @@
+"""Denormalized organization rating aggregates."""
+
+from django.db import transaction
+from django.db.models import Count, F, FloatField, Q, Sum
+from django.db.models.functions import Cast, NullIf
+
+STARS = range(1, 6)
+
+
+def apply_rating(org_model, org_id, rating: int, sign: int) -> None:
+    """Add (sign=+1) or remove (sign=-1) one `rating` from an organization's aggregates."""
+    if org_id is None or rating not in STARS:
+        return
+    new_count = F("rating_count") + sign
+    new_sum = F("rating_sum") + sign * rating
+    org_model.objects.filter(pk=org_id).update(
+        rating_count=new_count,
+        rating_sum=new_sum,
+        rating_average=Cast(new_sum, FloatField()) / NullIf(new_count, 0),
+        **{f"rating_{rating}": F(f"rating_{rating}") + sign},
+    )
+
+
+def rebuild(org_model, feedback_model, batch_size: int = 1000) -> int:
+    """Recompute every organization's aggregates from Feedback. Returns the number of organizations updated."""
+    stats = {
+        row["organization"]: row
+        for row in feedback_model.objects.values("organization").annotate(
+            count=Count("id"),
+            total=Sum("rating"),
+            **{f"stars_{i}": Count("id", filter=Q(rating=i)) for i in STARS},
+        )
+    }
+    fields = ["rating_count", "rating_sum", "rating_average"] + [f"rating_{i}" for i in STARS]
+    updated = 0
+    with transaction.atomic():
+        batch = []
+        for org in org_model.objects.only("pk").iterator(chunk_size=batch_size):
+            row = stats.get(org.pk, {})
+            org.rating_count = row.get("count", 0)
+            org.rating_sum = row.get("total") or 0
+            org.rating_average = org.rating_sum / org.rating_count if org.rating_count else None
+            for i in STARS:
+                setattr(org, f"rating_{i}", row.get(f"stars_{i}", 0))
+            batch.append(org)
+            if len(batch) >= batch_size:
+                org_model.objects.bulk_update(batch, fields)
+                updated += len(batch)
+                batch = []
+        if batch:
+            org_model.objects.bulk_update(batch, fields)
+            updated += len(batch)
+    return updated
@@ -1,11 +1,88 @@
+from datetime import date as date_type
+from functools import cache
+
+from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
-from rest_framework import serializers
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 from .models import (
     User, VolunteerProfile, OrganizationProfile,
     Opportunity, Application, Notification, HourLog, Feedback
 )
 from .services import geocode_location
 
+def _lookups(field) -> tuple:
+    """ORM lookups a field reads; fields with `values_columns` read several columns under their source."""
+    base = "__".join(field.source_attrs)
+    columns = getattr(field, "values_columns", None)
+    if columns is None:
+        return (base,)
+    return tuple(f"{base}__{column}" if base else column for column in columns)
+
+
+@cache
+def readable_fields(serializer_class) -> list:
+    """(name, ORM lookups, bound field) for every readable field of `serializer_class`."""
+    return [
+        (name, _lookups(field), field)
+        for name, field in serializer_class().fields.items()
+        if not field.write_only
+    ]
+
+
+class RatingSummaryField(serializers.Field):
+    """
+    Read-only {"count", "average", "distribution"} built from the denormalized
+    rating columns on OrganizationProfile (see core/ratings.py). `source` is
+    the organization ("*" on the organization serializer itself).
+    """
+    values_columns = ["rating_count", "rating_average"] + [f"rating_{i}" for i in range(1, 6)]
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, org):
+        return self.from_values([getattr(org, column) for column in self.values_columns])
+
+    def from_values(self, values):
+        count, average, *distribution = values
+        return {
+            "count": count,
+            "average": round(average, 2) if average is not None else None,
+            "distribution": {str(i): n for i, n in enumerate(distribution, start=1)},
+        }
+
+
+class RemainingSlotsField(serializers.Field):
+    """Read-only free slots of an opportunity (None when it has no capacity), from its own columns."""
+    values_columns = ["capacity", "accepted_count"]
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        kwargs.setdefault("source", "*")
+        super().__init__(**kwargs)
+
+    def to_representation(self, opportunity):
+        return self.from_values([opportunity.capacity, opportunity.accepted_count])
+
+    def from_values(self, values):
+        capacity, accepted = values
+        return None if capacity is None else max(capacity - accepted, 0)
+
+
+class SparseFieldsMixin:
+    """Drop every field not listed in context["fields"] (set by views from `?fields=`)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.context.get("fields")
+        if requested:
+            for name in set(self.fields) - set(requested):
+                self.fields.pop(name)
+
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -37,23 +114,30 @@ class VolunteerProfileSerializer(serializers.ModelSerializer):
 
 class OrganizationProfileSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
+    rating = RatingSummaryField(source="*")
 
     class Meta:
         model = OrganizationProfile
-        fields = ["id", "user", "name", "mission", "contact_phone", "location_text", "latitude", "longitude"]
+        fields = ["id", "user", "name", "mission", "contact_phone", "location_text", "latitude", "longitude", "rating"]
 
     def update(self, instance, validated_data):
+        update_fields = []
         for f in ["name", "mission", "contact_phone"]:
             if f in validated_data:
                 setattr(instance, f, validated_data[f])
+                update_fields.append(f)
 
         if "location_text" in validated_data:
             instance.location_text = validated_data["location_text"]
             lat, lng = geocode_location(instance.location_text)
             instance.latitude = lat
             instance.longitude = lng
+            update_fields += ["location_text", "latitude", "longitude"]
 
-        instance.save()
+        # Leave the rating columns alone: core.ratings updates them in place and
+        # the values loaded with `instance` may be stale.
+        if update_fields:
+            instance.save(update_fields=update_fields)
         return instance
 
 
@@ -123,19 +207,33 @@ class RegisterOrgSerializer(serializers.Serializer):
         return user
 
 
-class OpportunitySerializer(serializers.ModelSerializer):
+class OpportunitySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     organization_name = serializers.CharField(source="organization.name", read_only=True)
+    organization_rating = RatingSummaryField(source="organization")
+    remaining_slots = RemainingSlotsField()
 
     class Meta:
         model = Opportunity
         fields = [
-            "id", "organization", "organization_name",
+            "id", "organization", "organization_name", "organization_rating",
             "title", "description", "required_skills",
             "location_text", "latitude", "longitude",
-            "start_date", "end_date", "created_at",
+            "start_date", "end_date", "created_at", "capacity", "remaining_slots",
         ]
         read_only_fields = ["organization", "latitude", "longitude", "created_at"]
 
+    def validate(self, attrs):
+        start = attrs.get("start_date", getattr(self.instance, "start_date", None))
+        end = attrs.get("end_date", getattr(self.instance, "end_date", None))
+        if start and end:
+            if end < start:
+                raise serializers.ValidationError({"end_date": "Must not be before start_date."})
+            if (end - start).days + 1 > settings.OPPORTUNITY_MAX_DAYS:
+                raise serializers.ValidationError(
+                    {"end_date": f"An opportunity may span at most {settings.OPPORTUNITY_MAX_DAYS} days."}
+                )
+        return attrs
+
     def create(self, validated_data):
         request = self.context["request"]
         org_profile = request.user.org_profile
@@ -151,15 +249,22 @@ class OpportunitySerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
     def update(self, instance, validated_data):
+        # Save only the edited columns: accepted_count and archived_at are changed by
+        # conditional UPDATEs elsewhere, and the values loaded with `instance` may be stale.
+        update_fields = [*validated_data, "updated_at"]
         if "location_text" in validated_data:
             loc = validated_data["location_text"]
             lat, lng = geocode_location(loc) if loc else (None, None)
             instance.latitude = lat
             instance.longitude = lng
-        return super().update(instance, validated_data)
+            update_fields += ["latitude", "longitude"]
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=update_fields)
+        return instance
 
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ApplicationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     opportunity_title = serializers.CharField(source="opportunity.title", read_only=True)
     org_name = serializers.CharField(source="opportunity.organization.name", read_only=True)
 
@@ -175,13 +280,13 @@ class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
         fields = ["status"]
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Notification
         fields = ["id", "type", "title", "message", "is_read", "created_at"]
 
 
-class HourLogSerializer(serializers.ModelSerializer):
+class HourLogSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = HourLog
         fields = ["id", "application", "work_date", "hours", "note", "created_at"]
@@ -197,3 +302,108 @@ class FeedbackSerializer(serializers.ModelSerializer):
         model = Feedback
         fields = ["id", "application", "organization", "rating", "comment", "created_at"]
         read_only_fields = ["organization", "created_at"]
+
+
+class BatchItemSerializer(serializers.Serializer):
+    method = serializers.ChoiceField(choices=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    path = serializers.CharField()
+    body = serializers.JSONField(required=False)
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = BatchItemSerializer(many=True, allow_empty=False)
+    parallel = serializers.BooleanField(default=False)
+
+    def validate_requests(self, value):
+        limit = settings.BATCH_MAX_REQUESTS
+        if len(value) > limit:
+            raise serializers.ValidationError(f"At most {limit} requests per batch.")
+        return value
+
+
+class ValuesSerializer:
+    """
+    Read-only fast path for list endpoints.
+
+    Projects a queryset with a single `.values()` query (joined names included,
+    e.g. `organization.name` -> `organization__name`) and turns each row into the
+    same dict `serializer_class` would produce, without building model instances
+    or running the per-field `get_attribute` machinery.
+    """
+
+    # Fields whose DRF representation of a database value is the value itself.
+    PASSTHROUGH_FIELDS = (
+        serializers.CharField, serializers.IntegerField, serializers.FloatField,
+        serializers.BooleanField, serializers.JSONField, serializers.PrimaryKeyRelatedField,
+    )
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+
+    @property
+    def fields(self) -> list:
+        # Resolved lazily: ModelSerializer fields need the app registry.
+        return readable_fields(self.serializer_class)
+
+    def lookups(self, fields=None) -> list[str]:
+        return [lookup for name, lookups, _ in self.fields if fields is None or name in fields for lookup in lookups]
+
+    def converter(self, field, tz):
+        if hasattr(field, "values_columns"):
+            return field.from_values
+        if isinstance(field, self.PASSTHROUGH_FIELDS):
+            return None
+        if isinstance(field, serializers.DateTimeField) and getattr(field, "format", api_settings.DATETIME_FORMAT) == ISO_8601:
+            field_tz = field.timezone if hasattr(field, "timezone") else tz
+
+            def to_iso(value):
+                if field_tz is None or timezone.is_naive(value):
+                    return field.to_representation(value)
+                value = value.astimezone(field_tz).isoformat()
+                return value[:-6] + "Z" if value.endswith("+00:00") else value
+            return to_iso
+        if isinstance(field, serializers.DateField) and getattr(field, "format", api_settings.DATE_FORMAT) == ISO_8601:
+            return date_type.isoformat
+        return field.to_representation
+
+    def compile(self, fields=None):
+        """
+        (name, lookup, convert) per field; the current timezone is resolved once
+        per call. Multi-column fields get a tuple of lookups.
+        """
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        return [
+            (name, lookups[0] if not hasattr(field, "values_columns") else lookups, self.converter(field, tz))
+            for name, lookups, field in self.fields
+            if fields is None or name in fields
+        ]
+
+    def serialize(self, queryset, fields=None) -> list[dict]:
+        """Serialize `queryset`, optionally restricted to the field names in `fields`."""
+        plan = self.compile(fields)
+        out = []
+        for row in queryset.values(*self.lookups(fields)):
+            item = {}
+            for name, lookup, convert in plan:
+                if type(lookup) is tuple:
+                    item[name] = convert([row[column] for column in lookup])
+                    continue
+                value = row[lookup]
+                item[name] = value if convert is None or value is None else convert(value)
+            out.append(item)
+        return out
+
+    async def aserialize(self, queryset, fields=None) -> list[dict]:
+        """`serialize()` over the async ORM."""
+        plan = self.compile(fields)
+        out = []
+        async for row in queryset.values(*self.lookups(fields)):
+            item = {}
+            for name, lookup, convert in plan:
+                if type(lookup) is tuple:
+                    item[name] = convert([row[column] for column in lookup])
+                    continue
+                value = row[lookup]
+                item[name] = value if convert is None or value is None else convert(value)
+            out.append(item)
+        return out
@@ -1,16 +1,26 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from datetime import date, time, timedelta
+from functools import cache
 from math import radians, sin, cos, sqrt, atan2
 from typing import Optional, Tuple
-from geopy.geocoders import Nominatim
+from django.db.models import DurationField, ExpressionWrapper, F, Q
+from django.db.models.functions import ExtractIsoWeekDay
+from django.db.models.lookups import GreaterThan, GreaterThanOrEqual, LessThanOrEqual
 
-_geolocator = Nominatim(user_agent="volunteers_api")
+
+@cache
+def geolocator():
+    # geopy (and its HTTP adapter) is imported on first geocode, not at worker boot.
+    from geopy.geocoders import Nominatim
+
+    return Nominatim(user_agent="volunteers_api")
 
 def geocode_location(text: str) -> Tuple[Optional[float], Optional[float]]:
     if not text:
         return (None, None)
     try:
-        loc = _geolocator.geocode(text, timeout=10)
+        loc = geolocator().geocode(text, timeout=10)
         if not loc:
             return (None, None)
         return (float(loc.latitude), float(loc.longitude))
@@ -24,3 +34,114 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     a = sin(dlat / 2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2)**2
     c = 2 * atan2(sqrt(a), sqrt(1 - a))
     return R * c
+
+WEEKDAYS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+
+
+@dataclass(frozen=True)
+class ParsedAvailability:
+    ranges: list  # [(start_date, end_date)], merged and sorted
+    slots: list   # [(weekday 0=Mon, start_time, end_time)]
+
+
+def _parse_date(value) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _parse_slot(value) -> Optional[Tuple[time, time]]:
+    try:
+        start, end = str(value).split("-")
+        start_t, end_t = time.fromisoformat(start.strip()), time.fromisoformat(end.strip())
+    except ValueError:
+        return None
+    return (start_t, end_t) if start_t < end_t else None
+
+
+def merge_ranges(ranges) -> list:
+    """Sort and coalesce overlapping or adjacent (start, end) date ranges."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and (start - merged[-1][1]).days <= 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def parse_availability(data) -> ParsedAvailability:
+    """
+    Derive structured availability from the free-form `VolunteerProfile.availability` JSON.
+
+    Understood keys (anything else is ignored):
+      "ranges":   [{"start": "2025-12-01", "end": "2025-12-31"}, ["2026-01-05", "2026-01-09"], ...]
+      "dates":    ["2025-12-24", ...]                        single days
+      "weekdays": {"sat": ["09:00-12:00"], "sun": []} or ["sat", "sun"]   (empty/list = whole day)
+    """
+    if not isinstance(data, dict):
+        return ParsedAvailability([], [])
+
+    ranges = []
+    for item in data.get("ranges") or []:
+        if isinstance(item, dict):
+            start, end = _parse_date(item.get("start")), _parse_date(item.get("end", item.get("start")))
+        elif isinstance(item, (list, tuple)) and len(item) == 2:
+            start, end = _parse_date(item[0]), _parse_date(item[1])
+        else:
+            continue
+        if start and end and start <= end:
+            ranges.append((start, end))
+    for item in data.get("dates") or []:
+        day = _parse_date(item)
+        if day:
+            ranges.append((day, day))
+
+    weekdays = data.get("weekdays") or {}
+    if isinstance(weekdays, list):
+        weekdays = {day: [] for day in weekdays}
+    slots = []
+    if isinstance(weekdays, dict):
+        for name, times in weekdays.items():
+            weekday = WEEKDAYS.get(str(name).strip().lower()[:3])
+            if weekday is None:
+                continue
+            parsed = [_parse_slot(t) for t in times] if isinstance(times, list) and times else [(time.min, time.max)]
+            slots.extend((weekday, start, end) for start, end in filter(None, parsed))
+
+    return ParsedAvailability(merge_ranges(ranges), sorted(set(slots)))
+
+
+def covers_weekday_q(weekday: int) -> Q:
+    """Q matching opportunities with at least one day on `weekday` (0=Monday)."""
+    first, last = ExtractIsoWeekDay("start_date"), ExtractIsoWeekDay("end_date")
+    span = ExpressionWrapper(F("end_date") - F("start_date"), output_field=DurationField())
+    day = weekday + 1  # ISO weekdays are 1-7
+    within = Q(LessThanOrEqual(first, last), LessThanOrEqual(first, day), GreaterThanOrEqual(last, day))
+    wrapping = Q(GreaterThan(first, last)) & (Q(LessThanOrEqual(first, day)) | Q(GreaterThanOrEqual(last, day)))
+    # Shorter than a week, the range covers the days from its first weekday to its last, wrapping past Sunday.
+    return Q(GreaterThanOrEqual(span, timedelta(days=6))) | within | wrapping
+
+
+def availability_overlap_q(volunteer) -> Q:
+    """
+    Q matching opportunities whose [start_date, end_date] overlaps any of the
+    volunteer's availability ranges or includes a weekday of one of their
+    weekly slots (opportunities have no times, so only the weekday counts).
+    The (few, merged) ranges come from the indexed AvailabilityRange table;
+    each becomes one range predicate served by `opportunity_dates_idx`.
+    No ranges and no slots means nothing matches.
+    """
+    from .models import AvailabilityRange, AvailabilitySlot
+
+    ranges = merge_ranges(
+        AvailabilityRange.objects.filter(volunteer=volunteer).values_list("start_date", "end_date")
+    )
+    weekdays = set(AvailabilitySlot.objects.filter(volunteer=volunteer).values_list("weekday", flat=True))
+    condition = Q(pk__in=[])
+    for start, end in ranges:
+        condition |= Q(end_date__gte=start, start_date__lte=end)
+    for weekday in sorted(weekdays):
+        condition |= covers_weekday_q(weekday)
+    return condition
@@ -0,0 +1,214 @@
+from datetime import date
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import applications, autocomplete, calendar_index, dashboard, leaderboard, ratings, sync
+from .models import (
+    Application, Feedback, HourLog, LeaderboardBucket, LeaderboardEntry, Opportunity, OpportunityCalendarDay,
+    OrganizationProfile, Tombstone, VolunteerProfile,
+)
+
+CALENDAR_FIELDS = ("start_date", "end_date", "required_skills", "location_text")
+
+
+def _calendar_keys(values: dict):
+    return calendar_index.calendar_keys(*(values[f] for f in CALENDAR_FIELDS))
+
+
+# Opportunity calendar counters
+
+@receiver(pre_save, sender=Opportunity)
+def remember_calendar_keys(sender, instance, raw=False, update_fields=None, **kwargs):
+    old = None
+    if update_fields is not None and not set(update_fields) & set(CALENDAR_FIELDS):
+        instance._calendar_skip = True
+        return
+    instance._calendar_skip = False
+    if instance.pk and not raw:
+        old = Opportunity.objects.filter(pk=instance.pk).values(*CALENDAR_FIELDS).first()
+    instance._calendar_old = old
+
+
+@receiver(post_save, sender=Opportunity)
+def update_calendar_on_save(sender, instance, raw=False, **kwargs):
+    if raw or getattr(instance, "_calendar_skip", False):
+        return
+    old = getattr(instance, "_calendar_old", None)
+    new = {f: getattr(instance, f) for f in CALENDAR_FIELDS}
+    if old is not None:
+        if _calendar_keys(old) == _calendar_keys(new):
+            return
+        calendar_index.apply_delta(OpportunityCalendarDay, _calendar_keys(old), -1)
+    calendar_index.apply_delta(OpportunityCalendarDay, _calendar_keys(new), +1)
+
+
+@receiver(post_delete, sender=Opportunity)
+def update_calendar_on_delete(sender, instance, **kwargs):
+    calendar_index.apply_delta(OpportunityCalendarDay, _calendar_keys({f: getattr(instance, f) for f in CALENDAR_FIELDS}), -1)
+
+
+# Autocomplete indexes (in-process; applied once the write is committed)
+
+def _autocomplete_change(old, new):
+    transaction.on_commit(partial(autocomplete.apply_change, *old, *new))
+
+
+@receiver(post_save, sender=Opportunity)
+def update_autocomplete_for_opportunity(sender, instance, raw=False, **kwargs):
+    # Reuses the pre-save state remember_calendar_keys loaded (it covers both fields).
+    if raw or getattr(instance, "_calendar_skip", False):
+        return
+    old = getattr(instance, "_calendar_old", None) or {}
+    _autocomplete_change(
+        (old.get("required_skills"), old.get("location_text")), (instance.required_skills, instance.location_text)
+    )
+
+
+@receiver(pre_save, sender=VolunteerProfile)
+@receiver(pre_save, sender=OrganizationProfile)
+def remember_autocomplete_values(sender, instance, raw=False, **kwargs):
+    old = None
+    if instance.pk and not raw:
+        fields = ("skills", "location_text") if sender is VolunteerProfile else ("location_text",)
+        old = sender.objects.filter(pk=instance.pk).values(*fields).first()
+    instance._autocomplete_old = old or {}
+
+
+@receiver(post_save, sender=VolunteerProfile)
+@receiver(post_save, sender=OrganizationProfile)
+def update_autocomplete_for_profile(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old = getattr(instance, "_autocomplete_old", {})
+    _autocomplete_change(
+        (old.get("skills"), old.get("location_text")), (getattr(instance, "skills", None), instance.location_text)
+    )
+
+
+@receiver(post_delete, sender=Opportunity)
+@receiver(post_delete, sender=VolunteerProfile)
+@receiver(post_delete, sender=OrganizationProfile)
+def update_autocomplete_on_delete(sender, instance, **kwargs):
+    skills = instance.required_skills if sender is Opportunity else getattr(instance, "skills", None)
+    _autocomplete_change((skills, instance.location_text), (None, None))
+
+
+# Org dashboard cache
+# Dropped after commit: dropped earlier, a concurrent read could cache the pre-commit numbers again.
+
+@receiver([post_save, post_delete], sender=Opportunity)
+@receiver([post_save, post_delete], sender=Feedback)
+def invalidate_dashboard_for_org(sender, instance, **kwargs):
+    transaction.on_commit(partial(dashboard.invalidate, instance.organization_id))
+
+
+@receiver([post_save, post_delete], sender=Application)
+def invalidate_dashboard_for_application(sender, instance, **kwargs):
+    org_id = Opportunity.objects.filter(pk=instance.opportunity_id).values_list("organization_id", flat=True).first()
+    transaction.on_commit(partial(dashboard.invalidate, org_id))
+
+
+@receiver([post_save, post_delete], sender=HourLog)
+def invalidate_dashboard_for_hour_log(sender, instance, **kwargs):
+    org_id = Application.objects.filter(pk=instance.application_id).values_list(
+        "opportunity__organization_id", flat=True
+    ).first()
+    transaction.on_commit(partial(dashboard.invalidate, org_id))
+
+
+# Opportunity capacity
+
+@receiver(post_delete, sender=Application)
+def release_slot_on_delete(sender, instance, **kwargs):
+    if instance.status == Application.Status.ACCEPTED:
+        applications.release_slot(instance.opportunity_id)
+
+
+# Change feed tombstones
+
+@receiver(post_delete, sender=Opportunity)
+def record_opportunity_deletion(sender, instance, **kwargs):
+    sync.record_deletion(Tombstone, "opportunity", instance.pk)
+
+
+@receiver(post_delete, sender=Application)
+def record_application_deletion(sender, instance, **kwargs):
+    sync.record_deletion(Tombstone, "application", instance.pk, owner_id=instance.volunteer_id)
+
+
+# Leaderboards
+
+def _hour_log_state(application_id, work_date, hours):
+    volunteer_id, org_id = Application.objects.filter(pk=application_id).values_list(
+        "volunteer_id", "opportunity__organization_id"
+    ).first() or (None, None)
+    if isinstance(work_date, str):
+        work_date = date.fromisoformat(work_date)
+    return volunteer_id, leaderboard.scopes_for(org_id, work_date), hours
+
+
+@receiver(pre_save, sender=HourLog)
+def remember_hour_log(sender, instance, raw=False, **kwargs):
+    old = None
+    if instance.pk and not raw:
+        old = HourLog.objects.filter(pk=instance.pk).values_list("application_id", "work_date", "hours").first()
+    instance._leaderboard_old = old
+
+
+@receiver(post_save, sender=HourLog)
+def update_leaderboards_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old = getattr(instance, "_leaderboard_old", None)
+    if old == (instance.application_id, instance.work_date, instance.hours):
+        return
+    if old is not None:
+        volunteer_id, scopes, hours = _hour_log_state(*old)
+        leaderboard.apply_delta(LeaderboardEntry, LeaderboardBucket, volunteer_id, scopes, -hours)
+    volunteer_id, scopes, hours = _hour_log_state(instance.application_id, instance.work_date, instance.hours)
+    leaderboard.apply_delta(LeaderboardEntry, LeaderboardBucket, volunteer_id, scopes, hours)
+
+
+@receiver(post_delete, sender=HourLog)
+def update_leaderboards_on_delete(sender, instance, **kwargs):
+    volunteer_id, scopes, hours = _hour_log_state(instance.application_id, instance.work_date, instance.hours)
+    if volunteer_id is not None:
+        leaderboard.apply_delta(LeaderboardEntry, LeaderboardBucket, volunteer_id, scopes, -hours)
+
+
+@receiver(pre_delete, sender=VolunteerProfile)
+def remove_from_leaderboards(sender, instance, **kwargs):
+    # Before the cascade: it deletes entries loaded when it started, with possibly stale hours.
+    leaderboard.remove_volunteer(LeaderboardEntry, LeaderboardBucket, instance.pk)
+
+
+# Organization rating aggregates
+
+@receiver(pre_save, sender=Feedback)
+def remember_feedback(sender, instance, raw=False, **kwargs):
+    old = None
+    if instance.pk and not raw:
+        old = Feedback.objects.filter(pk=instance.pk).values_list("organization_id", "rating").first()
+    instance._rating_old = old
+
+
+@receiver(post_save, sender=Feedback)
+def update_ratings_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old = getattr(instance, "_rating_old", None)
+    new = (instance.organization_id, int(instance.rating))
+    if old == new:
+        return
+    with transaction.atomic():
+        if old is not None:
+            ratings.apply_rating(OrganizationProfile, *old, sign=-1)
+        ratings.apply_rating(OrganizationProfile, *new, sign=+1)
+
+
+@receiver(post_delete, sender=Feedback)
+def update_ratings_on_delete(sender, instance, **kwargs):
+    ratings.apply_rating(OrganizationProfile, instance.organization_id, int(instance.rating), sign=-1)
@@ -1,8 +1,50 @@
-from django.test import TestCase
+import gzip
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from rest_framework.test import APITestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
-from .models import User, VolunteerProfile, OrganizationProfile, Opportunity
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config.database import tune_postgres
+from .admin import EstimatedCountPaginator
+from .applications import insert_ignore_conflict, rebuild_accepted_counts
+from .middleware import CompressionMiddleware, brotli, negotiate_encoding
+from .models import (
+    User, VolunteerProfile, OrganizationProfile, Opportunity, Application, HourLog, Notification, Feedback,
+    LeaderboardBucket, LeaderboardEntry, OpportunityCalendarDay, Tombstone,
+)
+from .passwords import MIN_POOL_PASSWORDS, hash_passwords
+from .renderers import FastJSONRenderer
+from .serializers import (
+    ApplicationSerializer, HourLogSerializer, NotificationSerializer, OpportunitySerializer,
+    OrganizationProfileSerializer, ValuesSerializer,
+)
+from . import (
+    archival, async_views, autocomplete, calendar_index, leaderboard, profiling, ratings, sync, throttling,
+)
 
 class SmokeTests(APITestCase):
     def test_register_volunteer_and_get_token(self):
@@ -43,3 +85,830 @@ class SmokeTests(APITestCase):
             "end_date": "2025-12-28"
         }, format="json")
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+
+# Fixtures shared by the feature tests below
+
+def make_org(**fields) -> OrganizationProfile:
+    user = User.objects.create_user(username="org", email="org@example.com", password="x", role=User.Role.ORG)
+    return OrganizationProfile.objects.create(user=user, name="Helping Hands", **fields)
+
+
+def make_volunteer(username="vol", **fields) -> VolunteerProfile:
+    user = User.objects.create_user(username=username, email=f"{username}@example.com", password="x")
+    return VolunteerProfile.objects.create(user=user, **fields)
+
+
+def make_opportunity(org, **fields) -> Opportunity:
+    """A one-day "Cleanup" on 2025-12-28 unless `fields` say otherwise."""
+    fields = {"title": "Cleanup", "description": "", "start_date": date(2025, 12, 28)} | fields
+    fields.setdefault("end_date", fields["start_date"])
+    return Opportunity.objects.create(organization=org, **fields)
+
+
+class DatabaseConfigTests(SimpleTestCase):
+    def test_pooling_disables_persistent_connections(self):
+        base = {"ENGINE": "django.db.backends.postgresql", "NAME": "x"}
+
+        pooled = tune_postgres(base, pool=True)
+        self.assertEqual(pooled["CONN_MAX_AGE"], 0)
+        self.assertIn("max_size", pooled["OPTIONS"]["pool"])
+
+        direct = tune_postgres(base, pool=False)
+        self.assertNotIn("pool", direct["OPTIONS"])
+        self.assertGreater(direct["CONN_MAX_AGE"], 0)
+
+    def test_sqlite_runs_in_wal_mode(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite only")
+        self.assertIn("journal_mode=WAL", connection.settings_dict["OPTIONS"]["init_command"])
+
+
+class ValuesSerializerTests(TestCase):
+    def setUp(self):
+        self.org = make_org()
+        self.vol = make_volunteer()
+        opp = make_opportunity(self.org, title="Beach Cleanup", description="Clean.", required_skills=["Cleanup"],
+                               latitude=10.5, end_date=date(2025, 12, 29))
+        app = Application.objects.create(opportunity=opp, volunteer=self.vol)
+        HourLog.objects.create(application=app, work_date=date(2025, 12, 28), hours=Decimal("3.5"))
+        Notification.objects.create(user=self.org.user, type="T", title="Hi", message="There")
+
+    def test_matches_model_serializer_output(self):
+        cases = [
+            (OpportunitySerializer, Opportunity.objects.select_related("organization")),
+            (ApplicationSerializer, Application.objects.select_related("opportunity__organization")),
+            (NotificationSerializer, Notification.objects.all()),
+            (HourLogSerializer, HourLog.objects.all()),
+        ]
+        renderer = JSONRenderer()
+        for serializer_class, qs in cases:
+            with self.subTest(serializer_class.__name__):
+                expected = renderer.render(serializer_class(qs, many=True).data)
+                self.assertEqual(renderer.render(ValuesSerializer(serializer_class).serialize(qs)), expected)
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_matches_stdlib_renderer(self):
+        data = {
+            "hours": Decimal("3.50"), "when": datetime(2025, 12, 28, 9, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            "day": date(2025, 12, 28), "label": gettext_lazy("Pending"), "text": "café  ", 1: [None, True],
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class CompressionMiddlewareTests(SimpleTestCase):
+    def test_negotiation(self):
+        self.assertEqual(negotiate_encoding("gzip, deflate"), "gzip")
+        self.assertIsNone(negotiate_encoding("identity"))
+        self.assertIsNone(negotiate_encoding("gzip;q=0"))
+        if brotli is not None:
+            self.assertEqual(negotiate_encoding("gzip, br"), "br")
+            self.assertEqual(negotiate_encoding("gzip;q=1, br;q=0.5"), "gzip")
+
+    @override_settings(COMPRESSION_MIN_SIZE=1024)
+    def test_compresses_only_above_threshold(self):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        body = b'{"a":"' + b"x" * 4096 + b'"}'
+        big = CompressionMiddleware(lambda r: HttpResponse(body, content_type="application/json"))(request)
+        small = CompressionMiddleware(lambda r: HttpResponse(b"{}", content_type="application/json"))(request)
+        self.assertEqual(big["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(big.content), body)
+        self.assertFalse(small.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", small["Vary"])
+
+
+class SparseFieldsetTests(APITestCase):
+    def setUp(self):
+        org = make_org()
+        self.org_user = org.user
+        self.opp = make_opportunity(org, title="Beach Cleanup", description="Clean the coastline.")
+        self.client.force_authenticate(self.org_user)
+
+    def test_list_only_reads_requested_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get("/api/opportunities/?include_past=1&fields=id,title,organization_name")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json(), [{"id": self.opp.id, "title": "Beach Cleanup", "organization_name": "Helping Hands"}])
+        select = [q["sql"] for q in ctx.captured_queries if "core_opportunity" in q["sql"]][-1]
+        self.assertNotIn("description", select)
+
+    def test_detail_and_unknown_fields(self):
+        res = self.client.get(f"/api/opportunities/{self.opp.id}/?fields=title,start_date")
+        self.assertEqual(res.json(), {"title": "Beach Cleanup", "start_date": "2025-12-28"})
+
+        res = self.client.get(f"/api/opportunities/{self.opp.id}/?fields=title,nope")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class BatchTests(APITestCase):
+    def setUp(self):
+        self.opp = make_opportunity(make_org(), title="Beach Cleanup", description="Clean.")
+        self.vol_user = make_volunteer().user
+        self.client.force_authenticate(self.vol_user)
+
+    def test_runs_subrequests_in_order(self):
+        res = self.client.post("/api/batch/", {"requests": [
+            {"method": "GET", "path": "/api/me/applications/"},
+            {"method": "POST", "path": f"/api/opportunities/{self.opp.id}/apply/"},
+            {"method": "GET", "path": "me/applications/?fields=id,opportunity_title"},
+            {"method": "GET", "path": "/api/nope/"},
+            {"method": "POST", "path": "/api/batch/", "body": {"requests": []}},
+        ]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        statuses = [r["status"] for r in res.json()["responses"]]
+        self.assertEqual(statuses, [200, 201, 200, 404, 400])
+        responses = res.json()["responses"]
+        self.assertEqual(responses[0]["body"], [])
+        self.assertEqual(responses[2]["body"][0]["opportunity_title"], "Beach Cleanup")
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(None)
+        res = self.client.post("/api/batch/", {"requests": [{"method": "GET", "path": "me/hours/"}]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AvailabilityTests(APITestCase):
+    def setUp(self):
+        self.org = make_org()
+        for title, start, end in [("Dec", date(2025, 12, 20), date(2025, 12, 22)),
+                                  ("Jan", date(2026, 1, 10), date(2026, 1, 12)),
+                                  ("Feb", date(2026, 2, 1), date(2026, 2, 3))]:
+            make_opportunity(self.org, title=title, start_date=start, end_date=end)
+        self.profile = make_volunteer(availability={
+            "ranges": [{"start": "2025-12-01", "end": "2025-12-20"}, ["2026-01-12", "2026-01-15"], {"start": "bad"}],
+            "weekdays": {"sat": ["09:00-12:00"], "Sunday": []},
+        })
+        self.vol_user = self.profile.user
+
+    def test_structured_rows_derived_on_save(self):
+        self.assertEqual(self.profile.availability_ranges.count(), 2)
+        self.assertEqual(sorted(self.profile.availability_slots.values_list("weekday", flat=True)), [5, 6])
+
+        self.profile.availability = {"dates": ["2026-02-02"]}
+        self.profile.save()
+        self.assertEqual(list(self.profile.availability_ranges.values_list("start_date", flat=True)), [date(2026, 2, 2)])
+        self.assertFalse(self.profile.availability_slots.exists())
+
+    def test_search_available_only(self):
+        self.client.force_authenticate(self.vol_user)
+        res = self.client.get("/api/opportunities/search/?available=1&include_past=1")
+        self.assertEqual(sorted(o["title"] for o in res.json()), ["Dec", "Feb", "Jan"])  # Feb 1 is a Sunday
+
+    def test_weekly_slots_match_opportunity_weekdays(self):
+        self.client.force_authenticate(self.vol_user)
+
+        def available(weekdays):
+            self.profile.availability = {"weekdays": weekdays}
+            self.profile.save()
+            return sorted(o["title"] for o in self.client.get("/api/opportunities/search/?available=1&include_past=1").json())
+
+        self.assertEqual(available(["tue"]), ["Feb"])  # Sun 1 - Tue 3 Feb
+        self.assertEqual(available(["sun"]), ["Dec", "Feb", "Jan"])  # Sat - Mon wraps past Sunday
+        self.assertEqual(available(["fri"]), [])
+        make_opportunity(self.org, title="Mon to Tue", start_date=date(2026, 3, 2), end_date=date(2026, 3, 10))
+        self.assertEqual(available(["fri"]), ["Mon to Tue"])  # over a week covers every weekday
+
+
+class OpportunityCalendarTests(APITestCase):
+    def setUp(self):
+        self.org = make_org()
+        self.client.force_authenticate(self.org.user)
+
+    def calendar(self, query=""):
+        return {d["date"]: d["count"] for d in self.client.get(f"/api/opportunities/calendar/?month=2025-12{query}").json()["days"]}
+
+    def test_counts_follow_saves_and_deletes(self):
+        a = make_opportunity(self.org, title="A", required_skills=["Cleanup"], location_text="Maracas Beach, Trinidad",
+                             start_date=date(2025, 12, 30), end_date=date(2026, 1, 2))
+        make_opportunity(self.org, title="B", required_skills=["FirstAid"], start_date=date(2025, 12, 31))
+        self.assertEqual(self.calendar(), {"2025-12-30": 1, "2025-12-31": 2})
+        self.assertEqual(self.calendar("&skill=cleanup&region=Trinidad"), {"2025-12-30": 1, "2025-12-31": 1})
+
+        a.start_date = date(2025, 12, 31)
+        a.save()
+        self.assertEqual(self.calendar(), {"2025-12-31": 2})
+        a.delete()
+        self.assertEqual(self.calendar(), {"2025-12-31": 1})
+
+        before = set(OpportunityCalendarDay.objects.filter(count__gt=0).values_list("day", "skill", "region", "count"))
+        calendar_index.rebuild(Opportunity, OpportunityCalendarDay)
+        self.assertEqual(set(OpportunityCalendarDay.objects.values_list("day", "skill", "region", "count")), before)
+
+    @override_settings(OPPORTUNITY_MAX_DAYS=31)
+    def test_date_range_is_validated(self):
+        def errors(start, end):
+            serializer = OpportunitySerializer(data={"start_date": start, "end_date": end}, partial=True)
+            return None if serializer.is_valid() else serializer.errors
+
+        self.assertIsNone(errors("2025-12-01", "2025-12-31"))
+        self.assertIn("end_date", errors("2025-12-02", "2025-12-01"))
+        self.assertIn("31 days", str(errors("2025-12-01", "2026-01-01")))
+        opp = make_opportunity(self.org, start_date=date(2025, 12, 1), end_date=date(2025, 12, 2))
+        serializer = OpportunitySerializer(opp, data={"end_date": "2026-12-01"}, partial=True)
+        self.assertFalse(serializer.is_valid())  # checked against the stored start_date
+
+
+class OrgDashboardTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.org = make_org()
+        self.org_user = self.org.user
+        self.opp = make_opportunity(self.org)
+        self.apps = [Application.objects.create(opportunity=self.opp, volunteer=make_volunteer(f"v{i}")) for i in range(3)]
+        self.apps[0].status = Application.Status.ACCEPTED
+        self.apps[0].save()
+        HourLog.objects.create(application=self.apps[0], work_date=date(2025, 12, 28), hours=Decimal("2.25"))
+        Feedback.objects.create(application=self.apps[0], organization=self.org, rating=4)
+        Notification.objects.create(user=self.org_user, type="T", title="t", message="m")
+        self.client.force_authenticate(self.org_user)
+
+    def test_aggregates_and_invalidation(self):
+        data = self.client.get("/api/me/org-dashboard/").json()
+        self.assertEqual(data["opportunities"][0]["applications"], {"PENDING": 2, "ACCEPTED": 1, "REJECTED": 0, "WAITLISTED": 0, "total": 3})
+        self.assertEqual(data["totals"]["hours_logged"], "2.25")
+        self.assertEqual(data["totals"]["average_rating"], 4.0)
+        self.assertEqual(data["unread_notifications"], 1)
+
+        with self.assertNumQueries(1):  # live unread count only; aggregates come from the cache
+            self.client.get("/api/me/org-dashboard/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            HourLog.objects.create(application=self.apps[0], work_date=date(2025, 12, 29), hours=Decimal("1"))
+            self.apps[1].status = Application.Status.REJECTED
+            self.apps[1].save()
+            data = self.client.get("/api/me/org-dashboard/").json()
+            self.assertEqual(data["totals"]["hours_logged"], "2.25")  # dropped only once the writes commit
+        data = self.client.get("/api/me/org-dashboard/").json()
+        self.assertEqual(data["totals"]["hours_logged"], "3.25")
+        self.assertEqual(data["totals"]["applications"]["REJECTED"], 1)
+
+
+class LeaderboardTests(APITestCase):
+    def setUp(self):
+        self.org = make_org()
+        opp = make_opportunity(self.org, start_date=date(2025, 12, 1), end_date=date(2026, 1, 31))
+        self.apps = [Application.objects.create(opportunity=opp, volunteer=make_volunteer(f"v{i}")) for i in range(3)]
+        self.users = [app.volunteer.user for app in self.apps]
+
+    def test_standings_follow_hour_logs(self):
+        HourLog.objects.create(application=self.apps[0], work_date=date(2025, 12, 5), hours=Decimal("2"))
+        HourLog.objects.create(application=self.apps[1], work_date=date(2026, 1, 5), hours=Decimal("5"))
+        log = HourLog.objects.create(application=self.apps[2], work_date=date(2025, 12, 6), hours=Decimal("1"))
+        log.hours = Decimal("3")
+        log.save()
+
+        self.client.force_authenticate(self.users[0])
+        data = self.client.get("/api/leaderboards/").json()
+        self.assertEqual([(r["username"], r["hours"]) for r in data["top"]], [("v1", "5.00"), ("v2", "3.00"), ("v0", "2.00")])
+        self.assertEqual(data["me"], {"rank": 3, "hours": "2.00"})
+
+        data = self.client.get("/api/leaderboards/?scope=month&month=2025-12").json()
+        self.assertEqual([r["username"] for r in data["top"]], ["v2", "v0"])
+        self.assertEqual(data["me"]["rank"], 2)
+
+        log.delete()
+        data = self.client.get(f"/api/leaderboards/?scope=org&org={self.org.id}").json()
+        self.assertEqual([r["username"] for r in data["top"]], ["v1", "v0"])
+
+        live = set(LeaderboardEntry.objects.filter(hours__gt=0).values_list("scope", "volunteer_id", "hours"))
+        buckets = set(LeaderboardBucket.objects.filter(volunteers__gt=0).values_list("scope", "hours", "volunteers"))
+        leaderboard.rebuild(HourLog, LeaderboardEntry, LeaderboardBucket)
+        self.assertEqual(set(LeaderboardEntry.objects.values_list("scope", "volunteer_id", "hours")), live)
+        self.assertEqual(set(LeaderboardBucket.objects.values_list("scope", "hours", "volunteers")), buckets)
+
+    def test_rank_sums_totals_above_and_counts_exact_ties(self):
+        for app, hours in zip(self.apps, ("7.5", "7.25", "9")):
+            HourLog.objects.create(application=app, work_date=date(2025, 12, 5), hours=Decimal(hours))
+        self.assertEqual(
+            set(LeaderboardBucket.objects.filter(scope="global").values_list("hours", "volunteers")),
+            {(Decimal("7.5"), 1), (Decimal("7.25"), 1), (Decimal("9"), 1)},
+        )
+        self.client.force_authenticate(self.users[1])
+        self.assertEqual(self.client.get("/api/leaderboards/").json()["me"], {"rank": 3, "hours": "7.25"})
+
+        self.users[2].delete()  # cascades to the volunteer's logs and entries
+        self.assertFalse(LeaderboardBucket.objects.filter(scope="global", hours=9, volunteers__gt=0).exists())
+        self.assertEqual(self.client.get("/api/leaderboards/").json()["me"]["rank"], 2)
+
+    def test_rank_among_many_volunteers_in_the_same_hour(self):
+        users = User.objects.bulk_create([User(username=f"c{i}", email=f"c{i}@example.com") for i in range(40)])
+        volunteers = VolunteerProfile.objects.bulk_create([VolunteerProfile(user=u) for u in users])
+        totals = {v.id: Decimal("1") + Decimal(i % 20) / 100 for i, v in enumerate(volunteers)}  # 1.00-1.19, two each
+        for volunteer_id, hours in totals.items():
+            leaderboard.apply_delta(LeaderboardEntry, LeaderboardBucket, volunteer_id, [leaderboard.GLOBAL], hours)
+        self.assertEqual(LeaderboardBucket.objects.filter(scope=leaderboard.GLOBAL).count(), 20)
+
+        standings = sorted(totals, key=lambda v: (-totals[v], v))
+        for position, volunteer_id in enumerate(standings, start=1):
+            with CaptureQueriesContext(connection) as queries:
+                me = leaderboard.rank(LeaderboardEntry, LeaderboardBucket, leaderboard.GLOBAL, volunteer_id)
+            self.assertEqual(me["rank"], position)
+        # The entry, the sum of totals above it and its one exact tie: no scan of the other 1.xx volunteers.
+        self.assertEqual(len(queries), 3)
+        self.assertIn('"hours" = ', queries[2]["sql"])
+
+
+class OrganizationRatingTests(APITestCase):
+    def setUp(self):
+        self.org = make_org()
+        self.opp = make_opportunity(self.org)
+        apps = [Application.objects.create(opportunity=self.opp, volunteer=make_volunteer(f"v{i}")) for i in range(3)]
+        self.vol_user = apps[0].volunteer.user
+        self.feedback = [Feedback.objects.create(application=a, organization=self.org, rating=r) for a, r in zip(apps, [5, 4, 4])]
+
+    def rating(self):
+        self.client.force_authenticate(self.vol_user)
+        return self.client.get("/api/opportunities/?include_past=1").json()[0]["organization_rating"]
+
+    def test_aggregates_follow_feedback(self):
+        self.assertEqual(self.rating(), {"count": 3, "average": 4.33, "distribution": {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1}})
+        self.feedback[0].rating = 1
+        self.feedback[0].save()
+        self.feedback[1].delete()
+        self.assertEqual(self.rating(), {"count": 2, "average": 2.5, "distribution": {"1": 1, "2": 0, "3": 0, "4": 1, "5": 0}})
+
+        OrganizationProfile.objects.update(rating_count=0, rating_sum=0, rating_average=None, rating_1=0, rating_4=0)
+        ratings.rebuild(OrganizationProfile, Feedback)
+        self.assertEqual(self.rating()["distribution"], {"1": 1, "2": 0, "3": 0, "4": 1, "5": 0})
+        self.assertEqual(self.rating()["average"], 2.5)
+
+    def test_profile_edit_keeps_new_ratings(self):
+        stale = OrganizationProfile.objects.get(pk=self.org.pk)
+        self.feedback[1].delete()
+        serializer = OrganizationProfileSerializer(stale, data={"mission": "Clean beaches"}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        self.org.refresh_from_db()
+        self.assertEqual((self.org.mission, self.org.rating_count, self.org.rating_4), ("Clean beaches", 2, 1))
+
+
+class AsyncViewTests(TestCase):
+    def setUp(self):
+        org = make_org()
+        self.org_user = org.user
+        self.opp = make_opportunity(org, title="Beach Cleanup", description="Clean.")
+        Notification.objects.create(user=self.org_user, type="T", title="Hi", message="There")
+
+    def auth(self, user):
+        return {"Authorization": f"Bearer {RefreshToken.for_user(user).access_token}"}
+
+    async def test_matches_sync_views(self):
+
+        headers = await sync_to_async(self.auth)(self.org_user)
+        factory = AsyncRequestFactory()
+        cases = [
+            (async_views.AsyncOpportunityListView, "/api/opportunities/?fields=id,title,organization_name", {}),
+            (async_views.AsyncOpportunitySearchView, "/api/opportunities/search/?search=beach", {}),
+            (async_views.AsyncMyNotificationsView, "/api/me/notifications/", {}),
+            (async_views.AsyncOpportunityDetailView, f"/api/opportunities/{self.opp.id}/", {"pk": self.opp.id}),
+        ]
+        client = APIClient()
+        await sync_to_async(client.force_authenticate)(self.org_user)
+        for view_class, url, kwargs in cases:
+            with self.subTest(view_class.__name__):
+                response = await view_class.as_view()(factory.get(url, headers=headers), **kwargs)
+                expected = await sync_to_async(client.get)(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(json.loads(response.content), expected.json())
+
+        response = await async_views.AsyncMyNotificationsView.as_view()(factory.get("/api/me/notifications/"))
+        self.assertEqual(response.status_code, 401)
+
+        # The browsable API is rendered by the sync view.
+        response = await async_views.AsyncMyNotificationsView.as_view()(
+            factory.get("/api/me/notifications/", headers={**headers, "Accept": "text/html"})
+        )
+        self.assertEqual((response.status_code, response["Content-Type"]), (200, "text/html; charset=utf-8"))
+
+    def test_asgi_middleware_needs_no_thread_adapter(self):
+        # config/asgi.py serves static files itself and drops the sync-only WhiteNoise middleware.
+        middleware = [m for m in settings.MIDDLEWARE if m != "whitenoise.middleware.WhiteNoiseMiddleware"]
+        with override_settings(MIDDLEWARE=middleware), self.assertNoLogs("django.request", "DEBUG"):
+            ASGIHandler()
+
+
+class ApplyTests(APITestCase):
+    def setUp(self):
+        self.opp = make_opportunity(make_org())
+        self.org_user = self.opp.organization.user
+        self.volunteer = make_volunteer()
+        self.vol_user = self.volunteer.user
+        self.client.force_authenticate(self.vol_user)
+
+    def test_apply_is_idempotent(self):
+        url = f"/api/opportunities/{self.opp.id}/apply/"
+        first = self.client.post(url)
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(first.json()["opportunity_title"], "Cleanup")
+        self.assertEqual(first.json()["org_name"], "Helping Hands")
+        second = self.client.post(url)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.json()["id"], first.json()["id"])
+        self.assertEqual(Application.objects.count(), 1)
+        self.assertEqual(Notification.objects.filter(user=self.org_user).count(), 1)
+        self.assertEqual(self.client.post("/api/opportunities/999999/apply/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_conflicting_insert_is_ignored(self):
+        now = timezone.now()
+        values = {"opportunity_id": self.opp.id, "volunteer_id": self.volunteer.id,
+                  "status": Application.Status.PENDING, "applied_at": now, "updated_at": now}
+        pk = insert_ignore_conflict(values)
+        self.assertEqual(Application.objects.get().pk, pk)
+        self.assertIsNone(insert_ignore_conflict(values))
+        self.assertEqual(Application.objects.get().applied_at, now)
+
+
+class CapacityTests(APITestCase):
+    def setUp(self):
+        self.opp = make_opportunity(make_org(), capacity=1)
+        self.org_user = self.opp.organization.user
+        volunteers = [make_volunteer(f"v{i}") for i in range(3)]
+        self.vols = [v.user for v in volunteers]
+        self.apps = [Application.objects.create(opportunity=self.opp, volunteer=v) for v in volunteers[:2]]
+
+    def set_status(self, app, value):
+        self.client.force_authenticate(self.org_user)
+        return self.client.patch(f"/api/applications/{app.id}/status/", {"status": value}, format="json").json()["status"]
+
+    def remaining(self):
+        self.client.force_authenticate(self.vols[0])
+        return self.client.get("/api/opportunities/search/?include_past=1").json()[0]["remaining_slots"]
+
+    def test_acceptance_respects_capacity(self):
+        self.assertEqual(self.remaining(), 1)
+        self.assertEqual(self.set_status(self.apps[0], "ACCEPTED"), "ACCEPTED")
+        self.assertEqual(self.set_status(self.apps[0], "ACCEPTED"), "ACCEPTED")
+        self.assertEqual(self.set_status(self.apps[1], "ACCEPTED"), "WAITLISTED")
+        self.assertEqual(self.remaining(), 0)
+
+        self.client.force_authenticate(self.vols[2])
+        applied = self.client.post(f"/api/opportunities/{self.opp.id}/apply/").json()
+        self.assertEqual(applied["status"], "WAITLISTED")
+
+        self.assertEqual(self.set_status(self.apps[0], "REJECTED"), "REJECTED")
+        self.assertEqual(self.remaining(), 1)
+        self.assertEqual(self.set_status(self.apps[1], "ACCEPTED"), "ACCEPTED")
+        Application.objects.get(pk=self.apps[1].pk).delete()
+        self.opp.refresh_from_db()
+        self.assertEqual(self.opp.accepted_count, 0)
+
+    def test_edit_does_not_overwrite_accepted_count(self):
+        stale = Opportunity.objects.get(pk=self.opp.pk)
+        self.assertEqual(self.set_status(self.apps[0], "ACCEPTED"), "ACCEPTED")
+        serializer = OpportunitySerializer(stale, data={"title": "Beach Cleanup"}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        self.opp.refresh_from_db()
+        self.assertEqual((self.opp.title, self.opp.accepted_count), ("Beach Cleanup", 1))
+        self.assertEqual(self.set_status(self.apps[1], "ACCEPTED"), "WAITLISTED")
+
+    def test_rebuild_accepted_counts(self):
+        Application.objects.filter(pk=self.apps[0].pk).update(status=Application.Status.ACCEPTED)
+        rebuild_accepted_counts()
+        self.assertEqual(self.remaining(), 0)
+
+
+class AdminTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username="admin", email="admin@example.com", password="x")
+        self.opp = make_opportunity(make_org())
+        self.client.force_login(self.admin)
+
+    def add_applications(self, n, start=0):
+        for i in range(start, start + n):
+            app = Application.objects.create(opportunity=self.opp, volunteer=make_volunteer(f"v{i}"))
+            HourLog.objects.create(application=app, work_date=date(2025, 12, 28), hours=Decimal("2"))
+            Notification.objects.create(user=app.volunteer.user, type="T", title="Hi", message="There")
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        for model in ("application", "hourlog", "notification"):
+            with self.subTest(model):
+                url = f"/admin/core/{model}/"
+                self.add_applications(2, start=Application.objects.count())
+                with CaptureQueriesContext(connection) as few:
+                    self.assertEqual(self.client.get(url).status_code, 200)
+                self.add_applications(5, start=Application.objects.count())
+                with CaptureQueriesContext(connection) as many:
+                    self.assertEqual(self.client.get(url).status_code, 200)
+                self.assertEqual(len(few), len(many))
+
+    def test_search_and_estimated_count(self):
+        self.add_applications(3)
+        for term in ("v1", "abc", str(Application.objects.first().pk)):
+            self.assertEqual(self.client.get("/admin/core/application/", {"q": term}).status_code, 200)
+        paginator = EstimatedCountPaginator(Application.objects.order_by("pk"), 50)
+        self.assertIsNone(paginator.estimate())  # PostgreSQL only
+        self.assertEqual(paginator.count, 3)
+
+
+class PrebuiltSchemaTests(APITestCase):
+    def test_serves_prebuilt_file_with_etag(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "openapi.json").write_bytes(b'{"openapi": "3.0.3", "prebuilt": true}')
+            with override_settings(OPENAPI_SCHEMA_DIR=tmp):
+                res = self.client.get("/api/schema/?format=json")
+                self.assertEqual(res.status_code, 200)
+                self.assertEqual(res.json(), {"openapi": "3.0.3", "prebuilt": True})
+                self.assertIn("max-age=", res["Cache-Control"])
+                again = self.client.get("/api/schema/?format=json", HTTP_IF_NONE_MATCH=res["ETag"])
+                self.assertEqual(again.status_code, 304)
+                # No yaml file in the directory: generated on the fly.
+                live = self.client.get("/api/schema/")
+                self.assertEqual(live.status_code, 200)
+                self.assertIn(b"openapi:", live.content)
+                # A file generated after a miss is served from then on.
+                Path(tmp, "openapi.yaml").write_bytes(b"openapi: 3.0.3\nprebuilt: true\n")
+                self.assertEqual(self.client.get("/api/schema/").content, b"openapi: 3.0.3\nprebuilt: true\n")
+
+    def test_geopy_is_imported_lazily(self):
+        probe = "import sys, core.services; print('geopy' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+
+class AutocompleteTests(APITestCase):
+    def setUp(self):
+        autocomplete.skills.built_at = None  # indexes are per process; start each test from the database
+        self.org = make_org(location_text="San Fernando, Trinidad")
+        self.volunteer = make_volunteer(skills=["first aid", "Cooking"], location_text="Port of Spain, Trinidad")
+        self.vol_user = self.volunteer.user
+        for skills in (["First Aid", "Cleanup"], ["Cleanup"]):
+            make_opportunity(self.org, required_skills=skills, location_text="Port of Spain, Trinidad")
+        self.client.force_authenticate(self.vol_user)
+
+    def get(self, kind, q):
+        return self.client.get(f"/api/autocomplete/{kind}/", {"q": q}).json()
+
+    def test_prefix_matches_ranked_by_frequency(self):
+        self.assertEqual(self.get("skills", "c"), [{"value": "Cleanup", "count": 2}, {"value": "Cooking", "count": 1}])
+        self.assertEqual(self.get("skills", "AID"), [{"value": "First Aid", "count": 2}])
+        self.assertEqual([r["value"] for r in self.get("locations", "trin")], ["Port of Spain, Trinidad", "San Fernando, Trinidad"])
+        self.assertEqual(self.get("locations", "x"), [])
+        with self.assertNumQueries(0):
+            self.client.get("/api/autocomplete/locations/", {"q": "spa"})  # authentication is forced, index is warm
+
+    def test_writes_update_index_incrementally(self):
+        self.get("skills", "c")  # build
+        with self.captureOnCommitCallbacks(execute=True):
+            self.volunteer.skills = ["Carpentry"]
+            self.volunteer.save()
+            self.org.location_text = "Arima, Trinidad"
+            self.org.save()
+        self.assertEqual(self.get("skills", "c"), [{"value": "Cleanup", "count": 2}, {"value": "Carpentry", "count": 1}])
+        self.assertEqual(self.get("skills", "first"), [{"value": "First Aid", "count": 1}])
+        self.assertEqual(self.get("locations", "ari"), [{"value": "Arima, Trinidad", "count": 1}])
+        self.assertEqual(self.get("locations", "san"), [])
+
+    def test_stale_index_is_rebuilt_in_background(self):
+        self.get("skills", "c")  # build
+        autocomplete.skills.built_at -= settings.AUTOCOMPLETE_REFRESH_SECONDS
+        started, release = threading.Event(), threading.Event()
+
+        def slow_rebuild():
+            started.set()
+            release.wait(5)
+
+        with mock.patch.object(autocomplete, "rebuild", slow_rebuild):
+            self.assertEqual(self.get("skills", "c")[0], {"value": "Cleanup", "count": 2})  # served while rebuilding
+            self.assertTrue(started.wait(5))
+            self.assertFalse(autocomplete._build_lock.acquire(blocking=False))  # one builder at a time
+            self.get("skills", "c")
+            release.set()
+        for thread in threading.enumerate():
+            if thread.name == "autocomplete-rebuild":
+                thread.join(5)
+        self.assertTrue(autocomplete._build_lock.acquire(blocking=False))
+        autocomplete._build_lock.release()
+
+
+@override_settings(PROFILING_BUFFER_SIZE=2)
+class ProfilingTests(APITestCase):
+    def setUp(self):
+        profiles = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(PROFILING_DIR=profiles))
+        self.staff = User.objects.create_user(username="staff", email="staff@example.com", password="x", is_staff=True)
+        self.user = User.objects.create_user(username="vol", email="vol@example.com", password="x")
+
+    def bearer(self, user):
+        return {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(user).access_token}"}
+
+    def test_staff_flagged_requests_are_recorded_in_a_ring_buffer(self):
+        self.assertNotIn("X-Profile-Id", self.client.get("/api/opportunities/", **self.bearer(self.staff)))
+        self.assertNotIn("X-Profile-Id", self.client.get("/api/opportunities/?_profile=1", **self.bearer(self.user)))
+
+        ids = [self.client.get("/api/opportunities/", HTTP_X_PROFILE="1", **self.bearer(self.staff))["X-Profile-Id"]
+               for _ in range(3)]
+        self.assertEqual([r["id"] for r in profiling.list_records()], ids[:0:-1])
+
+        self.client.force_authenticate(self.staff)
+        record = self.client.get(f"/api/profiles/{ids[-1]}/").json()
+        self.assertEqual(record["path"], "/api/opportunities/")
+        self.assertIn("orm", record["components_ms"])
+        self.assertTrue(record["hot"])
+        self.assertEqual(self.client.get(f"/api/profiles/{ids[0]}/").status_code, status.HTTP_404_NOT_FOUND)
+
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get("/api/profiles/").status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class ChangeFeedTests(APITestCase):
+    def setUp(self):
+        org = make_org()
+        self.opps = [make_opportunity(org, title=f"Opp {i}") for i in range(3)]
+        volunteer = make_volunteer()
+        self.vol_user = volunteer.user
+        self.app = Application.objects.create(opportunity=self.opps[0], volunteer=volunteer)
+        Application.objects.create(opportunity=self.opps[0], volunteer=make_volunteer("w"))
+        self.client.force_authenticate(self.vol_user)
+
+    def sync(self, url, since=None, limit=100):
+        params = {"limit": limit, **({"since": since} if since else {})}
+        return self.client.get(url, params).json()
+
+    def test_opportunity_feed_pages_updates_and_deletions(self):
+        url = "/api/opportunities/changes/"
+        first = self.sync(url, limit=2)
+        self.assertEqual([o["title"] for o in first["upserted"]], ["Opp 0", "Opp 1"])
+        self.assertTrue(first["has_more"])
+        second = self.sync(url, first["cursor"], limit=2)
+        self.assertEqual(([o["title"] for o in second["upserted"]], second["has_more"]), (["Opp 2"], False))
+        self.assertNotIn("organization_name", first["upserted"][0])  # org edits do not bump updated_at
+        empty = self.sync(url, second["cursor"])
+        self.assertEqual(empty["upserted"], [])
+        self.assertGreater(sync.decode_cursor(empty["cursor"]), sync.decode_cursor(second["cursor"]))  # moved up to now
+
+        self.opps[1].title = "Renamed"
+        self.opps[1].save()
+        deleted_id = self.opps[2].id
+        self.opps[2].delete()
+        delta = self.sync(url, empty["cursor"])
+        self.assertEqual([o["title"] for o in delta["upserted"]], ["Renamed"])
+        self.assertEqual(delta["deleted"], [deleted_id])
+
+        self.assertEqual(self.client.get(url, {"since": "nonsense"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {"since": "0.0.0"}).status_code, status.HTTP_410_GONE)
+
+    def test_application_feed_is_per_volunteer(self):
+        url = "/api/me/applications/changes/"
+        first = self.sync(url)
+        self.assertEqual([a["id"] for a in first["upserted"]], [self.app.id])
+        self.opps[0].delete()  # cascades to both applications
+        delta = self.sync(url, first["cursor"])
+        self.assertEqual((delta["upserted"], delta["deleted"]), ([], [self.app.id]))
+
+
+class ArchivalTests(APITestCase):
+    def setUp(self):
+        today = timezone.localdate()
+        org = make_org()
+        self.opps = {
+            title: make_opportunity(org, title=title, start_date=end)
+            for title, end in (("Upcoming", today + timedelta(days=7)), ("Recent", today - timedelta(days=3)),
+                               ("Old", today - timedelta(days=60)))
+        }
+        self.app = Application.objects.create(opportunity=self.opps["Old"], volunteer=make_volunteer())
+        self.vol_user = self.app.volunteer.user
+        self.client.force_authenticate(self.vol_user)
+
+    def titles(self, url):
+        return sorted(o["title"] for o in self.client.get(url).json())
+
+    def test_archive_command_retires_only_expired_opportunities(self):
+        call_command("archive_opportunities", "--days", "30", "--batch-size", "1", stdout=StringIO())
+        archived = Opportunity.objects.filter(archived_at__isnull=False)
+        self.assertEqual([o.title for o in archived], ["Old"])
+        self.assertEqual(list(Tombstone.objects.values_list("model", "object_id")), [("opportunity", self.opps["Old"].id)])
+        # History stays reachable; archived opportunities no longer take applications.
+        self.assertEqual([a["id"] for a in self.client.get("/api/me/applications/").json()], [self.app.id])
+        self.assertEqual(self.client.post(f"/api/opportunities/{self.opps['Old'].id}/apply/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_rows_archived_by_a_concurrent_run_get_no_second_tombstone(self):
+        # The other run archives "Old" between this run's select and its update.
+        select = archival.expired
+
+        def expired_then_raced(days):
+            ids = list(select(days).values_list("pk", flat=True))
+            Opportunity.objects.filter(pk=self.opps["Old"].pk).update(archived_at=timezone.now())
+            return Opportunity.objects.filter(pk__in=ids)
+
+        with mock.patch.object(archival, "expired", expired_then_raced):
+            self.assertEqual(archival.archive_batch(30, 10), 0)
+        self.assertFalse(Tombstone.objects.exists())
+
+    def test_listings_hide_past_opportunities_by_default(self):
+        Opportunity.objects.filter(pk=self.opps["Old"].pk).update(archived_at=timezone.now())
+        self.assertEqual(self.titles("/api/opportunities/"), ["Upcoming"])
+        self.assertEqual(self.titles("/api/opportunities/search/"), ["Upcoming"])
+        self.assertEqual(self.titles("/api/opportunities/?include_past=1"), ["Old", "Recent", "Upcoming"])
+
+
+class BulkImportTests(APITestCase):
+    def setUp(self):
+        self.geocode = self.enterContext(mock.patch("core.bulk_import.geocode_location", return_value=(10.65, -61.51)))
+        self.org = make_org()
+        self.client.force_authenticate(self.org.user)
+
+    def post(self, url, body, content_type):
+        return self.client.generic("POST", url, body.encode(), content_type=content_type)
+
+    def test_volunteer_csv_import_reports_bad_rows(self):
+        body = (
+            "username,email,password,location_text,skills,availability\n"
+            'ann,ann@example.com,StrongPassw0rd!!,"Port of Spain, Trinidad",FirstAid;Cleanup,"{""dates"": [""2026-12-24""]}"\n'
+            'ben,ben@example.com,StrongPassw0rd!!,"Port of Spain, Trinidad",,\n'
+            "cat,not-an-email,StrongPassw0rd!!,,,\n"
+            "dan,org@example.com,StrongPassw0rd!!,,,\n"
+        )
+        res = self.post("/api/import/volunteers/", body, "text/csv")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((res.json()["created"], res.json()["rows"]), (2, 4))
+        self.assertEqual({e["line"]: list(e["errors"]) for e in res.json()["errors"]}, {4: ["email"], 5: ["email"]})
+        self.geocode.assert_called_once_with("Port of Spain, Trinidad")
+
+        ann = VolunteerProfile.objects.get(user__username="ann")
+        self.assertEqual((ann.skills, ann.latitude), (["FirstAid", "Cleanup"], 10.65))
+        self.assertEqual(ann.availability_ranges.count(), 1)
+        self.assertTrue(ann.user.check_password("StrongPassw0rd!!"))
+        self.assertEqual(ann.user.role, User.Role.VOLUNTEER)
+
+    @override_settings(IMPORT_HASH_WORKERS=2)
+    def test_passwords_are_hashed_in_worker_processes(self):
+        passwords = [f"StrongPassw0rd!!{i}" for i in range(MIN_POOL_PASSWORDS)]
+        hashes = hash_passwords(passwords)
+        self.assertTrue(all(check_password(p, h) for p, h in zip(passwords, hashes)))
+
+    @override_settings(IMPORT_MAX_ROWS=2)
+    def test_http_import_is_capped(self):
+        body = "username,email,password\n" + "".join(f"u{i},u{i}@example.com,StrongPassw0rd!!\n" for i in range(3))
+        res = self.post("/api/import/volunteers/", body, "text/csv")
+        self.assertEqual((res.json()["created"], res.json()["rows"]), (2, 2))
+        self.assertEqual(res.json()["errors"][0]["errors"]["non_field_errors"], ["Stopped after 2 rows."])
+
+    def test_opportunity_jsonl_import_and_command(self):
+        rows = [{"title": f"Opp {i}", "description": "Beach cleanup", "start_date": "2026-12-24", "end_date": "2026-12-24",
+                 "required_skills": ["Cleanup"], "location_text": "Maracas Beach, Trinidad"} for i in range(3)]
+        body = "\n".join(json.dumps(r) for r in rows) + '\n{"title": "No dates"}\nnot json\n'
+        res = self.post("/api/import/opportunities/", body, "application/x-ndjson")
+        self.assertEqual(res.json()["created"], 3)
+        self.assertEqual([e["line"] for e in res.json()["errors"]], [4, 5])
+        self.assertEqual(OpportunityCalendarDay.objects.get(day=date(2026, 12, 24), skill="", region="").count, 3)
+        self.assertEqual(self.post("/api/import/opportunities/", body, "application/xml").status_code,
+                         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl") as f:
+            f.write(json.dumps(rows[0]))
+            f.flush()
+            out = StringIO()
+            call_command("bulk_import", "opportunities", f.name, "--org", "org", stdout=out)
+        self.assertIn("Imported 1 of 1 rows", out.getvalue())
+        self.assertEqual(Opportunity.objects.filter(organization=self.org).count(), 4)
+
+
+@override_settings(THROTTLE_RATES={"search_radius": "2/min", "register": "1/hour", "auth_token": "3/min"})
+class ThrottleTests(APITestCase):
+    def setUp(self):
+        throttling.memory_buckets.clear()
+        self.addCleanup(throttling.memory_buckets.clear)
+
+    def test_registration_is_limited_per_ip(self):
+        payload = {"username": "vol1", "email": "vol1@example.com", "password": "StrongPassw0rd!!"}
+        self.assertEqual(self.client.post("/api/auth/register/volunteer/", payload, format="json").status_code,
+                         status.HTTP_201_CREATED)
+        res = self.client.post("/api/auth/register/org/", {**payload, "name": "x"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertGreater(int(res["Retry-After"]), 3000)
+        other_ip = self.client.post("/api/auth/register/volunteer/", {**payload, "username": "vol2", "email": "v2@example.com"},
+                                    format="json", REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(other_ip.status_code, status.HTTP_201_CREATED)
+
+    def test_forwarded_for_is_ignored_without_trusted_proxies(self):
+        payload = {"username": "vol1", "email": "vol1@example.com", "password": "StrongPassw0rd!!"}
+        codes = [
+            self.client.post("/api/auth/register/volunteer/", {**payload, "username": f"vol{i}", "email": f"v{i}@example.com"},
+                             format="json", HTTP_X_FORWARDED_FOR=f"203.0.113.{i}").status_code
+            for i in range(2)
+        ]
+        self.assertEqual(codes, [status.HTTP_201_CREATED, status.HTTP_429_TOO_MANY_REQUESTS])
+
+    def test_bucket_table_evicts_least_recently_used(self):
+        buckets = throttling.MemoryBuckets(max_buckets=3)
+        hourly = 1 / 3600
+        for key in "abc":
+            buckets.take(key, 1, hourly)
+        self.assertGreater(buckets.take("a", 1, hourly), 0)  # "a" is now the most recently used
+        buckets.take("d", 1, hourly)
+        self.assertEqual(len(buckets), 3)
+        self.assertGreater(buckets.take("a", 1, hourly), 0)
+        self.assertEqual(buckets.take("b", 1, hourly), 0.0)  # evicted, so it starts full again
+
+    def test_only_radius_searches_are_limited_per_user(self):
+        users = [User.objects.create_user(username=f"u{i}", email=f"u{i}@example.com", password="x") for i in range(2)]
+        radius = "/api/opportunities/search/?lat=10.6&lng=-61.5&radius_km=5"
+        self.client.force_authenticate(users[0])
+        codes = [self.client.get(radius).status_code for _ in range(3)]
+        self.assertEqual(codes, [status.HTTP_200_OK, status.HTTP_200_OK, status.HTTP_429_TOO_MANY_REQUESTS])
+        self.assertEqual(self.client.get("/api/opportunities/search/?search=beach").status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(users[1])
+        self.assertEqual(self.client.get(radius).status_code, status.HTTP_200_OK)
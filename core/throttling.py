@@ -0,0 +1,120 @@
+"""Token-bucket throttles for the expensive routes."""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import cache as memoize
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+# Hard cap per process; evicting a bucket at worst gives that client a fresh (full) one.
+MAX_BUCKETS = 100_000
+
+
+@memoize
+def parse_rate(rate: str) -> tuple[int, float]:
+    """"10/min" -> (10 tokens, 10/60 tokens per second)."""
+    count, period = rate.split("/")
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+class MemoryBuckets:
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, max_buckets: int = MAX_BUCKETS):
+        self.max_buckets = max_buckets
+        self._buckets = OrderedDict()  # key -> [tokens, updated], least recently used first
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: int, refill: float) -> float:
+        """Take a token; returns 0.0 if one was available, else the seconds until there is one."""
+        now = self.clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_buckets:
+                    self._buckets.popitem(last=False)
+                self._buckets[key] = [capacity - 1.0, now]
+                return 0.0
+            self._buckets.move_to_end(key)
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill)
+            wait = 0.0 if tokens >= 1.0 else (1.0 - tokens) / refill
+            if not wait:
+                tokens -= 1.0
+            bucket[0], bucket[1] = tokens, now
+            return wait
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheBuckets:
+    """Buckets in the default cache, shared by every worker. Read-modify-write, as DRF's throttles do."""
+    clock = staticmethod(time.time)
+
+    def take(self, key: str, capacity: int, refill: float) -> float:
+        now = self.clock()
+        tokens, updated = cache.get(key) or (float(capacity), now)
+        tokens = min(capacity, tokens + (now - updated) * refill)
+        wait = 0.0 if tokens >= 1.0 else (1.0 - tokens) / refill
+        if not wait:
+            tokens -= 1.0
+        # Expires once the bucket would be full again; a missing bucket is a full one.
+        cache.set(key, (tokens, now), timeout=int((capacity - tokens) / refill) + 1)
+        return wait
+
+
+memory_buckets = MemoryBuckets()
+
+
+def buckets():
+    return CacheBuckets() if settings.THROTTLE_BACKEND == "cache" else memory_buckets
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Throttle `scope` per authenticated user, or per client IP for anonymous requests."""
+    scope = None
+
+    def applies(self, request, view) -> bool:
+        return True
+
+    def get_cache_key(self, request, view) -> str:
+        if request.user and request.user.is_authenticated:
+            return f"throttle:{self.scope}:user:{request.user.pk}"
+        return f"throttle:{self.scope}:ip:{self.get_ident(request)}"
+
+    def allow_request(self, request, view) -> bool:
+        rate = settings.THROTTLE_RATES.get(self.scope)
+        if not rate or not self.applies(request, view):
+            return True
+        capacity, refill = parse_rate(rate)
+        self._wait = buckets().take(self.get_cache_key(request, view), capacity, refill)
+        return not self._wait
+
+    def wait(self):
+        return self._wait
+
+
+class SearchRadiusThrottle(TokenBucketThrottle):
+    """Only radius searches (lat + lng + radius_km) scan and filter rows in Python."""
+    scope = "search_radius"
+
+    def applies(self, request, view) -> bool:
+        params = request.query_params
+        return bool(params.get("lat") and params.get("lng") and params.get("radius_km"))
+
+
+class RegistrationThrottle(TokenBucketThrottle):
+    scope = "register"
+
+
+class TokenObtainThrottle(TokenBucketThrottle):
+    scope = "auth_token"
@@ -1,36 +1,44 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from .throttling import TokenObtainThrottle
 from .views import (
     RegisterVolunteerView, RegisterOrgView,
-    MyVolunteerProfileView, MyOrgProfileView,
+    MyVolunteerProfileView, MyOrgProfileView, OrgDashboardView,
     OpportunityCreateListView, OpportunityRetrieveUpdateDeleteView,
-    OpportunitySearchView, ApplyToOpportunityView,
+    OpportunitySearchView, OpportunityCalendarView, ApplyToOpportunityView,
     MyApplicationsView, OpportunityApplicantsView, UpdateApplicationStatusView,
     MyNotificationsView, MarkNotificationReadView,
-    LogHoursView, MyHoursView,
-    LeaveFeedbackView
+    LogHoursView, MyHoursView, LeaderboardView,
+    LeaveFeedbackView, SkillAutocompleteView, LocationAutocompleteView,
+    ProfileListView, ProfileDetailView, OpportunityChangesView, MyApplicationChangesView,
+    BatchView, ImportVolunteersView, ImportOpportunitiesView
 )
 
 urlpatterns = [
     # Authorization 
     path("auth/register/volunteer/", RegisterVolunteerView.as_view()),
     path("auth/register/org/", RegisterOrgView.as_view()),
-    path("auth/token/", TokenObtainPairView.as_view()),
+    path("auth/token/", TokenObtainPairView.as_view(throttle_classes=[TokenObtainThrottle])),
     path("auth/token/refresh/", TokenRefreshView.as_view()),
 
     # Profiles
     path("me/volunteer-profile/", MyVolunteerProfileView.as_view()),
     path("me/org-profile/", MyOrgProfileView.as_view()),
+    path("me/org-dashboard/", OrgDashboardView.as_view()),
 
     # Opportunities
     path("opportunities/", OpportunityCreateListView.as_view()),  
     path("opportunities/<int:pk>/", OpportunityRetrieveUpdateDeleteView.as_view()),
     path("opportunities/search/", OpportunitySearchView.as_view()),
+    path("opportunities/calendar/", OpportunityCalendarView.as_view()),
+    path("opportunities/changes/", OpportunityChangesView.as_view()),
 
     # Apply + status
     path("opportunities/<int:opportunity_id>/apply/", ApplyToOpportunityView.as_view()),
     path("me/applications/", MyApplicationsView.as_view()),
+    path("me/applications/changes/", MyApplicationChangesView.as_view()),
     path("opportunities/<int:opportunity_id>/applicants/", OpportunityApplicantsView.as_view()),
     path("applications/<int:pk>/status/", UpdateApplicationStatusView.as_view()),
 
@@ -41,8 +49,40 @@ urlpatterns = [
     # Tracking
     path("hours/log/", LogHoursView.as_view()),
     path("me/hours/", MyHoursView.as_view()),
+    path("leaderboards/", LeaderboardView.as_view()),
 
     # Feedback
     path("feedback/", LeaveFeedbackView.as_view()),
+
+    # Autocomplete
+    path("autocomplete/skills/", SkillAutocompleteView.as_view()),
+    path("autocomplete/locations/", LocationAutocompleteView.as_view()),
+
+    # Request profiles (staff)
+    path("profiles/", ProfileListView.as_view()),
+    path("profiles/<str:profile_id>/", ProfileDetailView.as_view()),
+
+    # Batch
+    path("batch/", BatchView.as_view(), name="batch"),
+
+    # Bulk import (organizations)
+    path("import/volunteers/", ImportVolunteersView.as_view()),
+    path("import/opportunities/", ImportOpportunitiesView.as_view()),
 ]
 
+if settings.ASYNC_VIEWS:
+    # Async ORM versions of the read-heavy routes (same paths; writes still reach the sync views).
+    from . import async_views
+
+    async_routes = {
+        "opportunities/": async_views.AsyncOpportunityListView,
+        "opportunities/<int:pk>/": async_views.AsyncOpportunityDetailView,
+        "opportunities/search/": async_views.AsyncOpportunitySearchView,
+        "me/applications/": async_views.AsyncMyApplicationsView,
+        "me/notifications/": async_views.AsyncMyNotificationsView,
+        "me/hours/": async_views.AsyncMyHoursView,
+    }
+    urlpatterns = [
+        path(str(p.pattern), async_routes[str(p.pattern)].as_view(), name=p.name) if str(p.pattern) in async_routes else p
+        for p in urlpatterns
+    ]
@@ -1,23 +1,100 @@
+import hashlib
+from calendar import monthrange
+from datetime import date
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
 from django.db.models import Q
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import SAFE_METHODS, AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.views import APIView
 
-from .models import User, VolunteerProfile, OrganizationProfile, Opportunity, Application, Notification, HourLog, Feedback
+from .models import (
+    User, VolunteerProfile, OrganizationProfile, Opportunity, Application, Notification, HourLog, Feedback,
+    OpportunityCalendarDay, LeaderboardBucket, LeaderboardEntry, Tombstone
+)
 from .serializers import (
     RegisterVolunteerSerializer, RegisterOrgSerializer,UserSerializer,
     VolunteerProfileSerializer, OrganizationProfileSerializer,
     OpportunitySerializer, ApplicationSerializer, ApplicationStatusUpdateSerializer,
-    NotificationSerializer, HourLogSerializer, FeedbackSerializer
+    NotificationSerializer, HourLogSerializer, FeedbackSerializer, ValuesSerializer, readable_fields,
+    BatchSerializer
 )
 from .permissions import IsVolunteer, IsOrganization, IsOrgOwnerOfOpportunity, IsOrgOwnerViaApplication
-from .services import haversine_km
+from .throttling import RegistrationThrottle, SearchRadiusThrottle
+from .services import haversine_km, availability_overlap_q
+from .batch import execute_batch
+from . import applications, autocomplete, bulk_import, calendar_index, dashboard, leaderboard, profiling, sync
+
+class SparseFieldsetMixin:
+    """
+    `?fields=id,title,...` on GET limits the serialized fields and the columns
+    read: the queryset is narrowed with `.only()` (joined names included).
+    `sparse_always_load` lists extra lookups permission checks rely on.
+    """
+    sparse_always_load = ()
+
+    def get_requested_fields(self):
+        if not hasattr(self, "_requested_fields"):
+            self._requested_fields = None
+            raw = self.request.query_params.get("fields") if self.request.method in SAFE_METHODS else None
+            if raw:
+                requested = list(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+                known = {name for name, _, _ in readable_fields(self.get_serializer_class())}
+                unknown = [f for f in requested if f not in known]
+                if unknown:
+                    raise ValidationError({"fields": [f"Unknown field(s): {', '.join(unknown)}."]})
+                self._requested_fields = requested or None
+        return self._requested_fields
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields = self.get_requested_fields()
+        if not fields:
+            return queryset
+        lookups = [
+            lookup
+            for name, field_lookups, _ in readable_fields(self.get_serializer_class()) if name in fields
+            for lookup in field_lookups
+        ]
+        lookups += self.sparse_always_load
+        relations = {lookup.rsplit("__", 1)[0] for lookup in lookups if "__" in lookup}
+        queryset = queryset.select_related(None)
+        if relations:
+            queryset = queryset.select_related(*relations)
+        return queryset.only(*lookups)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.get_requested_fields()
+        return context
+
+
+class FastListMixin(SparseFieldsetMixin):
+    """Serve GET lists through `fast_serializer` (a ValuesSerializer) instead of model instances."""
+    fast_serializer = None
+
+    def list(self, request, *args, **kwargs):
+        if self.fast_serializer is None or self.paginator is not None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(self.fast_serializer.serialize(queryset, self.get_requested_fields()))
+
 
 # Authentication / registration
 
 class RegisterVolunteerView(generics.CreateAPIView):
     permission_classes = [AllowAny]
+    throttle_classes = [RegistrationThrottle]
     serializer_class = RegisterVolunteerSerializer
 
     def create(self, request, *args, **kwargs):
@@ -29,6 +106,7 @@ class RegisterVolunteerView(generics.CreateAPIView):
 
 class RegisterOrgView(generics.CreateAPIView):
     permission_classes = [AllowAny]
+    throttle_classes = [RegistrationThrottle]
     serializer_class = RegisterOrgSerializer
 
     def create(self, request, *args, **kwargs):
@@ -55,15 +133,30 @@ class MyOrgProfileView(generics.RetrieveUpdateAPIView):
         return self.request.user.org_profile
 
 
+class OrgDashboardView(APIView):
+    permission_classes = [IsAuthenticated, IsOrganization]
+
+    def get(self, request):
+        return Response(dashboard.org_dashboard(request.user.org_profile))
+
+
 #  Opportunities (organization crud) 
 
-class OpportunityCreateListView(generics.ListCreateAPIView):
+def include_past(request) -> bool:
+    """`?include_past=1` also lists ended and archived opportunities (default: current ones only)."""
+    return request.query_params.get("include_past") == "1"
+
+
+class OpportunityCreateListView(FastListMixin, generics.ListCreateAPIView):
 
     serializer_class = OpportunitySerializer
+    fast_serializer = ValuesSerializer(OpportunitySerializer)
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         qs = Opportunity.objects.select_related("organization", "organization__user").all().order_by("-created_at")
+        if not include_past(self.request):
+            qs = qs.current()
         mine = self.request.query_params.get("mine")
         if mine == "1" and hasattr(self.request.user, "org_profile"):
             qs = qs.filter(organization=self.request.user.org_profile)
@@ -75,19 +168,24 @@ class OpportunityCreateListView(generics.ListCreateAPIView):
         return super().post(request, *args, **kwargs)
 
 
-class OpportunityRetrieveUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
+class OpportunityRetrieveUpdateDeleteView(SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = OpportunitySerializer
     permission_classes = [IsAuthenticated, IsOrganization, IsOrgOwnerOfOpportunity]
+    sparse_always_load = ("organization__user_id",)
     queryset = Opportunity.objects.select_related("organization", "organization__user").all()
 
 
 # Search(volunteer)
-class OpportunitySearchView(generics.ListAPIView):
+class OpportunitySearchView(FastListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [SearchRadiusThrottle]
     serializer_class = OpportunitySerializer
+    fast_serializer = ValuesSerializer(OpportunitySerializer)
 
     def get_queryset(self):
         qs = Opportunity.objects.select_related("organization").all().order_by("-created_at")
+        if not include_past(self.request):
+            qs = qs.current()
 
         skill = self.request.query_params.get("skill")
         start = self.request.query_params.get("start")
@@ -96,6 +194,10 @@ class OpportunitySearchView(generics.ListAPIView):
         if start and end:
             qs = qs.filter(start_date__lte=end, end_date__gte=start)
 
+        # Only opportunities overlapping one of the caller's availability ranges
+        if self.request.query_params.get("available") == "1" and hasattr(self.request.user, "volunteer_profile"):
+            qs = qs.filter(availability_overlap_q(self.request.user.volunteer_profile))
+
         # Basic JSON contains match
         if skill:
             qs = qs.filter(Q(required_skills__icontains=skill))
@@ -108,11 +210,12 @@ class OpportunitySearchView(generics.ListAPIView):
             try:
                 latf = float(lat); lngf = float(lng); r = float(radius_km)
                 filtered_ids = []
-                for opp in qs:
-                    if opp.latitude is None or opp.longitude is None:
+                # Only the coordinates are needed here; don't load whole rows.
+                for opp_id, opp_lat, opp_lng in qs.values_list("id", "latitude", "longitude"):
+                    if opp_lat is None or opp_lng is None:
                         continue
-                    if haversine_km(latf, lngf, opp.latitude, opp.longitude) <= r:
-                        filtered_ids.append(opp.id)
+                    if haversine_km(latf, lngf, opp_lat, opp_lng) <= r:
+                        filtered_ids.append(opp_id)
                 qs = qs.filter(id__in=filtered_ids)
             except ValueError:
                 pass
@@ -125,6 +228,31 @@ class OpportunitySearchView(generics.ListAPIView):
         return qs
 
 
+class OpportunityCalendarView(APIView):
+    """Per-day opportunity counts for `?month=YYYY-MM` (default: current month), optionally by skill/region."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        month = request.query_params.get("month") or timezone.localdate().strftime("%Y-%m")
+        try:
+            year, month_no = (int(part) for part in month.split("-"))
+            first = date(year, month_no, 1)
+        except ValueError:
+            return Response({"detail": "month must be YYYY-MM."}, status=status.HTTP_400_BAD_REQUEST)
+        last = first.replace(day=monthrange(year, month_no)[1])
+
+        skill = calendar_index.normalize_skill(request.query_params.get("skill", ""))
+        region = calendar_index.region_for(request.query_params.get("region", ""))
+        days = OpportunityCalendarDay.objects.filter(
+            skill=skill, region=region, day__gte=first, day__lte=last, count__gt=0
+        ).order_by("day").values_list("day", "count")
+
+        return Response({
+            "month": first.strftime("%Y-%m"),
+            "days": [{"date": day.isoformat(), "count": count} for day, count in days],
+        })
+
+
 # Apply + status (volunteer + organization) 
 
 class ApplyToOpportunityView(APIView):
@@ -133,27 +261,20 @@ class ApplyToOpportunityView(APIView):
     def post(self, request, opportunity_id: int):
         volunteer = request.user.volunteer_profile
         try:
-            opp = Opportunity.objects.select_related("organization", "organization__user").get(id=opportunity_id)
+            opp = Opportunity.objects.filter(archived_at__isnull=True).select_related("organization").only(
+                "title", "capacity", "accepted_count", "organization__name", "organization__user_id"
+            ).get(id=opportunity_id)
         except Opportunity.DoesNotExist:
             return Response({"detail": "Opportunity not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        app, created = Application.objects.get_or_create(opportunity=opp, volunteer=volunteer)
-
-        if created:
-            # Notify organization on new application
-            Notification.objects.create(
-                user=opp.organization.user,
-                type="APPLICATION_CREATED",
-                title="New volunteer application",
-                message=f"{volunteer.user.username} applied to '{opp.title}'.",
-            )
-
+        app, created = applications.apply(volunteer, opp)
         return Response(ApplicationSerializer(app).data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
 
-class MyApplicationsView(generics.ListAPIView):
+class MyApplicationsView(FastListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsVolunteer]
     serializer_class = ApplicationSerializer
+    fast_serializer = ValuesSerializer(ApplicationSerializer)
 
     def get_queryset(self):
         return Application.objects.select_related("opportunity", "opportunity__organization").filter(
@@ -161,9 +282,10 @@ class MyApplicationsView(generics.ListAPIView):
         ).order_by("-applied_at")
 
 
-class OpportunityApplicantsView(generics.ListAPIView):    
+class OpportunityApplicantsView(FastListMixin, generics.ListAPIView):    
     permission_classes = [IsAuthenticated, IsOrganization]
     serializer_class = ApplicationSerializer
+    fast_serializer = ValuesSerializer(ApplicationSerializer)
 
     def get_queryset(self):
         opp_id = self.kwargs["opportunity_id"]
@@ -182,23 +304,25 @@ class UpdateApplicationStatusView(generics.UpdateAPIView):
     serializer_class = ApplicationStatusUpdateSerializer
 
     def perform_update(self, serializer):
-        app = self.get_object()
-        updated = serializer.save()
+        app = serializer.instance
+        # Acceptance past capacity is stored as WAITLISTED (see core.applications)
+        new_status = applications.set_status(app, serializer.validated_data.get("status", app.status))
 
         # Notify volunteer when status changes
         Notification.objects.create(
             user=app.volunteer.user,
             type="APPLICATION_STATUS_CHANGED",
             title="Application status updated",
-            message=f"Your application for '{app.opportunity.title}' is now {updated.status}.",
+            message=f"Your application for '{app.opportunity.title}' is now {new_status}.",
         )
 
 
 # Notifications
 
-class MyNotificationsView(generics.ListAPIView):
+class MyNotificationsView(FastListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = NotificationSerializer
+    fast_serializer = ValuesSerializer(NotificationSerializer)
 
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user).order_by("-created_at")
@@ -232,9 +356,10 @@ class LogHoursView(generics.CreateAPIView):
         serializer.save()
 
 
-class MyHoursView(generics.ListAPIView):
+class MyHoursView(FastListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsVolunteer]
     serializer_class = HourLogSerializer
+    fast_serializer = ValuesSerializer(HourLogSerializer)
 
     def get_queryset(self):
         return HourLog.objects.select_related("application", "application__opportunity").filter(
@@ -242,6 +367,43 @@ class MyHoursView(generics.ListAPIView):
         ).order_by("-work_date")
 
 
+class LeaderboardView(APIView):
+    """
+    Top volunteers by hours: `?scope=global` (default), `?scope=org&org=<id>` or
+    `?scope=month&month=YYYY-MM`, with `?limit=` (max 100). Volunteers also get their own rank.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        params = request.query_params
+        kind = params.get("scope", "global")
+        if kind == "global":
+            scope = leaderboard.GLOBAL
+        elif kind == "org":
+            org_id = params.get("org") or getattr(getattr(request.user, "org_profile", None), "id", None)
+            if not str(org_id or "").isdigit():
+                return Response({"detail": "org is required for scope=org."}, status=status.HTTP_400_BAD_REQUEST)
+            scope = leaderboard.org_scope(int(org_id))
+        elif kind == "month":
+            month = params.get("month") or timezone.localdate().strftime("%Y-%m")
+            try:
+                scope = leaderboard.month_scope(date.fromisoformat(f"{month}-01"))
+            except ValueError:
+                return Response({"detail": "month must be YYYY-MM."}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            return Response({"detail": "scope must be global, org or month."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = min(max(int(params.get("limit", 10)), 1), 100)
+        except ValueError:
+            limit = 10
+
+        data = {"scope": scope, "top": leaderboard.top(LeaderboardEntry, scope, limit)}
+        if hasattr(request.user, "volunteer_profile"):
+            data["me"] = leaderboard.rank(LeaderboardEntry, LeaderboardBucket, scope, request.user.volunteer_profile.id)
+        return Response(data)
+
+
 # Feedback (organization after completion) 
 
 class LeaveFeedbackView(generics.CreateAPIView):
@@ -265,3 +427,202 @@ class LeaveFeedbackView(generics.CreateAPIView):
             title="Feedback received",
             message=f"{org.name} left feedback for '{app.opportunity.title}'. Rating: {feedback.rating}/5",
         )
+
+
+# Change feeds (delta sync)
+
+class ChangeFeedView(APIView):
+    """
+    `?since=<cursor>&limit=` -> {"upserted": [...], "deleted": [ids], "cursor", "has_more"};
+    omit `since` for the initial sync and keep calling with the returned cursor
+    while `has_more`. See core/sync.py.
+    """
+    permission_classes = [IsAuthenticated]
+    fast_serializer = None
+    fields = None  # the row's own columns; joined values change without bumping updated_at
+    tombstone_model = None
+    max_limit = 500
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get_tombstones(self):
+        return Tombstone.objects.filter(model=self.tombstone_model)
+
+    def get(self, request):
+        try:
+            limit = min(max(int(request.query_params.get("limit", 100)), 1), self.max_limit)
+        except ValueError:
+            limit = 100
+        try:
+            data = sync.changes(self.get_queryset(), self.get_tombstones(), self.fast_serializer,
+                                request.query_params.get("since"), limit, self.fields)
+        except ValueError:
+            return Response({"detail": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST)
+        except sync.StaleCursor:
+            return Response({"detail": "Cursor expired; sync again without `since`."}, status=status.HTTP_410_GONE)
+        return Response(data)
+
+
+class OpportunityChangesView(ChangeFeedView):
+    fast_serializer = OpportunityCreateListView.fast_serializer
+    fields = [
+        "id", "organization", "title", "description", "required_skills", "location_text", "latitude", "longitude",
+        "start_date", "end_date", "created_at", "capacity", "remaining_slots",
+    ]
+    tombstone_model = "opportunity"
+
+    def get_queryset(self):
+        # Archiving writes a tombstone, so archived opportunities read as deleted here.
+        return Opportunity.objects.filter(archived_at__isnull=True)
+
+
+class MyApplicationChangesView(ChangeFeedView):
+    permission_classes = [IsAuthenticated, IsVolunteer]
+    fast_serializer = MyApplicationsView.fast_serializer
+    fields = ["id", "opportunity", "status", "applied_at", "updated_at"]
+    tombstone_model = "application"
+
+    def get_queryset(self):
+        return Application.objects.filter(volunteer=self.request.user.volunteer_profile)
+
+    def get_tombstones(self):
+        return super().get_tombstones().filter(owner_id=self.request.user.volunteer_profile.pk)
+
+
+# Autocomplete
+
+class AutocompleteView(APIView):
+    """`?q=<prefix>&limit=` -> [{"value", "count"}], most used first; served from core.autocomplete."""
+    permission_classes = [IsAuthenticated]
+    index = None
+    max_limit = autocomplete.MAX_RESULTS
+
+    def get(self, request):
+        try:
+            limit = min(max(int(request.query_params.get("limit", 10)), 1), self.max_limit)
+        except ValueError:
+            limit = 10
+        autocomplete.ensure_fresh()
+        return Response(getattr(autocomplete, self.index).search(request.query_params.get("q", ""), limit))
+
+
+class SkillAutocompleteView(AutocompleteView):
+    index = "skills"
+
+
+class LocationAutocompleteView(AutocompleteView):
+    index = "locations"
+
+
+# Request profiles (staff only; recorded by ProfilingMiddleware)
+
+class ProfileListView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request):
+        return Response(profiling.list_records())
+
+
+class ProfileDetailView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request, profile_id: str):
+        record = profiling.load(profile_id)
+        if record is None:
+            return Response({"detail": "Profile not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(record)
+
+
+# Batch (several API calls in one round trip)
+
+class BatchView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = BatchSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        responses = execute_batch(request, serializer.validated_data["requests"], serializer.validated_data["parallel"])
+        return Response({"responses": responses})
+
+
+# Bulk import (organizations; CSV or JSON lines, streamed)
+
+class BulkImportView(APIView):
+    """
+    POST a CSV (text/csv, header row first) or JSON lines (application/x-ndjson)
+    body. The body is read line by line as it is imported; the response lists
+    per-row errors. Hashing and geocoding run inside the request, so it takes
+    at most IMPORT_MAX_ROWS rows; larger files go through `manage.py bulk_import`.
+    """
+    permission_classes = [IsAuthenticated, IsOrganization]
+    content_types = {"text/csv": "csv", "application/x-ndjson": "jsonl", "application/jsonl": "jsonl"}
+
+    def run_import(self, request, rows):
+        raise NotImplementedError
+
+    def post(self, request):
+        fmt = self.content_types.get(request.content_type)
+        if fmt is None:
+            return Response(
+                {"detail": f"Send the rows as one of: {', '.join(self.content_types)}."},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+        lines = bulk_import.decode_lines(request.stream or ())
+        try:
+            result = self.run_import(request, bulk_import.read_rows(lines, fmt))
+        except UnicodeDecodeError:
+            return Response({"detail": "The body is not valid UTF-8."}, status=status.HTTP_400_BAD_REQUEST)
+        code = status.HTTP_201_CREATED if result.created or not result.errors else status.HTTP_400_BAD_REQUEST
+        return Response(result.as_dict(), status=code)
+
+
+class ImportVolunteersView(BulkImportView):
+    def run_import(self, request, rows):
+        return bulk_import.import_volunteers(rows, max_rows=settings.IMPORT_MAX_ROWS)
+
+
+class ImportOpportunitiesView(BulkImportView):
+    def run_import(self, request, rows):
+        return bulk_import.import_opportunities(request.user.org_profile, rows, max_rows=settings.IMPORT_MAX_ROWS)
+
+
+# API schema
+
+@cache
+def _read_schema(path: Path):
+    # A missing file raises, which @cache does not remember: a schema generated later is picked up.
+    content = path.read_bytes()
+    return content, f'"{hashlib.md5(content).hexdigest()}"'
+
+
+def load_prebuilt_schema(path: Path):
+    """(content, etag) of a schema file generated at build time, or None if it doesn't exist."""
+    try:
+        return _read_schema(path)
+    except FileNotFoundError:
+        return None
+
+
+class PrebuiltSchemaView(SpectacularAPIView):
+    """
+    Serves the schema build.sh generates into OPENAPI_SCHEMA_DIR, with ETag and
+    Cache-Control, instead of introspecting every serializer per request. Falls
+    back to live generation when the file is missing (e.g. local development).
+    """
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        prebuilt = load_prebuilt_schema(Path(settings.OPENAPI_SCHEMA_DIR) / f"openapi.{request.accepted_renderer.format}")
+        if prebuilt is None:
+            return super().get(request, *args, **kwargs)
+        content, etag = prebuilt
+        # CompressionMiddleware weakens ETags, so compare opaque tags only.
+        if etag in {tag.removeprefix("W/") for tag in parse_etags(request.headers.get("If-None-Match", ""))}:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=request.accepted_media_type)
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=settings.OPENAPI_SCHEMA_CACHE_SECONDS)
+        return response